@@ -1,5 +1,7 @@
 from .rsocket_client import RSocketClient
+from .load_balanced_client import LoadBalancedClient, BalancedMember
+from .sharded_client import ShardedClient
 from .messages import RMessageClient
-from .transport import TcpTransport, WebsocketTransport
+from .transport import TcpTransport, UnixTransport, WebsocketTransport
 from .rsocket_client_factory import RSocketClientFactory
 from .common import RSocketConfig
\ No newline at end of file
@@ -0,0 +1,5 @@
+from .abstract_transport import AsyncTransport
+from .tcp_transport import AsyncTcpTransport
+from .websocket_transport import AsyncWebsocketTransport
+from .connection import AsyncConnection, StreamCredit
+from .client import AsyncRSocketClient, ApplicationError
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+import typing
+from ..frames import Frame_ABC, FrameParser
+
+
+class AsyncTransport(ABC):
+    """
+        Transport of the asyncio client. All methods must be called from the event loop of the connection.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._parser = FrameParser()
+
+    def enable_zero_copy(self):
+        self._parser = FrameParser(zero_copy=True)
+
+    @abstractmethod
+    async def connect(self):
+        pass
+
+    @abstractmethod
+    async def disconnect(self):
+        pass
+
+    @abstractmethod
+    async def send_frames(self, frames: typing.List[Frame_ABC]):
+        """
+            Writes the frames in order. Returns once the transport accepts more data.
+        """
+        pass
+
+    @abstractmethod
+    async def _recv_bytes(self) -> bytes:
+        pass
+
+    async def recv_frame(self) -> Frame_ABC:
+        return self._parser.parseFrame(await self._recv_bytes())
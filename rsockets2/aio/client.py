@@ -0,0 +1,383 @@
+from .abstract_transport import AsyncTransport
+from .connection import AsyncConnection, StreamCredit
+from ..common import RSocketConfig
+from ..connection import RttStats
+from ..frames import (Frame_ABC, Payload, ErrorFrame, ApplicationError, CancelFrame, RequestNFrame, RequestResponse,
+                      RequestStream, RequestChannel, RequestFNF, MetadataPushFrame)
+import asyncio
+import inspect
+import logging
+import typing
+
+
+def _encode(value):
+    if isinstance(value, str):
+        return value.encode('UTF-8')
+    return value
+
+
+def _payload(stream_id: int, value, complete: bool = False) -> Payload:
+    payload = Payload()
+    payload.stream_id = stream_id
+    payload.complete = complete
+    if value == None:
+        payload.payload = bytes(0)
+        payload.meta_data = bytes(0)
+        return payload
+    if isinstance(value, tuple):
+        payload.meta_data = _encode(value[0])
+        payload.payload = _encode(value[1])
+    else:
+        payload.meta_data = bytes(0)
+        payload.payload = _encode(value)
+    payload.next_present = True
+    return payload
+
+
+async def _no_items():
+    return
+    yield
+
+
+class AsyncRSocketClient(object):
+    """
+        RSocket client for asyncio. Everything runs on the event loop that calls open(), the connection
+        does not start any threads. Resumption and leases are not supported.
+
+        request_response returns the data of the response, request_stream and request_channel are async iterators
+        over the data of the responses. Values sent may be bytes, str or a (meta_data, data) tuple.
+
+        Responder callbacks:
+            on_request_response(frame) -> awaitable of the response (None completes without data)
+            on_request_stream(frame) -> async iterable of the responses
+            on_request_channel(frame, inbound) -> async iterable of the responses, inbound iterates the requester's data
+            on_fire_and_forget(frame) and on_metadata_push(frame) may return an awaitable
+    """
+
+    def __init__(self, config: RSocketConfig, transport: AsyncTransport):
+        super().__init__()
+        if config.resume_support == True or config.honors_lease == True:
+            raise ValueError(
+                "The asyncio client supports neither resumption nor leases")
+
+        self._log = logging.getLogger("rsockets2.aio.AsyncRSocketClient")
+        self._config = config
+        self._connection = AsyncConnection(transport, config)
+        self._connection.on_frame = self._on_frame
+        self._responder_tasks: typing.Set[asyncio.Task] = set()
+
+        self.on_request_response: typing.Callable[[
+            RequestResponse], typing.Awaitable] = None
+        self.on_request_stream: typing.Callable[[
+            RequestStream], typing.AsyncIterable] = None
+        self.on_request_channel: typing.Callable[[
+            RequestChannel, typing.AsyncIterator], typing.AsyncIterable] = None
+        self.on_fire_and_forget: typing.Callable[[RequestFNF], None] = None
+        self.on_metadata_push: typing.Callable[[
+            MetadataPushFrame], None] = None
+
+    async def open(self):
+        await self._connection.open()
+
+    async def close(self):
+        for task in list(self._responder_tasks):
+            task.cancel()
+        await self._connection.close()
+
+    async def request_response(self, meta_data, data) -> bytes:
+        self._check_running()
+        connection = self._connection
+        request = RequestResponse()
+        request.stream_id = connection.get_new_stream_id()
+        request.meta_data = _encode(meta_data)
+        request.request_data = _encode(data)
+
+        response = asyncio.get_running_loop().create_future()
+
+        def on_frame(frame: Frame_ABC):
+            if response.done() == True:
+                return
+            if isinstance(frame, ErrorFrame):
+                response.set_exception(frame.to_exception())
+            elif isinstance(frame, Payload):
+                response.set_result(
+                    frame.payload if frame.next_present else None)
+
+        connection.register_stream(request.stream_id, on_frame)
+        try:
+            connection.queue_frame(request)
+            return await response
+        finally:
+            connection.unregister_stream(request.stream_id)
+            if response.done() == False and connection.running == True:
+                connection.cancel_stream(request.stream_id)
+            connection.free_stream_id(request.stream_id)
+
+    def request_stream(self, meta_data, data, window: int = None) -> typing.AsyncIterator:
+        """
+            The server may send up to window (default: config.stream_window) items that have not been
+            consumed yet. Leaving the iteration early cancels the stream.
+        """
+        if window == None:
+            window = self._config.stream_window
+        request = RequestStream()
+        request.initial_request = window
+        request.meta_data = _encode(meta_data)
+        request.request_data = _encode(data)
+        return self._request(request, window)
+
+    def request_channel(self, meta_data, data, outbound: typing.AsyncIterable = None, window: int = None) -> typing.AsyncIterator:
+        """
+            meta_data and data are the first payload, the items of outbound follow as far as the server requests them.
+            The iteration ends once both directions completed.
+        """
+        if window == None:
+            window = self._config.stream_window
+        request = RequestChannel()
+        request.initial_request = window
+        request.complete = outbound == None
+        request.meta_data = _encode(meta_data)
+        request.request_data = _encode(data)
+        return self._request(request, window, outbound)
+
+    async def fire_and_forget(self, meta_data, data):
+        self._check_running()
+        frame = RequestFNF()
+        frame.stream_id = self._connection.get_new_stream_id()
+        frame.meta_data = _encode(meta_data)
+        frame.request_data = _encode(data)
+        self._connection.queue_frame(frame)
+        self._connection.free_stream_id(frame.stream_id)
+
+    async def metadata_push(self, meta_data):
+        self._check_running()
+        frame = MetadataPushFrame()
+        frame.meta_data = _encode(meta_data)
+        self._connection.queue_frame(frame)
+
+    @property
+    def rtt_stats(self) -> RttStats:
+        return self._connection.rtt_stats
+
+    def _check_running(self):
+        if self._connection.running == False:
+            raise ConnectionError("Connection is not open")
+
+    async def _request(self, request: Frame_ABC, window: int, outbound: typing.AsyncIterable = None):
+        self._check_running()
+        connection = self._connection
+        request.stream_id = connection.get_new_stream_id()
+        stream_id = request.stream_id
+        inbound = asyncio.Queue()
+        credit = StreamCredit()
+        sender: asyncio.Task = None
+
+        def on_frame(frame: Frame_ABC):
+            if isinstance(frame, RequestNFrame):
+                credit.add(frame.n)
+            elif isinstance(frame, CancelFrame):
+                if sender != None:
+                    sender.cancel()
+            else:
+                inbound.put_nowait(frame)
+
+        def on_sender_done(task: asyncio.Task):
+            if task.cancelled() == False and task.exception() != None:
+                inbound.put_nowait(task.exception())
+
+        connection.register_stream(stream_id, on_frame)
+        receiver = self._receive(stream_id, inbound, window)
+        inbound_completed = False
+        try:
+            connection.queue_frame(request)
+            if outbound != None:
+                sender = asyncio.ensure_future(
+                    self._send_stream(stream_id, outbound, credit))
+                sender.add_done_callback(on_sender_done)
+            async for value in receiver:
+                yield value
+            inbound_completed = True
+            if sender != None:
+                await sender
+        finally:
+            await receiver.aclose()
+            if sender != None and sender.done() == False:
+                sender.cancel()
+                if inbound_completed == True and connection.running == True:
+                    connection.queue_frame(_payload(stream_id, None, True))
+            connection.unregister_stream(stream_id)
+            connection.free_stream_id(stream_id)
+
+    async def _receive(self, stream_id: int, inbound: asyncio.Queue, window: int, request_window: bool = False):
+        """
+            Yields the data of the Payloads put into inbound and replenishes the window as it is consumed.
+            Leaving the iteration before the stream terminated cancels it.
+        """
+        connection = self._connection
+        threshold = min(
+            window, max(1, int(window * self._config.stream_replenish_fraction)))
+        consumed = 0
+        terminated = False
+        try:
+            if request_window == True:
+                connection.request_n(stream_id, window)
+            while True:
+                frame = await inbound.get()
+                if isinstance(frame, Exception):
+                    terminated = True
+                    raise frame
+                if isinstance(frame, ErrorFrame):
+                    terminated = True
+                    raise frame.to_exception()
+                if frame.next_present == True:
+                    yield frame.payload
+                    consumed += 1
+                    if consumed >= threshold:
+                        connection.request_n(stream_id, consumed)
+                        consumed = 0
+                if frame.complete == True:
+                    terminated = True
+                    return
+        finally:
+            if terminated == False and connection.running == True:
+                connection.cancel_stream(stream_id)
+
+    async def _send_stream(self, stream_id: int, source: typing.AsyncIterable, credit: StreamCredit):
+        """
+            Sends the items of source as Payloads as far as the peer requested them and completes the stream.
+            A failing source fails the stream.
+        """
+        iterator = source.__aiter__()
+        try:
+            while True:
+                await credit.take()
+                try:
+                    value = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                self._connection.queue_frame(_payload(stream_id, value))
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self._connection.queue_frame(
+                ErrorFrame.from_info(str(error), stream_id))
+            raise
+        finally:
+            if hasattr(iterator, "aclose"):
+                await iterator.aclose()
+        self._connection.queue_frame(_payload(stream_id, None, True))
+
+    def _on_frame(self, frame: Frame_ABC):
+        if isinstance(frame, RequestResponse):
+            self._serve_response(frame)
+        elif isinstance(frame, (RequestStream, RequestChannel)):
+            self._serve_stream(frame)
+        elif isinstance(frame, RequestFNF):
+            self._call_handler(self.on_fire_and_forget, frame)
+        elif isinstance(frame, MetadataPushFrame):
+            self._call_handler(self.on_metadata_push, frame)
+        elif isinstance(frame, ErrorFrame):
+            self._log.error("Received Error Frame. Error Code: {}. Error Data: {}".format(
+                frame.error_code, frame.error_data))
+
+    def _call_handler(self, handler, frame: Frame_ABC):
+        if handler == None:
+            self._log.debug(
+                "Received {} but no handler registered!".format(type(frame).__name__))
+            return
+        try:
+            result = handler(frame)
+            if inspect.isawaitable(result):
+                self._spawn(result)
+        except Exception:
+            self._log.debug("Error while executing {} handler".format(
+                type(frame).__name__), exc_info=True)
+
+    def _spawn(self, awaitable) -> asyncio.Task:
+        task = asyncio.ensure_future(awaitable)
+        self._responder_tasks.add(task)
+        task.add_done_callback(self._responder_done)
+        return task
+
+    def _responder_done(self, task: asyncio.Task):
+        self._responder_tasks.discard(task)
+        if task.cancelled() == False and task.exception() != None:
+            self._log.debug("Error while executing handler",
+                            exc_info=task.exception())
+
+    def _serve_response(self, frame: RequestResponse):
+        task: asyncio.Task = None
+
+        def on_frame(received: Frame_ABC):
+            if isinstance(received, (CancelFrame, ErrorFrame)):
+                task.cancel()
+
+        self._connection.register_stream(frame.stream_id, on_frame)
+        task = self._spawn(self._respond(frame))
+
+    async def _respond(self, frame: RequestResponse):
+        try:
+            if self.on_request_response == None:
+                raise ValueError("No Request Response Handler!")
+            value = await self.on_request_response(frame)
+            self._connection.queue_frame(
+                _payload(frame.stream_id, value, True))
+        except asyncio.CancelledError:
+            pass
+        except Exception as error:
+            self._log.debug(
+                "Error while executing request response handler", exc_info=True)
+            self._connection.queue_frame(
+                ErrorFrame.from_info(str(error), frame.stream_id))
+        finally:
+            self._connection.unregister_stream(frame.stream_id)
+
+    def _serve_stream(self, frame: typing.Union[RequestStream, RequestChannel]):
+        credit = StreamCredit(frame.initial_request)
+        inbound = asyncio.Queue()
+        task: asyncio.Task = None
+
+        def on_frame(received: Frame_ABC):
+            if isinstance(received, RequestNFrame):
+                credit.add(received.n)
+            elif isinstance(received, CancelFrame):
+                task.cancel()
+            else:
+                inbound.put_nowait(received)
+                if isinstance(received, ErrorFrame):
+                    task.cancel()
+
+        self._connection.register_stream(frame.stream_id, on_frame)
+        task = self._spawn(self._respond_stream(frame, inbound, credit))
+
+    async def _respond_stream(self, frame: typing.Union[RequestStream, RequestChannel], inbound: asyncio.Queue, credit: StreamCredit):
+        receiver = None
+        try:
+            try:
+                if isinstance(frame, RequestChannel):
+                    if self.on_request_channel == None:
+                        raise ValueError("No Request Channel Handler!")
+                    if frame.complete == True:
+                        receiver = _no_items()
+                    else:
+                        receiver = self._receive(
+                            frame.stream_id, inbound, self._config.stream_window, True)
+                    source = self.on_request_channel(frame, receiver)
+                else:
+                    if self.on_request_stream == None:
+                        raise ValueError("No Request Stream Handler!")
+                    source = self.on_request_stream(frame)
+            except Exception as error:
+                self._connection.queue_frame(
+                    ErrorFrame.from_info(str(error), frame.stream_id))
+                raise
+            await self._send_stream(frame.stream_id, source, credit)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            self._log.debug(
+                "Error while executing request stream handler", exc_info=True)
+        finally:
+            if receiver != None:
+                await receiver.aclose()
+            self._connection.unregister_stream(frame.stream_id)
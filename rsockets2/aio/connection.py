@@ -0,0 +1,242 @@
+from .abstract_transport import AsyncTransport
+from ..common import RSocketConfig
+from ..connection import StreamIdAllocator, RttStats
+from ..connection.send_queue import FragmentedStream
+from ..frames import (Frame_ABC, SetupFrame, KeepAliveFrame, ErrorFrame, ErrorCodes, CancelFrame, RequestNFrame,
+                      StreamRoutedFrames, FragmentableFrames, FragmentReassembler, ReassemblyLimitExceeded, fragment)
+from collections import deque
+import asyncio
+import logging
+import struct
+import time
+import typing
+
+
+class StreamCredit(object):
+    """
+        Outstanding REQUEST_N of one stream. take() waits until the peer requested another item.
+    """
+
+    def __init__(self, initial_request: int = 0):
+        super().__init__()
+        self._n = 0
+        self._event = asyncio.Event()
+        self.add(initial_request)
+
+    def add(self, n: int):
+        self._n = min(RequestNFrame.max_n, self._n + n)
+        if self._n > 0:
+            self._event.set()
+
+    async def take(self):
+        while self._n == 0:
+            self._event.clear()
+            await self._event.wait()
+        if self._n != RequestNFrame.max_n:
+            self._n -= 1
+
+
+class AsyncConnection(object):
+    """
+        Connection of the asyncio client. Receiving, sending and keepalive run as tasks of the event loop,
+        no threads are involved. Stream frames are passed to the handler registered for their stream id,
+        all other frames except keepalives to on_frame.
+        Like the SendQueue, frames larger than the mtu are sent as fragments interleaved with the frames of other streams.
+    """
+
+    def __init__(self, transport: AsyncTransport, config: RSocketConfig):
+        super().__init__()
+        self._log = logging.getLogger("rsockets2.aio.AsyncConnection")
+        self._transport = transport
+        self._config = config
+        if config.zero_copy_frames == True:
+            self._transport.enable_zero_copy()
+
+        self._stream_ids = StreamIdAllocator()
+        self._stream_handlers: typing.Dict[int, typing.Callable[[
+            Frame_ABC], None]] = {}
+        self._reassembler = FragmentReassembler(config.max_reassembly_bytes)
+
+        self._send_queue = deque()
+        self._fragmented_streams: typing.Dict[int, FragmentedStream] = {}
+        self._send_event: asyncio.Event = None
+        self._tasks: typing.List[asyncio.Task] = []
+        self._last_received = 0.0
+        self._running = False
+        self.rtt_stats = RttStats()
+
+        self.on_frame: typing.Callable[[Frame_ABC], None] = None
+        self.on_close: typing.Callable[[Exception], None] = None
+
+    async def open(self):
+        await self._transport.connect()
+        self._running = True
+        self._last_received = time.monotonic()
+        self._send_event = asyncio.Event()
+        self.queue_frame(SetupFrame.from_config(self._config))
+        self._tasks = [
+            asyncio.ensure_future(self._send_loop()),
+            asyncio.ensure_future(self._recv_loop()),
+            asyncio.ensure_future(self._keepalive_loop())
+        ]
+
+    async def close(self):
+        await self._close(None)
+
+    async def _close(self, error: Exception):
+        if self._running == False:
+            return
+        self._running = False
+        current = asyncio.current_task()
+        for task in self._tasks:
+            if task is not current:
+                task.cancel()
+        handlers = list(self._stream_handlers.items())
+        self._stream_handlers.clear()
+        message = "Connection closed" if error == None else "Connection lost. {}".format(
+            error)
+        for stream_id, handler in handlers:
+            handler(ErrorFrame.from_info(
+                message, stream_id, ErrorCodes.CONNECTION_CLOSE))
+        try:
+            await self._transport.disconnect()
+        except Exception:
+            self._log.debug("Error while disconnecting", exc_info=True)
+        if self.on_close != None:
+            self.on_close(error)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def queue_frame(self, frame: Frame_ABC):
+        stream = self._fragmented_streams.get(frame.stream_id)
+        if stream is not None and frame.stream_id != 0:
+            # Keep the order of the stream behind the pending fragments
+            stream.extend(fragment(frame, self._config.mtu))
+        elif len(frame) > self._config.mtu and isinstance(frame, FragmentableFrames):
+            stream = FragmentedStream(fragment(frame, self._config.mtu))
+            self._fragmented_streams[frame.stream_id] = stream
+            self._send_queue.append(stream)
+        else:
+            self._send_queue.append(frame)
+        self._send_event.set()
+
+    def _take_frame(self) -> Frame_ABC:
+        entry = self._send_queue.popleft()
+        if not isinstance(entry, FragmentedStream):
+            return entry
+        frame = entry.popleft()
+        if len(entry) == 0:
+            del self._fragmented_streams[frame.stream_id]
+        else:
+            # One fragment per turn, the other streams go first
+            self._send_queue.append(entry)
+        return frame
+
+    def cancel_stream(self, stream_id: int):
+        cancel = CancelFrame()
+        cancel.stream_id = stream_id
+        self.queue_frame(cancel)
+
+    def request_n(self, stream_id: int, n: int):
+        frame = RequestNFrame()
+        frame.stream_id = stream_id
+        frame.n = n
+        self.queue_frame(frame)
+
+    def register_stream(self, stream_id: int, handler: typing.Callable[[Frame_ABC], None]):
+        self._stream_handlers[stream_id] = handler
+
+    def unregister_stream(self, stream_id: int):
+        self._stream_handlers.pop(stream_id, None)
+
+    def get_new_stream_id(self) -> int:
+        return self._stream_ids.allocate()
+
+    def free_stream_id(self, stream_id: int):
+        self._stream_ids.free(stream_id)
+
+    async def _send_loop(self):
+        try:
+            while True:
+                await self._send_event.wait()
+                self._send_event.clear()
+                while len(self._send_queue) > 0:
+                    count = min(len(self._send_queue),
+                                self._config.send_batch_max_frames)
+                    batch = [self._take_frame() for _ in range(count)]
+                    await self._transport.send_frames(batch)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self._log.debug(
+                "Error in send_loop: {}".format(error), exc_info=True)
+            await self._close(error)
+
+    async def _recv_loop(self):
+        try:
+            while True:
+                frame = await self._transport.recv_frame()
+                self._last_received = time.monotonic()
+                frame = self._reassemble(frame)
+                if frame != None:
+                    self._dispatch(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self._log.debug(
+                "Error in recv_loop: {}".format(error), exc_info=True)
+            await self._close(error)
+
+    async def _keepalive_loop(self):
+        try:
+            while True:
+                frame = KeepAliveFrame()
+                frame.respond_flag = True
+                frame.data = struct.pack(">Q", time.monotonic_ns())
+                self.queue_frame(frame)
+                await asyncio.sleep(self._config.keepalive_time / 1000.0 * 0.45)
+                if time.monotonic() - self._last_received > self._config.max_liftime / 1000.0:
+                    raise TimeoutError(
+                        "No frame received within {} ms".format(self._config.max_liftime))
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self._log.debug(
+                "Error in keepalive_loop: {}".format(error), exc_info=True)
+            await self._close(error)
+
+    def _reassemble(self, frame: Frame_ABC) -> typing.Optional[Frame_ABC]:
+        try:
+            return self._reassembler.push(frame)
+        except ReassemblyLimitExceeded as error:
+            self._log.warning(str(error))
+            if error.stream_id % 2 == 1:
+                self.cancel_stream(error.stream_id)
+            else:
+                self.queue_frame(ErrorFrame.from_info(
+                    str(error), error.stream_id, ErrorCodes.REJECTED))
+            self._dispatch(ErrorFrame.from_info(
+                str(error), error.stream_id, ErrorCodes.REJECTED))
+            return None
+
+    def _dispatch(self, frame: Frame_ABC):
+        if frame.stream_id != 0 and isinstance(frame, StreamRoutedFrames):
+            handler = self._stream_handlers.get(frame.stream_id)
+            if handler != None:
+                handler(frame)
+            return
+        if isinstance(frame, KeepAliveFrame):
+            if frame.respond_flag == True:
+                answer = KeepAliveFrame()
+                answer.data = frame.data
+                self.queue_frame(answer)
+            elif len(frame.data) == 8:
+                sent, = struct.unpack_from(">Q", frame.data)
+                rtt = time.monotonic_ns() - sent
+                if rtt >= 0:
+                    self.rtt_stats.record(rtt / 1_000_000)
+            return
+        if self.on_frame != None:
+            self.on_frame(frame)
@@ -0,0 +1,57 @@
+from .abstract_transport import AsyncTransport
+import asyncio
+import logging
+import socket
+
+
+class AsyncTcpTransport(AsyncTransport):
+
+    def __init__(self, host: str, port: int):
+        super().__init__()
+
+        self._log = logging.getLogger("rsockets2.aio.AsyncTcpTransport")
+
+        self._host = host
+        self._port = port
+        self._reader: asyncio.StreamReader = None
+        self._writer: asyncio.StreamWriter = None
+
+    async def connect(self):
+        self._log.debug("Connecting to {}:{}".format(self._host, self._port))
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port), 10.0)
+        except (OSError, asyncio.TimeoutError) as error:
+            raise ConnectionError(error)
+        sock = self._writer.get_extra_info("socket")
+        if sock != None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    async def disconnect(self):
+        self._log.debug("Disconnecting socket at: {}:{}".format(
+            self._host, self._port))
+        if self._writer == None:
+            raise ValueError(
+                "Tried to disconnect a socket that was never created!")
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except OSError:
+            pass
+
+    async def send_frames(self, frames):
+        buffers = []
+        for frame in frames:
+            frame_buffers = frame.to_buffers()
+            length = sum(len(buffer) for buffer in frame_buffers)
+            buffers.append(length.to_bytes(3, "big"))
+            buffers.extend(frame_buffers)
+        self._writer.writelines(buffers)
+        await self._writer.drain()
+
+    async def _recv_bytes(self) -> bytes:
+        try:
+            header = await self._reader.readexactly(3)
+            return await self._reader.readexactly(int.from_bytes(header, "big"))
+        except asyncio.IncompleteReadError as error:
+            raise ConnectionError("Connection closed by peer") from error
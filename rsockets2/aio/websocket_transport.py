@@ -0,0 +1,52 @@
+from .abstract_transport import AsyncTransport
+import logging
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+
+class AsyncWebsocketTransport(AsyncTransport):
+    """
+        Requires the 'websockets' package (pip install rsockets2[aio-websocket]). Every RSocket frame is one binary message.
+    """
+
+    def __init__(self, url: str):
+        super().__init__()
+        self._log = logging.getLogger(
+            "rsockets2.aio.AsyncWebsocketTransport")
+        self._url = url
+        self._ws = None
+
+    async def connect(self):
+        if websockets == None:
+            raise ImportError(
+                "AsyncWebsocketTransport requires the 'websockets' package. Install it with: pip install rsockets2[aio-websocket]")
+        self._log.debug("Trying to open Websocket at '{}'".format(self._url))
+        try:
+            self._ws = await websockets.connect(self._url)
+        except (OSError, websockets.WebSocketException) as error:
+            raise ConnectionError(error)
+
+    async def disconnect(self):
+        if self._ws == None:
+            raise ValueError(
+                "Trying to disconnect a websocket that never successfully connected!")
+        await self._ws.close()
+
+    async def send_frames(self, frames):
+        try:
+            for frame in frames:
+                await self._ws.send(b"".join(frame.to_buffers()))
+        except websockets.WebSocketException as error:
+            raise ConnectionError(error)
+
+    async def _recv_bytes(self) -> bytes:
+        try:
+            data = await self._ws.recv()
+        except websockets.WebSocketException as error:
+            raise ConnectionError(error)
+        if isinstance(data, str):
+            raise ConnectionError("Websocket error. Unexpected text message")
+        return data
@@ -1 +1,4 @@
-from .rsocket_config import RSocketConfig
\ No newline at end of file
+from .rsocket_config import RSocketConfig
+from .overflow_strategy import OverflowStrategy
+from .timer_wheel import HashedTimerWheel, WheelTimeout
+from .resume_cache_policy import ResumeCachePolicy
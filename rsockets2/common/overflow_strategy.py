@@ -0,0 +1,14 @@
+import enum
+
+
+class OverflowStrategy(enum.Enum):
+    """
+        What a responder does when a stream produces more items than the requester asked for
+        and the stream buffer is full.
+    """
+    # Fail the stream with an APPLICATION_ERROR
+    ERROR = enum.auto()
+    # Drop the oldest buffered item
+    DROP_OLDEST = enum.auto()
+    # Keep only the newest item
+    LATEST = enum.auto()
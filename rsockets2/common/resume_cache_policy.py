@@ -0,0 +1,12 @@
+import enum
+
+
+class ResumeCachePolicy(enum.Enum):
+    """
+        What a resumable connection does when its send cache reached resume_cache_max_bytes
+        of frames the peer has not confirmed yet.
+    """
+    # Requests wait until the peer confirmed enough frames, at most resume_cache_block_timeout seconds
+    BLOCK = enum.auto()
+    # Keep sending, but drop the cache. The connection is closed instead of resumed when lost
+    FAIL = enum.auto()
@@ -1,3 +1,5 @@
+from .overflow_strategy import OverflowStrategy
+from .resume_cache_policy import ResumeCachePolicy
 
 
 class RSocketConfig(object):
@@ -11,3 +13,45 @@ class RSocketConfig(object):
         self.data_mime_type = b"application/json"
         self.resume_support = False
         self.honors_lease = False
+        # Send batching. Up to send_batch_max_frames frames or send_batch_max_bytes bytes are
+        # written with one transport call. send_batch_linger_us > 0 waits that long for a batch to fill.
+        self.send_batch_max_frames = 64
+        self.send_batch_max_bytes = 1024 * 1024
+        self.send_batch_linger_us = 0
+        # Received meta data and data are read only memoryviews over the receive buffer instead of bytes
+        self.zero_copy_frames = False
+        # Frames larger than mtu bytes are split into FOLLOWS fragments. Fragments of different streams interleave
+        self.mtu = 0xFFFFFF
+        # Upper bound for the bytes buffered while reassembling fragments of all streams of a connection
+        self.max_reassembly_bytes = 64 * 1024 * 1024
+        # Request stream flow control. request_stream asks for stream_window items up front and sends a
+        # REQUEST_N once stream_replenish_fraction of the window has been consumed by the subscriber.
+        # At most stream_window received items wait for a slow subscriber
+        self.stream_window = 256
+        self.stream_replenish_fraction = 0.5
+        # Items a responder stream buffers while the requester has no outstanding demand
+        self.stream_buffer_limit = 8192
+        self.stream_overflow_strategy = OverflowStrategy.ERROR
+        # Leases (honors_lease). Requests without a lease wait up to lease_wait_timeout seconds for one, 0 rejects them.
+        # Until the peer sent its first lease they wait up to lease_first_wait_timeout seconds
+        self.lease_wait_timeout = 0
+        self.lease_first_wait_timeout = 5.0
+        # Leases granted to the peer every lease_time_to_live ms. lease_strategy(ResponderLoad) -> LeaseFrame decides on them,
+        # by default up to lease_max_requests, less while requests are in progress or the send queue fills up to lease_max_send_queue_depth
+        self.lease_time_to_live = 5000
+        self.lease_max_requests = 1000
+        self.lease_max_send_queue_depth = 10000
+        self.lease_strategy = None
+        # Resume (resume_support). Sent frames are cached until the peer confirmed them, up to resume_cache_max_bytes.
+        # resume_cache_policy decides what happens when the cache is full
+        self.resume_cache_max_bytes = 64 * 1024 * 1024
+        self.resume_cache_policy = ResumeCachePolicy.BLOCK
+        self.resume_cache_block_timeout = 30.0
+        # With a resume_spill_directory only the newest resume_cache_memory_bytes of the cache are kept in memory,
+        # older frames go to memory mapped segment files of resume_spill_segment_bytes in that directory
+        self.resume_spill_directory = None
+        self.resume_cache_memory_bytes = 8 * 1024 * 1024
+        self.resume_spill_segment_bytes = 64 * 1024 * 1024
+        # ReconnectStrategy (rsockets2.connection) deciding the delays between resume attempts,
+        # None uses an ExponentialBackoffStrategy
+        self.reconnect_strategy = None
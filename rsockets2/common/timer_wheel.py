@@ -0,0 +1,108 @@
+import logging
+import math
+import threading
+import time
+import typing
+
+
+class WheelTimeout(object):
+
+    __slots__ = ('deadline_tick', 'callback', 'cancelled', '_wheel')
+
+    def __init__(self, wheel: 'HashedTimerWheel', deadline_tick: int, callback: typing.Callable[[], None]):
+        self.deadline_tick = deadline_tick
+        self.callback = callback
+        self.cancelled = False
+        self._wheel = wheel
+
+    def cancel(self):
+        self.cancelled = True
+        self._wheel._remove(self)
+
+
+class HashedTimerWheel(object):
+    """
+        Timeouts are hashed by their deadline tick into wheel_size buckets. A single thread advances
+        the wheel every tick and fires all timeouts of the current bucket that are due, so scheduling and
+        cancelling are O(1) and memory grows with the number of timeouts only.
+        Timeouts fire up to one tick late. Callbacks run on the wheel thread and must not block.
+        shared() returns the process wide wheel.
+    """
+
+    _shared: 'HashedTimerWheel' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, tick: float = 0.1, wheel_size: int = 512):
+        super().__init__()
+        self._log = logging.getLogger("rsockets2.common.HashedTimerWheel")
+        self._tick = tick
+        self._buckets: typing.List[typing.Set[WheelTimeout]] = [
+            set() for _ in range(wheel_size)]
+        self._start_time = time.monotonic()
+        self._current_tick = 0
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._thread: threading.Thread = None
+
+    @classmethod
+    def shared(cls) -> 'HashedTimerWheel':
+        with cls._shared_lock:
+            if cls._shared == None:
+                cls._shared = HashedTimerWheel()
+            return cls._shared
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def schedule(self, delay: float, callback: typing.Callable[[], None]) -> WheelTimeout:
+        with self._condition:
+            now_tick = (time.monotonic() - self._start_time) / self._tick
+            if self._pending == 0:
+                # Skip the idle ticks instead of catching up on them
+                self._current_tick = max(self._current_tick, int(now_tick))
+            deadline_tick = max(self._current_tick,
+                                math.ceil(now_tick + delay / self._tick) - 1)
+            timeout = WheelTimeout(self, deadline_tick, callback)
+            self._buckets[deadline_tick % len(self._buckets)].add(timeout)
+            self._pending += 1
+            if self._thread == None:
+                self._thread = threading.Thread(
+                    name="RSocket-Timer-Wheel", daemon=True, target=self._run)
+                self._thread.start()
+            self._condition.notify()
+        return timeout
+
+    def _remove(self, timeout: WheelTimeout):
+        with self._condition:
+            bucket = self._buckets[timeout.deadline_tick % len(self._buckets)]
+            if timeout in bucket:
+                bucket.remove(timeout)
+                self._pending -= 1
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending == 0:
+                    self._condition.wait()
+                tick = self._current_tick
+            delay = self._start_time + (tick + 1) * \
+                self._tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            with self._condition:
+                if tick != self._current_tick:
+                    continue
+                bucket = self._buckets[tick % len(self._buckets)]
+                expired = [
+                    timeout for timeout in bucket if timeout.deadline_tick <= tick]
+                bucket.difference_update(expired)
+                self._pending -= len(expired)
+                self._current_tick = tick + 1
+            for timeout in expired:
+                if timeout.cancelled == True:
+                    continue
+                try:
+                    timeout.callback()
+                except Exception:
+                    self._log.error("Error in timer callback", exc_info=True)
@@ -1,3 +1,11 @@
 from .abstract_connection import AbstractConnection
 from .client_connection import ClientConnection
-from .resumable_client_connection import ResumableClientConnection
\ No newline at end of file
+from .resumable_client_connection import ResumableClientConnection
+from .reactor_client_connection import ReactorClientConnection
+from .stream_id_allocator import StreamIdAllocator
+from .lease import LeaseExhausted, RequesterLease, ResponderLease, ResponderLoad, load_based_lease_strategy
+from .keepalive_support import KeepaliveSupport, RttStats
+from .send_queue import SendBatchStats
+from .resume_cache import ResumeSendCache, ResumeCacheFull
+from .spilling_resume_cache import SpillingResumeSendCache
+from .resume_strategy import ReconnectStrategy, ReconnectSession, ReconnectMetrics, ReconnectAttempt, FixedDelayStrategy, ExponentialBackoffStrategy
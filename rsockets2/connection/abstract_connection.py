@@ -1,26 +1,46 @@
 from abc import ABC, abstractmethod
+import logging
 import threading
+import typing
 import rx
 import rx.operators as op
+from rx.disposable import Disposable
 from rx.subject.subject import Subject
-from ..frames import Frame_ABC
+from ..frames import (Frame_ABC, StreamRoutedFrames, ErrorFrame, ErrorCodes, CancelFrame, FragmentReassembler, ReassemblyLimitExceeded,
+                      RequestResponse, RequestStream, RequestChannel)
+from .stream_id_allocator import StreamIdAllocator
 
 
 class AbstractConnection(ABC):
 
     _expected_exceptions = (ConnectionError, OSError)
+    # Requests of the peer that open a stream the responder listens on
+    _inbound_stream_frames = (RequestResponse, RequestStream, RequestChannel)
 
     def __init__(self):
         super().__init__()
 
+        # Subclasses may replace it with their own logger
+        self._log = logging.getLogger(
+            "rsockets2.connection.AbstractConnection")
+
         self._send_position = 0
         self._last_recv_position = 0
         self._recv_lock = threading.Lock()
         self._send_lock = threading.Lock()
 
-        self._last_stream_id = 0
-        self._used_stream_ids = []
-        self._stream_id_lock = threading.Lock()
+        self._stream_ids = StreamIdAllocator()
+
+        # stream_id -> tuple of observers. Tuples are replaced, never mutated,
+        # so the recv thread can dispatch without taking the lock.
+        self._stream_observers: typing.Dict[int, tuple] = {}
+        self._stream_observers_lock = threading.Lock()
+        # With hold_back_inbound_streams the frames of a stream the peer opened are kept
+        # (stream_id -> frames) until release_inbound_stream, see stream_observable
+        self.hold_back_inbound_streams = False
+        self._pending_inbound_streams: typing.Dict[int, list] = {}
+
+        self._reassembler: FragmentReassembler = None
 
         self._destroy_publisher = Subject()
 
@@ -35,13 +55,123 @@ class AbstractConnection(ABC):
         pass
 
     def destroy_observable(self):
-        self._destroy_publisher
+        return self._destroy_publisher
 
     def recv_observable_filter_type(self, frame_type):
         return self.recv_observable().pipe(
             op.filter(lambda frame: isinstance(frame, frame_type))
         )
 
+    def stream_observable(self, stream_id: int) -> rx.Observable:
+        """
+            Emits the Payload, Error, Cancel and RequestN frames of a single stream.
+            Frames are routed by stream id on the receiving thread, so the cost per frame
+            does not depend on the number of open streams.
+            Routed frames are not published on the recv_observable.
+            With hold_back_inbound_streams set, frames of a stream opened by a request of the peer are held back
+            until release_inbound_stream(stream_id) is called, which the responder must do once it subscribed.
+        """
+        def subscribe(observer, scheduler=None):
+            with self._stream_observers_lock:
+                self._stream_observers[stream_id] = self._stream_observers.get(
+                    stream_id, ()) + (observer,)
+
+            def dispose():
+                with self._stream_observers_lock:
+                    observers = tuple(
+                        o for o in self._stream_observers.get(stream_id, ()) if o is not observer)
+                    if len(observers) > 0:
+                        self._stream_observers[stream_id] = observers
+                    else:
+                        self._stream_observers.pop(stream_id, None)
+            return Disposable(dispose)
+        return rx.create(subscribe)
+
+    def stream_observable_filter_type(self, stream_id: int, frame_type):
+        return self.stream_observable(stream_id).pipe(
+            op.filter(lambda frame: isinstance(frame, frame_type))
+        )
+
+    def _route_stream_frame(self, frame: Frame_ABC) -> bool:
+        """
+            Delivers the frame to the observers of its stream.
+            With hold_back_inbound_streams, frames of a stream the peer just opened are held back until
+            release_inbound_stream, e.g. because the responder subscribes only after the request went through a scheduler.
+            Frames of streams nobody listens on anymore (e.g. late frames of a cancelled stream) are dropped.
+            Returns False if the frame is not stream routed.
+        """
+        if frame.stream_id == 0:
+            return False
+        if isinstance(frame, self._inbound_stream_frames):
+            if self.hold_back_inbound_streams == False:
+                return False
+            with self._stream_observers_lock:
+                self._pending_inbound_streams[frame.stream_id] = []
+            return False
+        if not isinstance(frame, StreamRoutedFrames):
+            return False
+        if frame.stream_id in self._pending_inbound_streams:
+            with self._stream_observers_lock:
+                pending = self._pending_inbound_streams.get(frame.stream_id)
+                if pending is not None:
+                    pending.append(frame)
+                    return True
+        self._deliver_stream_frame(frame)
+        return True
+
+    def _deliver_stream_frame(self, frame: Frame_ABC):
+        observers = self._stream_observers.get(frame.stream_id)
+        if observers is None:
+            self._log.debug("Dropping {} of inactive stream {}".format(
+                type(frame).__name__, frame.stream_id))
+            return
+        for observer in observers:
+            observer.on_next(frame)
+
+    def release_inbound_stream(self, stream_id: int):
+        """
+            Delivers the frames held back for a stream of the peer to the observers subscribed by now,
+            later frames are routed directly. Called once the responder subscribed to the stream.
+        """
+        while True:
+            with self._stream_observers_lock:
+                pending = self._pending_inbound_streams.get(stream_id)
+                if pending is None:
+                    return
+                if len(pending) == 0:
+                    del self._pending_inbound_streams[stream_id]
+                    return
+                self._pending_inbound_streams[stream_id] = []
+            # Outside the lock, frames arriving meanwhile are held back and delivered in the next round
+            for frame in pending:
+                self._deliver_stream_frame(frame)
+
+    def _reassemble(self, frame: Frame_ABC) -> typing.Optional[Frame_ABC]:
+        """
+            Returns the complete frame or None while fragments of it are still missing.
+            If the reassembly limit is exceeded the stream is cancelled (requests of this side)
+            or rejected (requests of the other side) and fails locally with an ErrorFrame.
+        """
+        if self._reassembler is None:
+            return frame
+        try:
+            return self._reassembler.push(frame)
+        except ReassemblyLimitExceeded as error:
+            self._log.warning(str(error))
+            if error.stream_id % 2 == 1:
+                self.cancel_stream(error.stream_id)
+            else:
+                self.queue_frame(ErrorFrame.from_info(
+                    str(error), error.stream_id, ErrorCodes.REJECTED))
+            self._route_stream_frame(ErrorFrame.from_info(
+                str(error), error.stream_id, ErrorCodes.REJECTED))
+            return None
+
+    def cancel_stream(self, stream_id: int):
+        cancel = CancelFrame()
+        cancel.stream_id = stream_id
+        self.queue_frame(cancel)
+
     @property
     def last_received_position(self):
         with self._recv_lock:
@@ -63,22 +193,7 @@ class AbstractConnection(ABC):
             return self._send_position
 
     def get_new_stream_id(self) -> int:
-        self._stream_id_lock.acquire(blocking=True)
-        while True:
-            if self._last_stream_id >= 2_147_483_647:
-                self._last_stream_id = 0
-            if self._last_stream_id == 0:
-                stream_id = 1
-                self._last_stream_id = 1
-            else:
-                self._last_stream_id += 2
-                stream_id = self._last_stream_id
-            if stream_id not in self._used_stream_ids:
-                self._used_stream_ids.append(stream_id)
-                break
-        self._stream_id_lock.release()
-
-        return stream_id
+        return self._stream_ids.allocate()
 
     def free_stream_id(self, stream_id: int):
-        self._used_stream_ids.remove(stream_id)
+        self._stream_ids.free(stream_id)
@@ -1,25 +1,15 @@
 from .abstract_connection import AbstractConnection
 from ..transport import AbstractTransport
-from ..frames import SetupFrame, Frame_ABC, ErrorFrame, ErrorCodes
+from ..frames import SetupFrame, FragmentReassembler, Frame_ABC, ErrorFrame, ErrorCodes
 from ..common import RSocketConfig
-from .keepalive_support import KeepaliveSupport
+from .keepalive_support import KeepaliveSupport, RttStats
 import threading
 import rx
 import rx.subject
-from queue import PriorityQueue
+from .send_queue import SendQueue
 import logging
 
 
-class PriorityEntry(object):
-
-    def __init__(self, priority, data):
-        self.data = data
-        self.priority = priority
-
-    def __lt__(self, other):
-        return self.priority < other.priority
-
-
 class ClientConnection(AbstractConnection):
 
     def __init__(self, transport: AbstractTransport, config: RSocketConfig):
@@ -27,7 +17,10 @@ class ClientConnection(AbstractConnection):
         self._log = logging.getLogger("rsockets2.connection.ClientConnection")
         self._transport = transport
         self._config = config
-        self._keepalive_support: KeepaliveSupport = None
+        if config.zero_copy_frames == True:
+            self._transport.enable_zero_copy()
+        self._keepalive_support = KeepaliveSupport(
+            self, config, self._keepalive_timeout)
 
         self._send_thread = threading.Thread(
             name="RSocket-Client-Send-Thread", daemon=True, target=self._send_loop)
@@ -36,7 +29,11 @@ class ClientConnection(AbstractConnection):
 
         self._running = False
 
-        self._send_queue = PriorityQueue()
+        self._send_queue = SendQueue(config.send_batch_max_frames,
+                                     config.send_batch_max_bytes,
+                                     config.send_batch_linger_us,
+                                     config.mtu)
+        self._reassembler = FragmentReassembler(config.max_reassembly_bytes)
         self._recv_subject = rx.subject.Subject()
 
     def open(self):
@@ -52,14 +49,10 @@ class ClientConnection(AbstractConnection):
 
         self._transport.send_frame(setupFrame)
 
-        self._keepalive_support = KeepaliveSupport(self, self._config)
         self._keepalive_support.start()
 
     def queue_frame(self, frame: Frame_ABC):
-        if frame.stream_id == 0:
-            self._send_queue.put(PriorityEntry(10, frame))
-        else:
-            self._send_queue.put(PriorityEntry(100, frame))
+        self._send_queue.put_frame(frame)
 
     def recv_observable(self):
         return self._recv_subject
@@ -67,21 +60,47 @@ class ClientConnection(AbstractConnection):
     def destroy_observable(self):
         return self._destroy_publisher
 
+    @property
+    def send_batch_stats(self):
+        return self._send_queue.stats
+
+    @property
+    def send_queue_depth(self) -> int:
+        return self._send_queue.qsize()
+
+    @property
+    def rtt_stats(self) -> RttStats:
+        return self._keepalive_support.rtt_stats
+
     def close(self):
+        if self._running == False:
+            return
         self._running = False
-        if self._keepalive_support != None:
-            self._keepalive_support.stop()
+        self._keepalive_support.stop()
 
-        self._destroy_publisher.on_completed()
-        self._transport.disconnect()
+        # Disconnect first, whoever reacts to the destroy_observable may reuse the transport
+        try:
+            self._transport.disconnect()
+        finally:
+            self._destroy_publisher.on_completed()
+
+    def _keepalive_timeout(self):
+        if self._running == True:
+            self._recv_subject.on_error(TimeoutError(
+                "No frame received within {} ms".format(self._config.max_liftime)))
+            self.close()
 
     def _send_loop(self):
         try:
             while self._running:
                 try:
-                    data = self._send_queue.get().data
-                    self.increase_send_position(len(data))
-                    self._transport.send_frame(data)
+                    frames = self._send_queue.get_batch()
+                    for frame in frames:
+                        self.increase_send_position(len(frame))
+                    if len(frames) == 1:
+                        self._transport.send_frame(frames[0])
+                    else:
+                        self._transport.send_frames(frames)
                 except Exception as error:
                     if self._running != False:
                         raise error
@@ -103,8 +122,11 @@ class ClientConnection(AbstractConnection):
             while self._running:
                 try:
                     frame = self._transport.recv_frame()
+                    self._keepalive_support.frame_received(frame)
                     self.increase_recv_position(len(frame))
-                    self._recv_subject.on_next(frame)
+                    frame = self._reassemble(frame)
+                    if frame != None and not self._route_stream_frame(frame):
+                        self._recv_subject.on_next(frame)
                 except Exception as error:
                     if self._running != False:
                         raise error
@@ -1,57 +1,139 @@
-import threading
 import logging
 from .abstract_connection import AbstractConnection
 from ..frames import KeepAliveFrame
-from ..common import RSocketConfig
+from ..common import RSocketConfig, HashedTimerWheel, WheelTimeout
 import rx
 import rx.operators as op
+import struct
+import threading
 import time
+import typing
 
-class KeepaliveSupport(object):
 
-    count = 0
+class RttStats(object):
+    """
+        Round trip times in milliseconds measured with keepalive frames.
+        smoothed and jitter are the RFC 6298 estimators (SRTT and RTTVAR), both None before the first sample.
+    """
 
-    def __init__(self, connection: AbstractConnection, config: RSocketConfig):
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.samples = 0
+        self.last: float = None
+        self.smoothed: float = None
+        self.jitter: float = None
+        self.min: float = None
+        self.max: float = None
+
+    def record(self, rtt: float):
+        with self._lock:
+            self.samples += 1
+            self.last = rtt
+            if self.smoothed == None:
+                self.smoothed = rtt
+                self.jitter = rtt / 2
+                self.min = rtt
+                self.max = rtt
+            else:
+                self.jitter = 0.75 * self.jitter + \
+                    0.25 * abs(self.smoothed - rtt)
+                self.smoothed = 0.875 * self.smoothed + 0.125 * rtt
+                self.min = min(self.min, rtt)
+                self.max = max(self.max, rtt)
+
+    def __repr__(self):
+        return "RttStats(samples={}, last={}, smoothed={}, jitter={}, min={}, max={})".format(
+            self.samples, self.last, self.smoothed, self.jitter, self.min, self.max)
+
+class KeepaliveSupport(object):
+    """
+        Sends a keepalive every 0.45 * keepalive_time and calls on_timeout once no frame was received
+        for max_liftime (see frame_received). Both are timeouts on a HashedTimerWheel shared by all connections
+        instead of a thread per connection.
+        Keepalives carry their monotonic send time in nanoseconds, the answers are recorded in rtt_stats.
+    """
+
+    def __init__(self, connection: AbstractConnection, config: RSocketConfig,
+                 on_timeout: typing.Callable[[], None] = None, timer_wheel: HashedTimerWheel = None):
         super().__init__()
         self._connection = connection
         self._config = config
-        self.count += 1
-        self._runner = threading.Thread(
-            name="RSocket-Keepalive-Support-{}".format(self.count), daemon=True, target=self._run)
+        self._on_timeout = on_timeout
+        if timer_wheel == None:
+            timer_wheel = HashedTimerWheel.shared()
+        self._wheel = timer_wheel
         self._running = False
+        self._last_received = time.monotonic()
+        self._send_timeout: WheelTimeout = None
+        self._liveness_timeout: WheelTimeout = None
+        self.rtt_stats = RttStats()
         self._log = logging.getLogger("rosckets2.connection.KeepaliveSupport")
 
-    def _run(self):
-        try:
-            while self._running:
-                frame = KeepAliveFrame()
-                frame.last_received_position = self._connection.last_received_position
-                frame.respond_flag = True
-                frame.data = bytes(0)
-                self._connection.queue_frame(frame)
-                time.sleep(self._config.keepalive_time / 1000.0 * 0.45)
-
-        except Exception as exception:
-            self._log.debug(
-                "Keepalive support crashed. Exception: {}".format(exception))
-
     def start(self):
         self._running = True
-        self._runner.start()
+        self._last_received = time.monotonic()
+        self._send_keepalive()
+        if self._on_timeout != None:
+            self._liveness_timeout = self._wheel.schedule(
+                self._config.max_liftime / 1000.0, self._check_liveness)
 
     def stop(self):
         self._running = False
+        if self._send_timeout != None:
+            self._send_timeout.cancel()
+        if self._liveness_timeout != None:
+            self._liveness_timeout.cancel()
+
+    def frame_received(self, frame=None):
+        self._last_received = time.monotonic()
+        if isinstance(frame, KeepAliveFrame) and frame.respond_flag == False and len(frame.data) == 8:
+            sent, = struct.unpack_from(">Q", frame.data)
+            rtt = time.monotonic_ns() - sent
+            if rtt >= 0:
+                self.rtt_stats.record(rtt / 1_000_000)
+
+    def _send_keepalive(self):
+        if self._running == False:
+            return
+        try:
+            frame = KeepAliveFrame()
+            frame.last_received_position = self._connection.last_received_position
+            frame.respond_flag = True
+            frame.data = struct.pack(">Q", time.monotonic_ns())
+            self._connection.queue_frame(frame)
+        except Exception as exception:
+            self._log.debug(
+                "Keepalive support crashed. Exception: {}".format(exception))
+            return
+        self._send_timeout = self._wheel.schedule(
+            self._config.keepalive_time / 1000.0 * 0.45, self._send_keepalive)
+
+    def _check_liveness(self):
+        if self._running == False:
+            return
+        remaining = self._last_received + \
+            self._config.max_liftime / 1000.0 - time.monotonic()
+        if remaining > 0:
+            self._liveness_timeout = self._wheel.schedule(
+                remaining, self._check_liveness)
+            return
+        self._log.debug("No frame received within {} ms".format(
+            self._config.max_liftime))
+        self.stop()
+        self._on_timeout()
 
     def keepalive_operator(self):
         """
             Must be used in a pipe that provides KeepaliveFrames!
-            Will throw timeout exception if keepalive frames are not being send or responded properly.
+            Keepalive frames count as received frames for the liveness check (see on_timeout).
             Will automatically answer keepalive messages from the other side
         """
         def handle_frame(frame: KeepAliveFrame):
             if not isinstance(frame, KeepAliveFrame):
                 raise ValueError(
                     "The keepalive operator can only handle KeepAliveFrames!!!")
+            self.frame_received(frame)
             if frame.respond_flag == True:
                 answer = KeepAliveFrame()
                 answer.last_received_position = self._connection.last_received_position
@@ -60,16 +142,15 @@ class KeepaliveSupport(object):
                 self._connection.queue_frame(answer)
 
         def handle_error():
-            self._log.debug("Stopping keepalive thread because of error!")
-            self._running = False
+            self._log.debug("Stopping keepalive support because of error!")
+            self.stop()
 
         def handle_complete():
             self._log.debug(
-                "Stopping keepalive thread because keepalive frame stream completed")
-            self._running = False
+                "Stopping keepalive support because keepalive frame stream completed")
+            self.stop()
         return rx.pipe(
             op.map(lambda frame: handle_frame(frame)),
-            op.timeout(op.timedelta(milliseconds=self._config.keepalive_time)),
             op.do_action(on_error=lambda err: handle_error(),
                          on_completed=lambda: handle_complete())
         )
@@ -0,0 +1,155 @@
+import collections
+import threading
+import time
+import typing
+import rx
+import rx.scheduler
+from rx.disposable import Disposable
+from ..frames import LeaseFrame
+
+
+class LeaseExhausted(Exception):
+    pass
+
+
+class ResponderLoad(object):
+
+    def __init__(self, send_queue_depth: int, active_requests: int):
+        super().__init__()
+        self.send_queue_depth = send_queue_depth
+        self.active_requests = active_requests
+
+    def __repr__(self):
+        return "ResponderLoad(send_queue_depth={}, active_requests={})".format(self.send_queue_depth, self.active_requests)
+
+
+class _Lease(object):
+
+    def __init__(self):
+        super().__init__()
+        self._remaining = 0
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def _set(self, frame: LeaseFrame):
+        self._remaining = frame.number_of_requests
+        self._expires_at = time.monotonic() + frame.time_to_live / 1000.0
+
+    def _try_use(self) -> bool:
+        if self._remaining > 0 and time.monotonic() < self._expires_at:
+            self._remaining -= 1
+            return True
+        return False
+
+    def try_use(self) -> bool:
+        with self._lock:
+            return self._try_use()
+
+    @property
+    def available(self) -> int:
+        with self._lock:
+            if time.monotonic() < self._expires_at:
+                return self._remaining
+            return 0
+
+
+class RequesterLease(_Lease):
+    """
+        The lease granted by the peer. Every request uses one of its requests until it runs out or expires.
+        Requests without a lease wait up to wait_timeout seconds for the next LeaseFrame, 0 rejects them right away.
+        Until the first LeaseFrame arrived they wait at least first_lease_timeout seconds, the peer sends it only after the setup.
+    """
+
+    def __init__(self, wait_timeout: float = 0, scheduler: rx.scheduler.scheduler.Scheduler = None, first_lease_timeout: float = 0):
+        super().__init__()
+        self.wait_timeout = wait_timeout
+        self.first_lease_timeout = first_lease_timeout
+        self._received = False
+        self._scheduler = scheduler or rx.scheduler.TimeoutScheduler()
+        self._waiters = collections.deque()
+
+    def update(self, frame: LeaseFrame):
+        granted = []
+        with self._lock:
+            self._set(frame)
+            self._received = True
+            while len(self._waiters) > 0 and self._try_use():
+                granted.append(self._waiters.popleft())
+        for observer in granted:
+            observer.on_next(None)
+            observer.on_completed()
+
+    def acquire(self) -> rx.Observable:
+        """
+            Emits once a request of the lease has been used for the subscriber
+            or fails with LeaseExhausted.
+        """
+        def subscribe(observer, scheduler=None):
+            with self._lock:
+                granted = self._try_use()
+                wait_timeout = self.wait_timeout
+                if self._received == False:
+                    wait_timeout = max(wait_timeout, self.first_lease_timeout)
+                if granted == False and wait_timeout > 0:
+                    self._waiters.append(observer)
+            if granted == True:
+                observer.on_next(None)
+                observer.on_completed()
+                return Disposable()
+            if wait_timeout <= 0:
+                observer.on_error(LeaseExhausted(
+                    "No lease for the request"))
+                return Disposable()
+
+            def remove() -> bool:
+                with self._lock:
+                    try:
+                        self._waiters.remove(observer)
+                        return True
+                    except ValueError:
+                        return False
+
+            def on_timeout(scheduler, state):
+                if remove() == True:
+                    observer.on_error(LeaseExhausted(
+                        "No lease for the request within {} seconds".format(wait_timeout)))
+            timeout = self._scheduler.schedule_relative(
+                wait_timeout, on_timeout)
+
+            def dispose():
+                timeout.dispose()
+                remove()
+            return Disposable(dispose)
+        return rx.create(subscribe)
+
+
+class ResponderLease(_Lease):
+    """
+        The lease granted to the peer. Requests beyond it are rejected.
+        The strategy decides on the next lease from the current load, None grants nothing new.
+    """
+
+    def __init__(self, strategy: typing.Callable[[ResponderLoad], typing.Optional[LeaseFrame]]):
+        super().__init__()
+        self._strategy = strategy
+
+    def issue(self, load: ResponderLoad) -> typing.Optional[LeaseFrame]:
+        frame = self._strategy(load)
+        if frame != None:
+            with self._lock:
+                self._set(frame)
+        return frame
+
+
+def load_based_lease_strategy(time_to_live: int, max_requests: int, max_send_queue_depth: int):
+    """
+        Grants max_requests less the requests in progress, scaled down linearly while the send queue
+        fills up to max_send_queue_depth frames.
+    """
+    def strategy(load: ResponderLoad) -> LeaseFrame:
+        headroom = max(0.0, 1.0 - load.send_queue_depth /
+                       float(max_send_queue_depth))
+        number_of_requests = int(
+            max(0, max_requests - load.active_requests) * headroom)
+        return LeaseFrame.from_info(time_to_live, number_of_requests)
+    return strategy
@@ -0,0 +1,189 @@
+from .abstract_connection import AbstractConnection
+from ..transport import SocketTransport
+from ..transport.reactor import Reactor, ReactorPool
+from ..transport.frame_writer import FrameWriter
+from ..frames import SetupFrame, FragmentReassembler, Frame_ABC
+from ..common import RSocketConfig
+from .keepalive_support import KeepaliveSupport, RttStats
+from .send_queue import SendQueue
+from collections import deque
+from queue import Empty
+import itertools
+import logging
+import socket
+import threading
+import typing
+import rx.subject
+
+
+class ReactorClientConnection(AbstractConnection):
+    """
+        Same as the ClientConnection, but reading and writing are driven by a Reactor that
+        is shared with other connections instead of two threads per connection.
+        Frames are received and routed on the reactor thread. Requires a SocketTransport (TcpTransport or UnixTransport).
+    """
+
+    max_batches_per_flush = 8
+    # Without sendmsg (e.g. Windows) pending buffers are joined and written with send
+    _vectored = hasattr(socket.socket, 'sendmsg')
+
+    def __init__(self, transport: SocketTransport, config: RSocketConfig, reactor: typing.Union[Reactor, ReactorPool]):
+        super().__init__()
+        if not isinstance(transport, SocketTransport):
+            raise ValueError(
+                "ReactorClientConnection requires a SocketTransport")
+        self._log = logging.getLogger(
+            "rsockets2.connection.ReactorClientConnection")
+        self._transport = transport
+        self._config = config
+        if config.zero_copy_frames == True:
+            self._transport.enable_zero_copy()
+        self._reactor = reactor.assign()
+
+        self._running = False
+        self._keepalive_support = KeepaliveSupport(
+            self, config, self._keepalive_timeout)
+
+        # Lingering would block the reactor thread
+        self._send_queue = SendQueue(config.send_batch_max_frames,
+                                     config.send_batch_max_bytes,
+                                     0,
+                                     config.mtu)
+        self._pending_buffers = deque()
+        self._writable = False
+        self._write_requested = False
+        self._write_lock = threading.Lock()
+        self._reassembler = FragmentReassembler(config.max_reassembly_bytes)
+        self._recv_subject = rx.subject.Subject()
+
+    def open(self):
+        self._running = True
+
+        self._transport.connect()
+        self._transport.send_frame(SetupFrame.from_config(self._config))
+        self._reactor.register(self._transport.socket, self)
+        self._keepalive_support.start()
+
+    def queue_frame(self, frame: Frame_ABC):
+        self._send_queue.put_frame(frame)
+        with self._write_lock:
+            if self._write_requested == True:
+                return
+            self._write_requested = True
+        self._reactor.call_soon(self._flush)
+
+    def recv_observable(self):
+        return self._recv_subject
+
+    @property
+    def send_batch_stats(self):
+        return self._send_queue.stats
+
+    @property
+    def send_queue_depth(self) -> int:
+        return self._send_queue.qsize()
+
+    @property
+    def rtt_stats(self) -> RttStats:
+        return self._keepalive_support.rtt_stats
+
+    def close(self):
+        if self._running == False:
+            return
+        self._running = False
+        self._keepalive_support.stop()
+
+        def disconnect():
+            # Disconnect first, whoever reacts to the destroy_observable may reuse the transport
+            try:
+                self._transport.disconnect()
+            finally:
+                self._destroy_publisher.on_completed()
+        self._reactor.unregister(self._transport.socket)
+        self._reactor.call_soon(disconnect)
+
+    def _keepalive_timeout(self):
+        self._fail(TimeoutError(
+            "No frame received within {} ms".format(self._config.max_liftime)))
+
+    def on_readable(self):
+        try:
+            frames = self._transport.recv_available_frames()
+        except BlockingIOError:
+            return
+        except Exception as error:
+            self._fail(error)
+            return
+        for frame in frames:
+            self._keepalive_support.frame_received(frame)
+            self.increase_recv_position(len(frame))
+            frame = self._reassemble(frame)
+            if frame != None and not self._route_stream_frame(frame):
+                self._recv_subject.on_next(frame)
+
+    def on_writable(self):
+        self._flush()
+
+    def _flush(self):
+        with self._write_lock:
+            self._write_requested = False
+        if self._running == False:
+            return
+        try:
+            for _ in range(self.max_batches_per_flush):
+                if len(self._pending_buffers) == 0 and self._encode_batch() == False:
+                    self._set_writable(False)
+                    return
+                self._write_pending()
+        except BlockingIOError:
+            pass
+        except Exception as error:
+            self._fail(error)
+            return
+        # Socket buffer full or other connections' turn
+        self._set_writable(True)
+
+    def _encode_batch(self) -> bool:
+        try:
+            frames = self._send_queue.get_batch(timeout=0)
+        except Empty:
+            return False
+        for frame in frames:
+            self.increase_send_position(len(frame))
+            buffers = frame.to_buffers()
+            frame_length = sum(len(buffer) for buffer in buffers)
+            self._pending_buffers.append(
+                memoryview(frame_length.to_bytes(3, 'big')))
+            for buffer in buffers:
+                if len(buffer) > 0:
+                    self._pending_buffers.append(memoryview(buffer).cast('B'))
+        return True
+
+    def _write_pending(self):
+        pending = self._pending_buffers
+        while len(pending) > 0:
+            buffers = list(itertools.islice(
+                pending, 0, FrameWriter.max_buffers))
+            if self._vectored == True:
+                sent = self._transport.socket.sendmsg(buffers)
+            else:
+                sent = self._transport.socket.send(b''.join(buffers))
+            while sent > 0:
+                if sent >= len(pending[0]):
+                    sent -= len(pending.popleft())
+                else:
+                    pending[0] = pending[0][sent:]
+                    sent = 0
+
+    def _set_writable(self, writable: bool):
+        if self._writable != writable:
+            self._writable = writable
+            self._reactor.set_writable(
+                self._transport.socket, self, writable)
+
+    def _fail(self, error: Exception):
+        if self._running == False:
+            return
+        self._log.debug("Connection error: {}".format(error), exc_info=True)
+        self._recv_subject.on_error(error)
+        self.close()
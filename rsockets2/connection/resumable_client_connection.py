@@ -8,10 +8,13 @@ import rx
 import rx.subject
 import rx.operators as op
 import rx.scheduler
-from queue import PriorityQueue, Queue
 import threading
-from .keepalive_support import KeepaliveSupport
-from ..frames import SetupFrame, ResumeFrame, ResumeOkFrame, ErrorFrame, KeepAliveFrame, ErrorCodes, PositionRelevantFrames
+from .keepalive_support import KeepaliveSupport, RttStats
+from .send_queue import SendQueue
+from .resume_cache import ResumeSendCache
+from .spilling_resume_cache import SpillingResumeSendCache
+from .resume_strategy import ReconnectStrategy, ReconnectMetrics, ExponentialBackoffStrategy
+from ..frames import SetupFrame, FragmentReassembler, ResumeFrame, ResumeOkFrame, ErrorFrame, KeepAliveFrame, ErrorCodes, PositionRelevantFrames
 from ..common import RSocketConfig
 import time
 
@@ -22,25 +25,6 @@ class ConnectionState(enum.IntEnum):
     DISCONNECTED = enum.auto()
 
 
-class SendCacheEntry(object):
-
-    def __init__(self, pos, time, frame):
-        super().__init__()
-        self.pos = pos
-        self.time = time
-        self.frame = frame
-
-
-class PriorityEntry(object):
-
-    def __init__(self, priority, data):
-        self.data = data
-        self.priority = priority
-
-    def __lt__(self, other):
-        return self.priority < other.priority
-
-
 class ResumableClientConnection(AbstractConnection):
 
     token_length = 8 * 16
@@ -56,31 +40,52 @@ class ResumableClientConnection(AbstractConnection):
         self._scheduler = scheduler
         self._config = config
         self._transport = transport
+        if config.zero_copy_frames == True:
+            self._transport.enable_zero_copy()
         self._state = ConnectionState.RESUMING
+        self._reconnect_strategy: ReconnectStrategy = config.reconnect_strategy
+        if self._reconnect_strategy == None:
+            self._reconnect_strategy = ExponentialBackoffStrategy()
         self._resume_times = 0
         self._token = None
 
         self._recv_publisher = rx.subject.Subject()
 
-        self._send_queue = PriorityQueue()
-        self._send_cache = []
-        self._send_cache_lock = threading.RLock()
+        self._send_queue = SendQueue(config.send_batch_max_frames,
+                                     config.send_batch_max_bytes,
+                                     config.send_batch_linger_us,
+                                     config.mtu)
+        self._reassembler = FragmentReassembler(config.max_reassembly_bytes)
+        if config.resume_spill_directory != None:
+            self._send_cache = SpillingResumeSendCache(config.resume_cache_max_bytes,
+                                                       config.resume_spill_directory,
+                                                       config.resume_cache_memory_bytes,
+                                                       config.resume_spill_segment_bytes,
+                                                       config.resume_cache_policy,
+                                                       config.resume_cache_block_timeout)
+        else:
+            self._send_cache = ResumeSendCache(config.resume_cache_max_bytes,
+                                               config.resume_cache_policy,
+                                               config.resume_cache_block_timeout)
 
         self._send_and_control_thread = threading.Thread(
             name="RSocketResumableConnectionMain", daemon=True, target=self._send_and_control_loop)
         self._recv_thread = threading.Thread(
             name="RSocketResumableConnectionRecv", daemon=True, target=self._recv_loop)
-        self._keepalive_support = None
+        self._keepalive_support = KeepaliveSupport(
+            self, config, self._keepalive_timeout)
 
         self._state_change_condition = threading.Condition()
 
         self._recv_thread_in_resume_event = threading.Event()
 
     def queue_frame(self, frame):
-        if frame.stream_id == 0:
-            self._send_queue.put(PriorityEntry(10, frame))
-        else:
-            self._send_queue.put(PriorityEntry(100, frame))
+        # The recv thread confirms cached frames, it must never wait for them.
+        # Callers must not hold a lock the recv thread takes (see FlowControlledSender), waiting
+        # for space would then block the keepalives that free it.
+        if isinstance(frame, PositionRelevantFrames) and threading.current_thread() is not self._recv_thread:
+            self._send_cache.wait_for_space()
+        self._send_queue.put_frame(frame)
 
     def recv_observable(self):
         return self._recv_publisher.pipe(
@@ -88,6 +93,22 @@ class ResumableClientConnection(AbstractConnection):
             op.take_until(self.destroy_observable()),
             op.subscribe_on(self._scheduler))
 
+    @property
+    def send_batch_stats(self):
+        return self._send_queue.stats
+
+    @property
+    def send_queue_depth(self) -> int:
+        return self._send_queue.qsize()
+
+    @property
+    def rtt_stats(self) -> RttStats:
+        return self._keepalive_support.rtt_stats
+
+    @property
+    def reconnect_metrics(self) -> ReconnectMetrics:
+        return self._reconnect_strategy.metrics
+
     def open(self):
         self._create_error_logger()
         self._transport.connect()
@@ -95,68 +116,89 @@ class ResumableClientConnection(AbstractConnection):
         self._send_and_control_thread.start()
         self._recv_thread.start()
 
-        self._keepalive_support = KeepaliveSupport(self, self._config)
         self._keepalive_support.start()
 
-        self.recv_observable_filter_type(
-            KeepAliveFrame).pipe(
-                op.throttle_first(1.0),
-                op.take_until(self._destroy_publisher),
-                op.map(lambda frame: frame.last_received_position)
-        ).subscribe(on_next=lambda x: self._clean_send_cache(last_received_position=x))
-
     def close(self):
+        self._keepalive_support.stop()
         self._change_state(ConnectionState.DISCONNECTED)
-        if self._keepalive_support != None:
-            self._keepalive_support.stop()
 
-        self._destroy_publisher.on_completed()
-        try:
-            self._transport.disconnect()
-        except Exception as error:
+    def _keepalive_timeout(self):
+        if self._state == ConnectionState.CONNECTED:
             self._log.debug(
-                "Silent exception while closing transport on resume", exc_info=True)
+                "No frame received within {} ms. Dropping transport to resume".format(self._config.max_liftime))
+            try:
+                self._transport.disconnect()
+            except Exception as error:
+                self._log.debug(
+                    "Silent exception while closing dead transport", exc_info=True)
 
     def _try_resume(self):
+        if self._send_cache.overflowed == True:
+            self._log.warning(
+                "Can not resume, the resume cache overflowed. Closing connection")
+            self._change_state(ConnectionState.DISCONNECTED)
+            return
+        session = self._reconnect_strategy.session()
         while self._state == ConnectionState.RESUMING:
             try:
                 self._transport.disconnect()
             except Exception as error:
                 self._log.debug(
                     "Silent exception while closing transport on resume", exc_info=True)
-            time.sleep(1.0)
+            delay = session.next_delay()
+            if delay == None:
+                self._log.warning(
+                    "Giving up resuming after {} attempts".format(session.attempt))
+                self._change_state(ConnectionState.DISCONNECTED)
+                return
+            time.sleep(delay)
+            session.attempt_started()
             try:
                 self._transport.connect()
-                if (len(self._send_cache) == 0):
-                    sendPosition = 0
-                else:
-                    sendPosition = self._send_cache[0].pos
+                sendPosition = self._send_cache.first_position(
+                    self.send_position)
                 resumeFrame = ResumeFrame.from_config(
                     self._config, self._token, self.last_received_position, sendPosition)
                 self._transport.send_frame(resumeFrame)
                 answer = self._transport.recv_frame()
                 if isinstance(answer, ResumeOkFrame):
                     self._log.debug("Sending cached frames")
-                    for cached_frame in self._send_cache:
-                        if cached_frame.pos > answer.last_received_client_position:
-                            self._transport.send_frame(cached_frame.frame)
+                    self._send_cache.trim(
+                        answer.last_received_client_position)
+                    batch = []
+                    for cached_frame in self._send_cache.frames_after(answer.last_received_client_position):
+                        batch.append(cached_frame)
+                        if len(batch) == self._config.send_batch_max_frames:
+                            self._transport.send_frames(batch)
+                            batch = []
+                    if len(batch) > 0:
+                        self._transport.send_frames(batch)
                     self._log.info(
                         "Successfully resumed connection using token: {}".format(self._token))
+                    self._keepalive_support.stop()
+                    self._keepalive_support.start()
+                    session.attempt_finished()
                     self._change_state(ConnectionState.CONNECTED)
                 elif isinstance(answer, ErrorFrame):
                     self._log.info(
                         "Resume Failed! ErrorCode: {} - ErrorData: {}".format(answer.error_code.name, answer.error_data))
+                    session.attempt_finished(
+                        ConnectionError(answer.error_data))
                     self._change_state(ConnectionState.DISCONNECTED)
                 else:
                     self._log.error(
                         "Unexpected answer while resuming: {}".format(answer))
+                    session.attempt_finished(
+                        ConnectionError("Unexpected answer {}".format(answer)))
                     self._change_state(ConnectionState.DISCONNECTED)
             except (ConnectionError, TimeoutError) as error:
                 self._log.debug(
-                    "Connection error while resuming. Trying again in 1s ...", exc_info=True)
+                    "Connection error while resuming. Trying again ...", exc_info=True)
+                session.attempt_finished(error)
             except Exception as error:
                 self._log.error(
                     "Unexpected exception while resuming.", exc_info=True)
+                session.attempt_finished(error)
                 self._change_state(ConnectionState.DISCONNECTED)
 
     def _negotiate_connection(self):
@@ -180,16 +222,17 @@ class ResumableClientConnection(AbstractConnection):
 
             elif self._state == ConnectionState.CONNECTED:
                 try:
-                    frame = self._send_queue.get().data
+                    frames = self._send_queue.get_batch()
 
-                    if isinstance(frame, PositionRelevantFrames):
-                        pos = self.increase_send_position(len(frame))
-
-                        with self._send_cache_lock:
-                            self._send_cache.append(
-                                SendCacheEntry(pos, time.time(), frame))
+                    for frame in frames:
+                        if isinstance(frame, PositionRelevantFrames):
+                            pos = self.increase_send_position(len(frame))
+                            self._send_cache.append(pos, frame)
 
-                    self._transport.send_frame(frame)
+                    if len(frames) == 1:
+                        self._transport.send_frame(frames[0])
+                    else:
+                        self._transport.send_frames(frames)
                 except self._expected_exceptions as error:
                     if self._state == ConnectionState.CONNECTED:
                         self._log.debug(
@@ -208,10 +251,16 @@ class ResumableClientConnection(AbstractConnection):
                 if self._state == ConnectionState.CONNECTED:
                     try:
                         frame = self._transport.recv_frame()
+                        self._keepalive_support.frame_received(frame)
+                        if isinstance(frame, KeepAliveFrame):
+                            self._send_cache.trim(
+                                frame.last_received_position)
                         if isinstance(frame, PositionRelevantFrames):
                             self.increase_recv_position(len(frame))
 
-                        self._recv_publisher.on_next(frame)
+                        frame = self._reassemble(frame)
+                        if frame != None and not self._route_stream_frame(frame):
+                            self._recv_publisher.on_next(frame)
                     except self._expected_exceptions as error:
 
                         if self._state == ConnectionState.CONNECTED:
@@ -240,6 +289,13 @@ class ResumableClientConnection(AbstractConnection):
         return ''.join(random.choice(chars) for i in range(self.token_length)).encode('ASCII')
 
     def _disconnected_action(self):
+        # Disconnect first, whoever reacts to the destroy_observable may reuse the transport
+        try:
+            self._transport.disconnect()
+        except Exception as error:
+            self._log.debug(
+                "Silent exception while closing transport", exc_info=True)
+        self._send_cache.clear()
         self._destroy_publisher.on_completed()
 
     def _change_state(self, new_state: ConnectionState):
@@ -255,28 +311,6 @@ class ResumableClientConnection(AbstractConnection):
                 self._disconnected_action()
             self._state_change_condition.notify_all()
 
-    def _clean_send_cache(self, last_received_position: int = -1, time_cut=None):
-        try:
-            with self._send_cache_lock:
-                idx_to_remove = []
-                if last_received_position > 0:
-                    for idx, cache_entry in enumerate(self._send_cache):
-                        if cache_entry.pos < last_received_position:
-                            idx_to_remove.append(idx)
-                for idx in sorted(idx_to_remove, reverse=True):
-                    self._send_cache.pop(idx)
-                idx_to_remove.clear()
-                if time_cut != None:
-                    for idx, cache_entry in enumerate(self._send_cache):
-                        if cache_entry.time <= time_cut:
-                            idx_to_remove.append(idx)
-                for idx in sorted(idx_to_remove, reverse=True):
-                    self._send_cache.pop(idx)
-                idx_to_remove.clear()
-        except Exception as error:  # Sometimes its hard to log errors in rx since it doesnt have a default error handler
-            self._log.error("Error in clear cache function...")
-            raise error
-
     def _create_error_logger(self):
         def on_next(error: ErrorFrame):
             if error.error_code == ErrorCodes.UNSUPPORTED_SETUP:
@@ -0,0 +1,93 @@
+from ..frames import Frame_ABC
+from ..common import ResumeCachePolicy
+from collections import deque
+import threading
+import typing
+
+
+class ResumeCacheFull(Exception):
+    pass
+
+
+class ResumeSendCache(object):
+    """
+        Frames sent on a resumable connection that the peer has not confirmed yet, in send order.
+        Entries are (position, frame) with the send position after the frame. trim removes confirmed frames
+        from the head in time proportional to the number of removed frames.
+
+        Bounded by max_bytes: with ResumeCachePolicy.BLOCK producers wait in wait_for_space, with
+        ResumeCachePolicy.FAIL the cache is dropped and overflowed set once it exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes: int, policy: ResumeCachePolicy = ResumeCachePolicy.BLOCK, block_timeout: float = None):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.overflowed = False
+        self._entries: typing.Deque[typing.Tuple[int, Frame_ABC]] = deque()
+        self._bytes = 0
+        self._condition = threading.Condition()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def first_position(self, send_position: int) -> int:
+        """
+            Position of the oldest cached frame, send_position if the cache is empty.
+        """
+        with self._condition:
+            if len(self._entries) == 0:
+                return send_position
+            position, frame = self._entries[0]
+            return position - len(frame)
+
+    def append(self, position: int, frame: Frame_ABC):
+        with self._condition:
+            if self.overflowed == True:
+                return
+            self._entries.append((position, frame))
+            self._bytes += len(frame)
+            if self._bytes > self.max_bytes and self.policy == ResumeCachePolicy.FAIL:
+                self.overflowed = True
+                self._entries.clear()
+                self._bytes = 0
+
+    def wait_for_space(self):
+        """
+            Blocks while the cache is full and the policy is BLOCK. Raises ResumeCacheFull after block_timeout seconds.
+        """
+        if self.policy != ResumeCachePolicy.BLOCK:
+            return
+        with self._condition:
+            if self._condition.wait_for(lambda: self._bytes < self.max_bytes, self.block_timeout) == False:
+                raise ResumeCacheFull(
+                    "Resume cache holds {} unconfirmed bytes".format(self._bytes))
+
+    def trim(self, confirmed_position: int) -> int:
+        """
+            Removes the frames the peer confirmed to have received. Returns the number of removed frames.
+        """
+        removed = 0
+        with self._condition:
+            entries = self._entries
+            while len(entries) > 0 and entries[0][0] <= confirmed_position:
+                self._bytes -= len(entries.popleft()[1])
+                removed += 1
+            if removed > 0:
+                self._condition.notify_all()
+        return removed
+
+    def frames_after(self, position: int) -> typing.List[Frame_ABC]:
+        with self._condition:
+            return [frame for frame_position, frame in self._entries if frame_position > position]
+
+    def clear(self):
+        with self._condition:
+            self._entries.clear()
+            self._bytes = 0
+            self._condition.notify_all()
@@ -1,51 +1,151 @@
 from abc import ABC, abstractmethod
-from ..frames import Frame_ABC, KeepAliveFrame
-from .abstract_connection import AbstractConnection
-import rx.operators as op
+from collections import deque
+import random
 import threading
+import time
+import typing
 
 
-class ResumeStrategy(ABC):
+class ReconnectAttempt(object):
 
-    def __init__(self):
+    def __init__(self, attempt: int, delay: float, started: float):
         super().__init__()
+        self.attempt = attempt
+        self.delay = delay
+        self.started = started
+        self.duration: float = None
+        self.error: Exception = None
 
-    @abstractmethod
-    def create_resume_frame(self):
-        pass
+    @property
+    def succeeded(self) -> bool:
+        return self.duration != None and self.error == None
 
-    @abstractmethod
-    def push_send_frame(self, pos: int, frame: Frame_ABC):
-        pass
+    def __repr__(self):
+        return "ReconnectAttempt(attempt={}, delay={:.3f}, duration={}, error={})".format(
+            self.attempt, self.delay, self.duration, self.error)
+
+
+class ReconnectMetrics(object):
+    """
+        Counters over all reconnect attempts of a strategy. history holds the timing of the last attempts.
+    """
+
+    def __init__(self, max_history: int = 100):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.successes = 0
+        self.failures = 0
+        self.give_ups = 0
+        self.failovers = 0
+        self.history: typing.Deque[ReconnectAttempt] = deque(
+            maxlen=max_history)
+
+    def record(self, attempt: ReconnectAttempt):
+        with self._lock:
+            self.attempts += 1
+            if attempt.succeeded == True:
+                self.successes += 1
+            else:
+                self.failures += 1
+            self.history.append(attempt)
+
+    def record_give_up(self):
+        with self._lock:
+            self.give_ups += 1
+
+    def record_failover(self):
+        with self._lock:
+            self.failovers += 1
+
+    def __repr__(self):
+        return "ReconnectMetrics(attempts={}, successes={}, failures={}, give_ups={}, failovers={})".format(
+            self.attempts, self.successes, self.failures, self.give_ups, self.failovers)
+
+
+class ReconnectSession(object):
+    """
+        Attempts to reconnect after one connection loss. next_delay returns None once waiting would exceed
+        the max_elapsed budget of the strategy.
+    """
+
+    def __init__(self, strategy: 'ReconnectStrategy'):
+        super().__init__()
+        self._strategy = strategy
+        self.started = time.monotonic()
+        self.attempt = 0
+        self._previous_delay: float = None
+        self._current: ReconnectAttempt = None
+
+    def next_delay(self) -> typing.Optional[float]:
+        delay = self._strategy.delay(self.attempt, self._previous_delay)
+        max_elapsed = self._strategy.max_elapsed
+        if max_elapsed != None and time.monotonic() + delay - self.started > max_elapsed:
+            self._strategy.metrics.record_give_up()
+            return None
+        self._previous_delay = delay
+        return delay
+
+    def attempt_started(self):
+        delay = self._previous_delay if self._previous_delay != None else 0.0
+        self._current = ReconnectAttempt(
+            self.attempt, delay, time.monotonic())
+        self.attempt += 1
+
+    def attempt_finished(self, error: Exception = None):
+        if self._current == None:
+            return
+        self._current.duration = time.monotonic() - self._current.started
+        self._current.error = error
+        self._strategy.metrics.record(self._current)
+        self._current = None
+
+
+class ReconnectStrategy(ABC):
+    """
+        Decides how long to wait before each attempt to reconnect or resume. One strategy may be shared
+        by many connections, every connection loss starts a new session().
+    """
+
+    def __init__(self, max_elapsed: float = None):
+        super().__init__()
+        self.max_elapsed = max_elapsed
+        self.metrics = ReconnectMetrics()
 
     @abstractmethod
-    def push_keepalive_frame(self, frame: KeepAliveFrame):
+    def delay(self, attempt: int, previous_delay: typing.Optional[float]) -> float:
         pass
 
+    def session(self) -> ReconnectSession:
+        return ReconnectSession(self)
 
-class ExponentialBackoffResumeStrategy(ResumeStrategy):
 
-    max_store_size = 1000
+class FixedDelayStrategy(ReconnectStrategy):
 
-    def __init__(self):
-        super().__init__()
-        self._send_store = []
-
-        self._store_lock = threading.Lock()
-
-
-    def push_send_frame(self, pos: int, frame: Frame_ABC):
-        with self._store_lock:
-            self._send_store.append((pos, frame))
-            if len(self._send_store) > self.max_store_size:
-                self._send_store.pop(0)
-
-    def push_keepalive_frame(self, frame: KeepAliveFrame):
-        foreign_pos = frame.last_received_position
-        to_be_removed = []
-        with self._store_lock:
-            for idx, element in enumerate(self._send_store):
-                if element[0] < foreign_pos:
-                    to_be_removed.append(idx)
-            for idx in to_be_removed:
-                self._send_store.pop(idx)
+    def __init__(self, delay: float, max_elapsed: float = None):
+        super().__init__(max_elapsed)
+        self._delay = delay
+
+    def delay(self, attempt: int, previous_delay: typing.Optional[float]) -> float:
+        return self._delay
+
+
+class ExponentialBackoffStrategy(ReconnectStrategy):
+    """
+        Exponential backoff with decorrelated jitter: each delay is drawn from [base_delay, 3 * previous delay],
+        capped at max_delay, so clients that lost their connection at the same time spread out.
+        With immediate_first_retry the first attempt is made without waiting.
+    """
+
+    def __init__(self, base_delay: float = 0.1, max_delay: float = 30.0, max_elapsed: float = None, immediate_first_retry: bool = True):
+        super().__init__(max_elapsed)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.immediate_first_retry = immediate_first_retry
+
+    def delay(self, attempt: int, previous_delay: typing.Optional[float]) -> float:
+        if attempt == 0 and self.immediate_first_retry == True:
+            return 0.0
+        if previous_delay == None or previous_delay < self.base_delay:
+            previous_delay = self.base_delay
+        return min(self.max_delay, random.uniform(self.base_delay, previous_delay * 3))
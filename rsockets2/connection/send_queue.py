@@ -0,0 +1,166 @@
+from queue import PriorityQueue, Empty
+from collections import deque
+import itertools
+import threading
+import time
+import typing
+from ..frames import Frame_ABC, FragmentableFrames, fragment
+
+
+class PriorityEntry(object):
+
+    def __init__(self, priority, sequence, data):
+        self.data = data
+        self.priority = priority
+        self.sequence = sequence
+
+    def __lt__(self, other):
+        if self.priority == other.priority:
+            return self.sequence < other.sequence
+        return self.priority < other.priority
+
+
+class SendBatchStats(object):
+    """
+        Counters describing the batches taken from a SendQueue.
+        batch_size_histogram maps the upper bound of a power of two bucket to the number of batches.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.frames = 0
+        self.bytes = 0
+        self.max_batch_frames = 0
+        self.batch_size_histogram: typing.Dict[int, int] = {}
+
+    def record(self, frames: int, size: int):
+        bucket = 1 << (frames - 1).bit_length()
+        with self._lock:
+            self.batches += 1
+            self.frames += frames
+            self.bytes += size
+            self.max_batch_frames = max(self.max_batch_frames, frames)
+            self.batch_size_histogram[bucket] = self.batch_size_histogram.get(
+                bucket, 0) + 1
+
+    def add(self, other: 'SendBatchStats'):
+        """
+            Adds the counters of other, e.g. to aggregate the stats of several connections.
+        """
+        with other._lock:
+            batches, frames, size = other.batches, other.frames, other.bytes
+            max_batch_frames = other.max_batch_frames
+            histogram = dict(other.batch_size_histogram)
+        with self._lock:
+            self.batches += batches
+            self.frames += frames
+            self.bytes += size
+            self.max_batch_frames = max(
+                self.max_batch_frames, max_batch_frames)
+            for bucket, count in histogram.items():
+                self.batch_size_histogram[bucket] = self.batch_size_histogram.get(
+                    bucket, 0) + count
+
+    @property
+    def average_batch_frames(self) -> float:
+        with self._lock:
+            if self.batches == 0:
+                return 0.0
+            return self.frames / self.batches
+
+    def __repr__(self):
+        return "SendBatchStats(batches={}, frames={}, bytes={}, max_batch_frames={}, histogram={})".format(
+            self.batches, self.frames, self.bytes, self.max_batch_frames, self.batch_size_histogram)
+
+
+class FragmentedStream(deque):
+    """
+        Outgoing frames of a stream that is currently sending fragments.
+        It is queued as a single entry that yields one frame and then goes back to the end of the queue.
+    """
+    pass
+
+
+class SendQueue(PriorityQueue):
+    """
+        Priority queue of outgoing frames. Connection level frames (stream id 0) are sent first,
+        frames of the same priority keep their order.
+        get_batch drains up to max_frames frames or max_bytes bytes under a single lock acquire.
+        If linger_us is set it waits up to that many microseconds for a batch to fill up.
+        Frames larger than mtu are split into fragments, which are interleaved with the frames of other streams.
+    """
+
+    def __init__(self, max_frames: int = 64, max_bytes: int = 1024 * 1024, linger_us: int = 0, mtu: int = 0xFFFFFF):
+        super().__init__()
+        self.max_frames = max_frames
+        self.max_bytes = max_bytes
+        self.linger_us = linger_us
+        self.mtu = mtu
+        self.stats = SendBatchStats()
+        self._sequence = itertools.count()
+        self._fragmented_streams: typing.Dict[int, FragmentedStream] = {}
+        self._fragmented_streams_lock = threading.Lock()
+
+    def put_frame(self, frame: Frame_ABC):
+        if frame.stream_id == 0:
+            self.put(PriorityEntry(10, next(self._sequence), frame))
+            return
+        with self._fragmented_streams_lock:
+            stream = self._fragmented_streams.get(frame.stream_id)
+            if stream is not None:
+                # Keep the order of the stream behind the pending fragments
+                stream.extend(fragment(frame, self.mtu))
+                return
+            if len(frame) > self.mtu and isinstance(frame, FragmentableFrames):
+                stream = FragmentedStream(fragment(frame, self.mtu))
+                self._fragmented_streams[frame.stream_id] = stream
+        if stream is None:
+            self.put(PriorityEntry(100, next(self._sequence), frame))
+        else:
+            self.put(PriorityEntry(100, next(self._sequence), stream))
+
+    def _take_frame(self, entry: PriorityEntry, requeue) -> Frame_ABC:
+        if not isinstance(entry.data, FragmentedStream):
+            return entry.data
+        with self._fragmented_streams_lock:
+            frame = entry.data.popleft()
+            if len(entry.data) == 0:
+                del self._fragmented_streams[frame.stream_id]
+                return frame
+        requeue(PriorityEntry(entry.priority, next(self._sequence), entry.data))
+        return frame
+
+    def get_batch(self, timeout: float = None) -> typing.List[Frame_ABC]:
+        frame = self._take_frame(self.get(timeout=timeout), self.put)
+        batch = [frame]
+        size = len(frame)
+        deadline = None
+        while len(batch) < self.max_frames and size < self.max_bytes:
+            size = self._drain_into(batch, size)
+            if len(batch) >= self.max_frames or size >= self.max_bytes or self.linger_us <= 0:
+                break
+            if deadline is None:
+                deadline = time.monotonic() + self.linger_us / 1_000_000.0
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                frame = self._take_frame(
+                    self.get(timeout=remaining), self.put)
+            except Empty:
+                break
+            batch.append(frame)
+            size += len(frame)
+        self.stats.record(len(batch), size)
+        return batch
+
+    def _drain_into(self, batch: typing.List[Frame_ABC], size: int) -> int:
+        with self.mutex:
+            while len(batch) < self.max_frames and size < self.max_bytes and self._qsize() > 0:
+                frame = self._take_frame(self._get(), self._put)
+                batch.append(frame)
+                size += len(frame)
+            self.not_full.notify_all()
+        return size
@@ -0,0 +1,181 @@
+from .resume_cache import ResumeSendCache
+from ..frames import Frame_ABC, FrameParser
+from ..common import ResumeCachePolicy
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import typing
+
+
+class ResumeSegment(object):
+    """
+        Memory mapped append only file of records: 8 byte send position after the frame, 4 byte length, frame bytes.
+        read_offset skips the records the peer already confirmed, records and frame_bytes count the others.
+    """
+
+    record_header = struct.Struct(">QI")
+
+    def __init__(self, directory: str, size: int):
+        super().__init__()
+        fd, self.path = tempfile.mkstemp(
+            prefix="rsocket-resume-", suffix=".seg", dir=directory)
+        try:
+            os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self.size = size
+        self.write_offset = 0
+        self.read_offset = 0
+        self.records = 0
+        self.frame_bytes = 0
+        self.first_position: int = None
+        self.last_position: int = None
+
+    def fits(self, frame_length: int) -> bool:
+        return self.write_offset + self.record_header.size + frame_length <= self.size
+
+    def append(self, position: int, frame_position: int, frame_bytes):
+        if self.first_position == None:
+            self.first_position = frame_position
+        self.last_position = position
+        self.record_header.pack_into(
+            self._map, self.write_offset, position, len(frame_bytes))
+        start = self.write_offset + self.record_header.size
+        self._map[start:start + len(frame_bytes)] = frame_bytes
+        self.write_offset = start + len(frame_bytes)
+        self.records += 1
+        self.frame_bytes += len(frame_bytes)
+
+    def read(self, offset: int) -> typing.Tuple[int, bytes, int]:
+        """
+            Returns position, frame bytes and the offset of the next record.
+        """
+        position, length = self.record_header.unpack_from(self._map, offset)
+        start = offset + self.record_header.size
+        return position, self._map[start:start + length], start + length
+
+    def skip_confirmed(self, confirmed_position: int) -> int:
+        """
+            Returns the number of skipped records.
+        """
+        skipped = 0
+        while self.read_offset < self.write_offset:
+            position, length = self.record_header.unpack_from(
+                self._map, self.read_offset)
+            if position > confirmed_position:
+                break
+            self.read_offset += self.record_header.size + length
+            self.first_position = position
+            self.records -= 1
+            self.frame_bytes -= length
+            skipped += 1
+        return skipped
+
+    def delete(self):
+        self._map.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class SpillingResumeSendCache(ResumeSendCache):
+    """
+        ResumeSendCache that keeps only the newest memory_bytes of frames in memory and spills older frames to memory
+        mapped segment files of segment_bytes in directory. Segments are deleted once the peer confirmed all their frames.
+        max_bytes and the policy apply to memory and disk together. frames_after reads the segments sequentially
+        and is meant to be consumed by the thread that appends.
+    """
+
+    def __init__(self, max_bytes: int, directory: str,
+                 memory_bytes: int = 8 * 1024 * 1024,
+                 segment_bytes: int = 64 * 1024 * 1024,
+                 policy: ResumeCachePolicy = ResumeCachePolicy.BLOCK,
+                 block_timeout: float = None):
+        super().__init__(max_bytes, policy, block_timeout)
+        self._log = logging.getLogger(
+            "rsockets2.connection.SpillingResumeSendCache")
+        self.directory = directory
+        self.memory_bytes = memory_bytes
+        self.segment_bytes = segment_bytes
+        self._segments: typing.List[ResumeSegment] = []
+        self._memory_bytes_used = 0
+        self._parser = FrameParser()
+
+    def __len__(self):
+        return len(self._entries) + sum(segment.records for segment in self._segments)
+
+    def first_position(self, send_position: int) -> int:
+        with self._condition:
+            if len(self._segments) > 0:
+                return self._segments[0].first_position
+        return super().first_position(send_position)
+
+    def append(self, position: int, frame: Frame_ABC):
+        with self._condition:
+            if self.overflowed == True:
+                return
+            self._memory_bytes_used += len(frame)
+            super().append(position, frame)
+            if self.overflowed == True:
+                self._delete_segments()
+                self._memory_bytes_used = 0
+                return
+            while self._memory_bytes_used > self.memory_bytes and len(self._entries) > 1:
+                self._spill(*self._entries.popleft())
+
+    def trim(self, confirmed_position: int) -> int:
+        with self._condition:
+            removed = 0
+            spilled_bytes = 0
+            while len(self._segments) > 0 and self._segments[0].last_position <= confirmed_position:
+                segment = self._segments.pop(0)
+                removed += segment.records
+                spilled_bytes += segment.frame_bytes
+                segment.delete()
+            if len(self._segments) > 0:
+                segment = self._segments[0]
+                frame_bytes = segment.frame_bytes
+                removed += segment.skip_confirmed(confirmed_position)
+                spilled_bytes += frame_bytes - segment.frame_bytes
+            if removed > 0:
+                self._bytes -= spilled_bytes
+                self._condition.notify_all()
+            before = self._bytes
+            removed += super().trim(confirmed_position)
+            self._memory_bytes_used -= before - self._bytes
+            return removed
+
+    def frames_after(self, position: int) -> typing.Iterator[Frame_ABC]:
+        for segment in list(self._segments):
+            offset = segment.read_offset
+            while offset < segment.write_offset:
+                frame_position, frame_bytes, offset = segment.read(offset)
+                if frame_position > position:
+                    yield self._parser.parseFrame(frame_bytes)
+        yield from super().frames_after(position)
+
+    def clear(self):
+        with self._condition:
+            self._delete_segments()
+            self._memory_bytes_used = 0
+            super().clear()
+
+    def _spill(self, position: int, frame: Frame_ABC):
+        frame_bytes = frame.to_bytes()
+        self._memory_bytes_used -= len(frame)
+        if len(self._segments) == 0 or not self._segments[-1].fits(len(frame_bytes)):
+            size = max(self.segment_bytes,
+                       ResumeSegment.record_header.size + len(frame_bytes))
+            self._segments.append(ResumeSegment(self.directory, size))
+            self._log.debug("Spilling resume cache to {}".format(
+                self._segments[-1].path))
+        self._segments[-1].append(position, position - len(frame), frame_bytes)
+
+    def _delete_segments(self):
+        for segment in self._segments:
+            segment.delete()
+        self._segments.clear()
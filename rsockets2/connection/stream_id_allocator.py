@@ -0,0 +1,42 @@
+import threading
+
+
+class StreamIdAllocator(object):
+    """
+        Hands out stream ids of one parity (odd for clients, even for servers) in constant time.
+        The cursor wraps around at 2^31 - 1. Ids still in use after a wrap around are skipped.
+    """
+
+    max_stream_id = 2_147_483_647
+
+    def __init__(self, first_stream_id: int = 1):
+        super().__init__()
+        self._first_stream_id = first_stream_id
+        self._last_stream_id = 0
+        self._used_stream_ids = set()
+        self._capacity = (self.max_stream_id - first_stream_id) // 2 + 1
+        self._lock = threading.Lock()
+
+    def allocate(self) -> int:
+        with self._lock:
+            if len(self._used_stream_ids) >= self._capacity:
+                raise RuntimeError("No free stream ids left!")
+            while True:
+                if self._last_stream_id == 0 or self._last_stream_id + 2 > self.max_stream_id:
+                    stream_id = self._first_stream_id
+                else:
+                    stream_id = self._last_stream_id + 2
+                self._last_stream_id = stream_id
+                if stream_id not in self._used_stream_ids:
+                    self._used_stream_ids.add(stream_id)
+                    return stream_id
+
+    def free(self, stream_id: int):
+        with self._lock:
+            self._used_stream_ids.discard(stream_id)
+
+    def is_used(self, stream_id: int) -> bool:
+        return stream_id in self._used_stream_ids
+
+    def __len__(self):
+        return len(self._used_stream_ids)
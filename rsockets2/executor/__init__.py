@@ -1 +1,4 @@
-from .request_response import request_response_executor, request_stream_executor
\ No newline at end of file
+from .request_response import request_response_executor, request_stream_executor
+from .request_n import StreamDemand, replenish_on_consumption
+from .cancellation import cancel_on_dispose
+from .request_channel import request_channel_executor, request_channel_inbound
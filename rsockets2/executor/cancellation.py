@@ -0,0 +1,35 @@
+from ..connection import AbstractConnection
+import rx
+from rx.disposable import Disposable
+
+
+def cancel_on_dispose(connection: AbstractConnection, stream_id: int):
+    """
+        Sends a CancelFrame for the stream if the subscription is disposed before
+        the stream completed or failed. Must be placed behind the operators that turn
+        the terminal frames of the stream into on_completed/on_error.
+    """
+    def _cancel_on_dispose(source: rx.Observable) -> rx.Observable:
+        def subscribe(observer, scheduler=None):
+            terminated = False
+
+            def on_error(error):
+                nonlocal terminated
+                terminated = True
+                observer.on_error(error)
+
+            def on_completed():
+                nonlocal terminated
+                terminated = True
+                observer.on_completed()
+
+            subscription = source.subscribe_(
+                observer.on_next, on_error, on_completed, scheduler)
+
+            def dispose():
+                subscription.dispose()
+                if terminated == False:
+                    connection.cancel_stream(stream_id)
+            return Disposable(dispose)
+        return rx.create(subscribe)
+    return _cancel_on_dispose
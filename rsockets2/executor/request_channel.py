@@ -0,0 +1,124 @@
+from ..common import OverflowStrategy
+from ..connection import AbstractConnection
+from ..handler import request_stream_pipe
+from .request_response import stream_payloads
+from .request_n import StreamDemand, replenish_on_consumption
+from .cancellation import cancel_on_dispose
+import rx
+import rx.core
+import rx.operators as op
+import rx.scheduler
+from rx.disposable import Disposable
+import functools
+import threading
+from rsockets2.frames import RequestChannel, Payload, ErrorFrame
+
+
+def _request_channel_executor(
+        connection: AbstractConnection,
+        frame: RequestChannel,
+        outbound: rx.Observable,
+        buffer_limit: int,
+        overflow_strategy: OverflowStrategy,
+        observer, scheduler):
+    inbound_completed = False
+    outbound_completed = outbound == None
+    terminated = False
+    lock = threading.Lock()
+
+    def on_error(error):
+        nonlocal terminated
+        with lock:
+            if terminated == True:
+                return
+            terminated = True
+        observer.on_error(error)
+
+    def on_completed(inbound: bool):
+        nonlocal inbound_completed, outbound_completed, terminated
+        with lock:
+            if inbound == True:
+                inbound_completed = True
+            else:
+                outbound_completed = True
+            if terminated == True or inbound_completed == False or outbound_completed == False:
+                return
+            terminated = True
+        observer.on_completed()
+
+    inbound_disposable = stream_payloads(connection, frame.stream_id).pipe(
+        op.map(lambda payload: payload.payload)
+    ).subscribe(on_next=lambda x: observer.on_next(x), on_error=on_error, on_completed=lambda: on_completed(True))
+
+    if outbound == None:
+        connection.queue_frame(frame)
+        outbound_disposable = Disposable()
+    else:
+        def send_request(_):
+            # Sent once the outbound side listens for the RequestNFrames of the responder
+            connection.queue_frame(frame)
+            return outbound
+        outbound_disposable = rx.defer(send_request).pipe(
+            request_stream_pipe(frame.stream_id, connection, 0,
+                                buffer_limit, overflow_strategy)
+        ).subscribe(on_error=on_error, on_completed=lambda: on_completed(False), scheduler=scheduler)
+
+    def dispose():
+        nonlocal terminated
+        inbound_disposable.dispose()
+        outbound_disposable.dispose()
+        with lock:
+            complete_outbound = terminated == False and outbound_completed == False
+            terminated = True
+        if complete_outbound == True:
+            complete = Payload()
+            complete.stream_id = frame.stream_id
+            complete.complete = True
+            complete.payload = bytes(0)
+            complete.meta_data = bytes(0)
+            connection.queue_frame(complete)
+    return dispose
+
+
+def request_channel_executor(connection: AbstractConnection, frame: RequestChannel, outbound: rx.Observable = None,
+                             buffer_limit: int = 0, overflow_strategy: OverflowStrategy = OverflowStrategy.ERROR) -> rx.core.Observable:
+    """
+        Emits the data of the responder's Payloads. The items of outbound follow the first payload of the
+        RequestChannel frame as far as the responder requested them. Completes when both directions completed.
+    """
+    return rx.create(functools.partial(_request_channel_executor, connection, frame, outbound, buffer_limit, overflow_strategy))
+
+
+def request_channel_inbound(connection: AbstractConnection, frame: RequestChannel, window: int, replenish_fraction: float = 0.5,
+                            scheduler: rx.scheduler.scheduler.Scheduler = None) -> rx.core.Observable:
+    """
+        Emits the data of the Payloads the requester sends after the RequestChannel frame on the responder side.
+        Subscribing requests window items, more are requested as they are consumed.
+    """
+    if frame.complete == True:
+        return rx.empty()
+
+    def _wrap_throw_error_frame(error: ErrorFrame):
+        raise error.to_exception()
+
+    def subscribe(observer, _scheduler=None):
+        demand = StreamDemand(connection, frame.stream_id,
+                              window, replenish_fraction)
+        application_error = connection.stream_observable_filter_type(frame.stream_id, ErrorFrame).pipe(
+            op.map(_wrap_throw_error_frame)
+        )
+        inbound = stream_payloads(connection, frame.stream_id).pipe(
+            op.map(lambda payload: payload.payload),
+            op.materialize(),
+            op.merge(application_error),
+            op.dematerialize(),
+            cancel_on_dispose(connection, frame.stream_id)
+        )
+        if scheduler != None:
+            inbound = inbound.pipe(op.observe_on(scheduler))
+        disposable = inbound.pipe(
+            replenish_on_consumption(demand)
+        ).subscribe(observer, scheduler=_scheduler)
+        demand.request(window)
+        return disposable
+    return rx.create(subscribe)
@@ -0,0 +1,75 @@
+from ..connection import AbstractConnection
+from rsockets2.frames import RequestNFrame
+import rx
+from rx.disposable import Disposable
+import threading
+
+
+class StreamDemand(object):
+    """
+        Requester side flow control of a single stream.
+        The peer may send up to window items that have not been consumed yet. Whenever
+        replenish_fraction of the window has been consumed a RequestNFrame asks for that many new items.
+    """
+
+    def __init__(self, connection: AbstractConnection, stream_id: int, window: int, replenish_fraction: float = 0.5):
+        super().__init__()
+        self._connection = connection
+        self._stream_id = stream_id
+        self.window = window
+        self._threshold = min(window, max(1, int(window * replenish_fraction)))
+        self._consumed = 0
+        self._stopped = False
+        self._lock = threading.Lock()
+
+    def consumed(self, count: int = 1):
+        with self._lock:
+            if self._stopped == True:
+                return
+            self._consumed += count
+            if self._consumed < self._threshold:
+                return
+            n = self._consumed
+            self._consumed = 0
+        self._request_n(n)
+
+    def request(self, n: int):
+        """
+            Asks for n items independent of consumption, e.g. the initial window of a channel responder.
+        """
+        with self._lock:
+            if self._stopped == True:
+                return
+        self._request_n(n)
+
+    def _request_n(self, n: int):
+        frame = RequestNFrame()
+        frame.stream_id = self._stream_id
+        frame.n = n
+        self._connection.queue_frame(frame)
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+
+
+def replenish_on_consumption(demand: StreamDemand):
+    """
+        Reports an item to the demand after the downstream observer has processed it.
+        Must be placed behind the last scheduler hop so that consumption means processing.
+        Stops the demand when the subscription is disposed.
+    """
+    def _replenish_on_consumption(source: rx.Observable) -> rx.Observable:
+        def subscribe(observer, scheduler=None):
+            def on_next(value):
+                observer.on_next(value)
+                demand.consumed()
+            subscription = source.subscribe_(
+                on_next, observer.on_error, observer.on_completed, scheduler)
+
+            def dispose():
+                demand.stop()
+                subscription.dispose()
+            return Disposable(dispose)
+        return rx.create(subscribe)
+    return _replenish_on_consumption
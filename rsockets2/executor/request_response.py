@@ -8,13 +8,10 @@ import threading
 from rsockets2.frames import RequestResponse, RequestStream, Payload
 
 
-def _request_response_executor(
-        connection: AbstractConnection,
-        frame: RequestResponse,
-        map_to_payload,
-        is_single_element,
-        observer, scheduler):
-
+def stream_payloads(connection: AbstractConnection, stream_id: int) -> rx.Observable:
+    """
+        Emits the Payloads of the stream until one of them completes it or the connection is destroyed.
+    """
     def complete_filter_exclusive(payload: Payload) -> bool:
         if payload.complete and not payload.next_present:
             return False
@@ -27,16 +24,25 @@ def _request_response_executor(
         else:
             return True
 
-    response_obs = connection.recv_observable_filter_type(Payload).pipe(
+    return connection.stream_observable_filter_type(stream_id, Payload).pipe(
         # op.observe_on(scheduler),
-        op.filter(lambda payload: payload.stream_id == frame.stream_id),
         op.take_while(lambda payload: complete_filter_exclusive(
             payload), inclusive=False),
-        op.take_while(lambda payload: complete_filter_exclusive(
+        op.take_while(lambda payload: complete_filter_inclusive(
             payload), inclusive=True),
         op.take_until(connection.destroy_observable())
     )
 
+
+def _request_response_executor(
+        connection: AbstractConnection,
+        frame: RequestResponse,
+        map_to_payload,
+        is_single_element,
+        observer, scheduler):
+
+    response_obs = stream_payloads(connection, frame.stream_id)
+
     if is_single_element == True:
         response_obs = response_obs.pipe(op.take(1))
 
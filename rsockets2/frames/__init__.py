@@ -1,15 +1,21 @@
 from .setup import SetupFrame
 from .parser import FrameParser
 from .keepalive import KeepAliveFrame
-from .error import ErrorFrame, ErrorCodes
+from .error import ErrorFrame, ErrorCodes, ApplicationError
 from .request_response import RequestResponse
 from .request_stream import RequestStream
+from .request_channel import RequestChannel
 from .payload import Payload
 from .request_n import RequestNFrame
 from .request_fnf import RequestFNF
 from .cancel import CancelFrame
+from .metadata_push import MetadataPushFrame
+from .lease import LeaseFrame
 from .frame_abc import Frame_ABC
 from .resume import ResumeFrame, ResumeOkFrame
+from .fragmentation import FragmentableFrames, FragmentReassembler, ReassemblyLimitExceeded, fragment
 
-PositionRelevantFrames = (RequestResponse, RequestFNF, RequestStream,
+PositionRelevantFrames = (RequestResponse, RequestFNF, RequestStream, RequestChannel,
                           RequestNFrame, CancelFrame, ErrorFrame, Payload)
+
+StreamRoutedFrames = (Payload, ErrorFrame, CancelFrame, RequestNFrame)
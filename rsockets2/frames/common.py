@@ -22,9 +22,25 @@ class FrameType(IntEnum):
 
 
 def read_meta_data_length(data, offset):
-    meta_data_length = data[offset] & 0xFF << 16
-    meta_data_length |= data[offset + 1] & 0xFF << 8
+    meta_data_length = (data[offset] & 0xFF) << 16
+    meta_data_length |= (data[offset + 1] & 0xFF) << 8
     meta_data_length |= data[offset + 2] & 0xFF
     return meta_data_length
 
 
+def write_meta_data_length(data, offset, meta_data_length):
+    data[offset] = meta_data_length >> 16 & 0xFF
+    data[offset + 1] = meta_data_length >> 8 & 0xFF
+    data[offset + 2] = meta_data_length & 0xFF
+
+
+def read_data(data, start: int, end: int = None, zero_copy: bool = False):
+    """
+        Returns data[start:end] as bytes.
+        With zero_copy a read only memoryview over data is returned instead. The view keeps
+        the whole receive buffer of the frame alive for as long as it is referenced.
+    """
+    view = memoryview(data)[start:end]
+    if zero_copy == True:
+        return view.toreadonly()
+    return bytes(view)
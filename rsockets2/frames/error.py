@@ -21,6 +21,18 @@ class ErrorCodes(IntEnum):
     RESERVED_2 = 0xFFFFFFFF
 
 
+class ApplicationError(Exception):
+    """
+        The peer answered a request with an ErrorFrame, e.g. APPLICATION_ERROR, REJECTED or INVALID.
+    """
+
+    def __init__(self, frame: 'ErrorFrame'):
+        super().__init__(
+            'Application Error. Message: "{}"'.format(frame.error_data))
+        self.error_code = frame.error_code
+        self.error_data = frame.error_data
+
+
 class ErrorFrame(Frame_ABC):
 
     def __init__(self):
@@ -41,7 +53,7 @@ class ErrorFrame(Frame_ABC):
         except ValueError:
             frame.error_code = ErrorCodes.UNKNOWN_ERROR
         data_read += 4
-        frame.error_data = full_data[data_read:].decode('UTF-8')
+        frame.error_data = bytes(full_data[data_read:]).decode('UTF-8')
         return frame
 
     def __len__(self):
@@ -73,4 +85,12 @@ class ErrorFrame(Frame_ABC):
         frame.stream_id = stream_id
         frame.error_code = code
         frame.error_data = message.encode('ASCII')
-        return frame
\ No newline at end of file
+        return frame
+
+    def to_exception(self) -> Exception:
+        """
+            ConnectionError for connection errors, ApplicationError otherwise.
+        """
+        if self.error_code in (ErrorCodes.CONNECTION_CLOSE, ErrorCodes.CONNECTION_ERROR):
+            return ConnectionError(self.error_data)
+        return ApplicationError(self)
@@ -0,0 +1,175 @@
+import copy
+import typing
+from .frame_abc import Frame_ABC
+from .payload import Payload
+from .request_response import RequestResponse
+from .request_stream import RequestStream
+from .request_channel import RequestChannel
+from .request_fnf import RequestFNF
+from .error import ErrorFrame
+from .cancel import CancelFrame
+
+FragmentableFrames = (Payload, RequestResponse,
+                      RequestStream, RequestChannel, RequestFNF)
+
+max_frame_length = 0xFFFFFF
+
+
+class ReassemblyLimitExceeded(Exception):
+
+    def __init__(self, stream_id: int, limit: int):
+        super().__init__(
+            "Reassembling fragments of stream {} exceeds the limit of {} bytes".format(stream_id, limit))
+        self.stream_id = stream_id
+
+
+def _get_data(frame: Frame_ABC):
+    if isinstance(frame, Payload):
+        return frame.payload
+    return frame.request_data
+
+
+def _fragment_size(frame: Frame_ABC) -> int:
+    size = 0
+    if frame.meta_data != None:
+        size += len(frame.meta_data)
+    if _get_data(frame) != None:
+        size += len(_get_data(frame))
+    return size
+
+
+def fragment(frame: Frame_ABC, mtu: int) -> typing.List[Frame_ABC]:
+    """
+        Splits a Payload or request frame into fragments of at most mtu bytes (without the length prefix).
+        The first fragment has the type of the frame, all following fragments are Payloads.
+        All but the last fragment have the FOLLOWS flag set. Meta data and data are sliced as memoryviews, not copied.
+    """
+    if len(frame) <= mtu or not isinstance(frame, FragmentableFrames):
+        return [frame]
+    if mtu < 64:
+        raise ValueError("The mtu must be at least 64 bytes")
+
+    meta_data = memoryview(
+        frame.meta_data if frame.meta_data != None else bytes(0))
+    data = memoryview(_get_data(frame) if _get_data(frame) != None else bytes(0))
+
+    fragments = []
+    while True:
+        if len(fragments) == 0:
+            current = copy.copy(frame)
+            base_length = 10 if isinstance(
+                frame, (RequestStream, RequestChannel)) else 6
+        else:
+            current = Payload()
+            current.stream_id = frame.stream_id
+            current.next_present = True
+            base_length = 6
+
+        capacity = mtu - base_length
+        if len(meta_data) > 0:
+            capacity -= 3
+            meta_chunk = meta_data[:capacity]
+            meta_data = meta_data[len(meta_chunk):]
+            capacity -= len(meta_chunk)
+        else:
+            meta_chunk = None
+        data_chunk = data[:capacity]
+        data = data[len(data_chunk):]
+
+        current.follows = len(meta_data) > 0 or len(data) > 0
+        if isinstance(current, Payload):
+            current.meta_data = meta_chunk if meta_chunk != None else bytes(0)
+            current.meta_data_present = meta_chunk != None
+            current.payload = data_chunk
+            if current.follows:
+                current.complete = False
+            elif isinstance(frame, Payload):
+                current.complete = frame.complete
+                current.next_present = frame.next_present
+        else:
+            current.meta_data = meta_chunk
+            current.meta_data_present = meta_chunk != None
+            current.request_data = data_chunk
+        fragments.append(current)
+        if current.follows == False:
+            return fragments
+
+
+class FragmentReassembler(object):
+    """
+        Collects the fragments of each stream until the last one arrives and returns the reassembled frame.
+        The meta data and data buffered for all streams together may not exceed max_bytes.
+        Not thread safe. It is meant to be used by the receiving thread only.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._fragments: typing.Dict[int, typing.List[Frame_ABC]] = {}
+        self._discarded_streams = set()
+        self._buffered_bytes = 0
+
+    def push(self, frame: Frame_ABC) -> typing.Optional[Frame_ABC]:
+        """
+            Returns the frame if it is complete, None if more fragments are expected.
+            Raises ReassemblyLimitExceeded if the fragments of the stream have to be dropped.
+        """
+        if frame.stream_id == 0:
+            return frame
+        if isinstance(frame, (ErrorFrame, CancelFrame)):
+            self.discard(frame.stream_id)
+            return frame
+        if not isinstance(frame, FragmentableFrames):
+            return frame
+
+        if frame.stream_id in self._discarded_streams:
+            if frame.follows == False:
+                self._discarded_streams.discard(frame.stream_id)
+            return None
+
+        fragments = self._fragments.get(frame.stream_id)
+        if fragments is None and frame.follows == False:
+            return frame
+
+        size = _fragment_size(frame)
+        if self._buffered_bytes + size > self.max_bytes:
+            self.discard(frame.stream_id)
+            if frame.follows == True:
+                self._discarded_streams.add(frame.stream_id)
+            raise ReassemblyLimitExceeded(frame.stream_id, self.max_bytes)
+
+        if fragments is None:
+            fragments = []
+            self._fragments[frame.stream_id] = fragments
+        fragments.append(frame)
+        self._buffered_bytes += size
+
+        if frame.follows == True:
+            return None
+        self.discard(frame.stream_id)
+        return self._assemble(fragments)
+
+    def discard(self, stream_id: int):
+        fragments = self._fragments.pop(stream_id, None)
+        if fragments is not None:
+            for fragment in fragments:
+                self._buffered_bytes -= _fragment_size(fragment)
+
+    @property
+    def buffered_bytes(self) -> int:
+        return self._buffered_bytes
+
+    def _assemble(self, fragments: typing.List[Frame_ABC]) -> Frame_ABC:
+        first = fragments[0]
+        if isinstance(first, Payload):
+            return Payload.from_fragments(fragments)
+
+        frame = copy.copy(first)
+        frame.follows = False
+        meta_data = b''.join(
+            fragment.meta_data for fragment in fragments if fragment.meta_data != None)
+        frame.meta_data = meta_data if first.meta_data != None or len(meta_data) > 0 else None
+        frame.meta_data_present = frame.meta_data != None
+        frame.request_data = b''.join(
+            _get_data(fragment) for fragment in fragments if _get_data(fragment) != None)
+        return frame
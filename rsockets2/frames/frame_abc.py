@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import typing
 
 
 class Frame_ABC(ABC):
@@ -11,6 +12,20 @@ class Frame_ABC(ABC):
     def to_bytes(self):
         raise NotImplementedError()
 
+    def header_length(self) -> int:
+        """
+            Number of bytes to_buffers writes into the header buffer. 0 if the frame is always encoded as a whole.
+        """
+        return 0
+
+    def to_buffers(self, header_buffer: memoryview = None) -> typing.List:
+        """
+            Encodes the frame as a list of buffers. Frames carrying meta data or data write only their header
+            into header_buffer (at least header_length() bytes) or into a new bytearray and reference
+            meta data and data without copying them.
+        """
+        return [self.to_bytes()]
+
     @classmethod
     @abstractmethod
     def from_data(cls, stream_id: int, flags: int, full_data: bytes):
@@ -21,7 +21,7 @@ class KeepAliveFrame(Frame_ABC):
         frame.last_received_position, = struct.unpack_from(
             ">Q", full_data, data_read)
         data_read += 8
-        frame.data = full_data[data_read:]
+        frame.data = bytes(full_data[data_read:])
         return frame
 
     def __len__(self):
@@ -0,0 +1,53 @@
+from .common import FrameType, read_data
+import struct
+from .frame_abc import Frame_ABC
+from abc import abstractmethod
+
+
+class LeaseFrame(Frame_ABC):
+
+    def __init__(self):
+        super().__init__()
+        # Milliseconds
+        self.time_to_live = 0
+        self.number_of_requests = 0
+        self.meta_data = None
+
+    @classmethod
+    def from_data(cls, stream_id: int, flags: int, full_data: bytes):
+        frame = LeaseFrame()
+
+        data_read = 6
+        frame.time_to_live, frame.number_of_requests = struct.unpack_from(
+            ">II", full_data, data_read)
+        frame.time_to_live &= 0x7FFFFFFF
+        frame.number_of_requests &= 0x7FFFFFFF
+        data_read += 8
+        if flags >> 8 & 1 == 1:
+            frame.meta_data = read_data(full_data, data_read)
+        return frame
+
+    @classmethod
+    def from_info(cls, time_to_live: int, number_of_requests: int, meta_data: bytes = None):
+        frame = LeaseFrame()
+        frame.time_to_live = time_to_live
+        frame.number_of_requests = number_of_requests
+        frame.meta_data = meta_data
+        return frame
+
+    def __len__(self):
+        if self.meta_data != None:
+            return 14 + len(self.meta_data)
+        return 14
+
+    def to_bytes(self):
+        data = bytearray(len(self))
+
+        type_and_flags = FrameType.LEASE << 10
+        if self.meta_data != None:
+            type_and_flags |= (1 << 8)
+        struct.pack_into(">IHII", data, 0, 0, type_and_flags,
+                         self.time_to_live & 0x7FFFFFFF, self.number_of_requests & 0x7FFFFFFF)
+        if self.meta_data != None:
+            data[14:] = self.meta_data
+        return data
@@ -0,0 +1,39 @@
+from .common import FrameType, read_data
+import struct
+from .frame_abc import Frame_ABC
+from abc import abstractmethod
+
+
+class MetadataPushFrame(Frame_ABC):
+
+    def __init__(self):
+        super().__init__()
+        self.meta_data = bytes(0)
+
+    @classmethod
+    def from_data(cls, stream_id: int, flags: int, full_data: bytes, zero_copy: bool = False):
+        frame = MetadataPushFrame()
+        frame.meta_data = read_data(full_data, 6, zero_copy=zero_copy)
+        return frame
+
+    def __len__(self):
+        return 6 + len(self.meta_data)
+
+    def header_length(self) -> int:
+        return 6
+
+    def to_buffers(self, header_buffer: memoryview = None):
+        if header_buffer is None:
+            header_buffer = bytearray(6)
+
+        type_and_flags = FrameType.METADATA_PUSH << 10
+        type_and_flags |= (1 << 8)
+        struct.pack_into(">IH", header_buffer, 0, 0, type_and_flags)
+
+        buffers = [memoryview(header_buffer)[:6]]
+        if len(self.meta_data) > 0:
+            buffers.append(self.meta_data)
+        return buffers
+
+    def to_bytes(self):
+        return bytearray().join(self.to_buffers())
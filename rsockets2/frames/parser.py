@@ -5,16 +5,28 @@ from .common import FrameType
 from .payload import Payload
 from .request_response import RequestResponse
 from .request_stream import RequestStream
+from .request_channel import RequestChannel
 from .keepalive import KeepAliveFrame
 from .request_n import RequestNFrame
 from .request_fnf import RequestFNF
 from .cancel import CancelFrame
+from .metadata_push import MetadataPushFrame
+from .lease import LeaseFrame
 from .resume import ResumeFrame, ResumeOkFrame
 import struct
 from typing import Union
 
 
 class FrameParser(object):
+    """
+        With zero_copy the meta data and data of Payload and request frames are read only memoryviews
+        over the frame buffer instead of copies. The buffer passed to parseFrame must then be owned by the
+        frame and must not be reused afterwards.
+    """
+
+    def __init__(self, zero_copy: bool = False):
+        super().__init__()
+        self.zero_copy = zero_copy
 
     def parseFrame(self, data: bytes, stream_id_required=True):
 
@@ -23,21 +35,27 @@ class FrameParser(object):
         if frame_type == FrameType.SETUP:
             return SetupFrame.from_data(stream_id, flags, data)
         if frame_type == FrameType.PAYLOAD:
-            return Payload.from_data(stream_id, flags, data)
+            return Payload.from_data(stream_id, flags, data, self.zero_copy)
         elif frame_type == FrameType.ERROR:
             return ErrorFrame.from_data(stream_id, flags, data)
         elif frame_type == FrameType.REQUEST_RESPONSE:
-            return RequestResponse.from_data(stream_id, flags, data)
+            return RequestResponse.from_data(stream_id, flags, data, self.zero_copy)
         elif frame_type == FrameType.REQUEST_STREAM:
-            return RequestStream.from_data(stream_id, flags, data)
+            return RequestStream.from_data(stream_id, flags, data, self.zero_copy)
+        elif frame_type == FrameType.REQUEST_CHANNEL:
+            return RequestChannel.from_data(stream_id, flags, data, self.zero_copy)
         elif frame_type == FrameType.KEEPALIVE:
             return KeepAliveFrame.from_data(stream_id, flags, data)
         elif frame_type == FrameType.REQUEST_N:
             return RequestNFrame.from_data(stream_id, flags, data)
         elif frame_type == FrameType.REQUEST_FNF:
-            return RequestFNF.from_data(stream_id, flags, data)
+            return RequestFNF.from_data(stream_id, flags, data, self.zero_copy)
         elif frame_type == FrameType.CANCEL:
             return CancelFrame.from_data(stream_id, flags, data)
+        elif frame_type == FrameType.LEASE:
+            return LeaseFrame.from_data(stream_id, flags, data)
+        elif frame_type == FrameType.METADATA_PUSH:
+            return MetadataPushFrame.from_data(stream_id, flags, data, self.zero_copy)
         elif frame_type == FrameType.RESUME:
             return ResumeFrame.from_data(stream_id, flags, data)
         elif frame_type == FrameType.RESUME_OK:
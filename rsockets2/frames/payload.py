@@ -1,4 +1,4 @@
-from .common import FrameType, read_meta_data_length
+from .common import FrameType, read_meta_data_length, write_meta_data_length, read_data
 import struct
 import typing
 from .frame_abc import Frame_ABC
@@ -18,7 +18,7 @@ class Payload(Frame_ABC):
         self.payload = bytes(0)
 
     @classmethod
-    def from_data(cls, stream_id: int, flags: int, full_data: bytes):
+    def from_data(cls, stream_id: int, flags: int, full_data: bytes, zero_copy: bool = False):
         frame = Payload()
 
         data_read = 6
@@ -30,10 +30,11 @@ class Payload(Frame_ABC):
         if frame.meta_data_present:
             metaDataLength = read_meta_data_length(full_data, data_read)
             data_read += 3
-            frame.meta_data = full_data[data_read:(data_read + metaDataLength)]
+            frame.meta_data = read_data(
+                full_data, data_read, data_read + metaDataLength, zero_copy)
             data_read += metaDataLength
 
-        frame.payload = full_data[data_read:]
+        frame.payload = read_data(full_data, data_read, zero_copy=zero_copy)
         return frame
 
     def __len__(self):
@@ -46,19 +47,21 @@ class Payload(Frame_ABC):
         bufferSize += len(self.payload)
         return bufferSize
 
-    def to_bytes(self):
+    def header_length(self) -> int:
+        if len(self.meta_data) > 0:
+            return 9
+        return 6
+
+    def to_buffers(self, header_buffer: memoryview = None):
         if self.stream_id == 0:
             raise ValueError("Stream ID must be set!")
 
-        bufferSize = len(self)
+        header_length = self.header_length()
+        if header_buffer is None:
+            header_buffer = bytearray(header_length)
 
-        data = bytearray(bufferSize)
-
-        struct.pack_into(">I", data, 0, self.stream_id)
-        dataWritten = 4
         type_and_flags = FrameType.PAYLOAD << 10
-
-        if self.meta_data != None and len(self.meta_data) > 0:
+        if len(self.meta_data) > 0:
             type_and_flags |= (1 << 8)
         if self.next_present:
             type_and_flags |= (1 << 5)
@@ -66,32 +69,30 @@ class Payload(Frame_ABC):
             type_and_flags |= (1 << 6)
         if self.follows:
             type_and_flags |= (1 << 7)
-        type_and_flags = type_and_flags
-        struct.pack_into(">H", data, dataWritten, type_and_flags)
-        dataWritten += 2
+        struct.pack_into(">IH", header_buffer, 0,
+                         self.stream_id, type_and_flags)
 
+        buffers = [memoryview(header_buffer)[:header_length]]
         if len(self.meta_data) > 0:
-            meta_data_length = len(self.meta_data)
-            data[dataWritten] = meta_data_length >> 16 & 0xFF
-            dataWritten += 1
-            data[dataWritten] = meta_data_length >> 8 & 0xFF
-            dataWritten += 1
-            data[dataWritten] = meta_data_length & 0xFF
-            dataWritten += 1
-            data[dataWritten:(dataWritten + meta_data_length)] = self.meta_data
-            dataWritten += meta_data_length
-
-        data[dataWritten:] = self.payload
-        return data
+            write_meta_data_length(header_buffer, 6, len(self.meta_data))
+            buffers.append(self.meta_data)
+        if len(self.payload) > 0:
+            buffers.append(self.payload)
+        return buffers
+
+    def to_bytes(self):
+        return bytearray().join(self.to_buffers())
 
     @staticmethod
     def from_fragments(fragments: []):
         frame = Payload()
         frame.stream_id = fragments[0].stream_id
-        frame.next_present = fragments[0].next_present
-        frame.complete = fragments[0].complete
-        for fragment in fragments:
-            frame.meta_data += fragment.meta_data
-            frame.payload += fragment.payload
+        frame.next_present = any(
+            fragment.next_present for fragment in fragments)
+        frame.complete = fragments[-1].complete
+        frame.meta_data = b''.join(
+            fragment.meta_data for fragment in fragments)
+        frame.payload = b''.join(fragment.payload for fragment in fragments)
         if len(frame.meta_data) > 0:
             frame.meta_data_present = True
+        return frame
@@ -0,0 +1,86 @@
+from .common import FrameType, read_meta_data_length, write_meta_data_length, read_data
+import struct
+from .frame_abc import Frame_ABC
+from abc import abstractmethod
+
+
+class RequestChannel(Frame_ABC):
+
+    def __init__(self):
+        super().__init__()
+
+        self.meta_data_present = False
+        self.follows = False
+        self.complete = False
+        self.initial_request = 1
+        self.meta_data = None
+        self.request_data = None
+
+    @classmethod
+    def from_data(cls, stream_id: int, flags: int, full_data: bytes, zero_copy: bool = False):
+        frame = RequestChannel()
+
+        data_read = 6
+        frame.stream_id = stream_id
+        frame.meta_data_present = flags >> 8 & 1 == 1
+        frame.follows = flags >> 7 & 1 == 1
+        frame.complete = flags >> 6 & 1 == 1
+
+        frame.initial_request, = struct.unpack_from(">I", full_data, data_read)
+        data_read += 4
+
+        if frame.meta_data_present:
+            metaDataLength = read_meta_data_length(full_data, data_read)
+            data_read += 3
+            frame.meta_data = read_data(
+                full_data, data_read, data_read + metaDataLength, zero_copy)
+            data_read += metaDataLength
+
+        frame.request_data = read_data(full_data, data_read, zero_copy=zero_copy)
+        return frame
+
+    def __len__(self):
+        bufferSize = 6 + 4
+
+        if self.meta_data != None:
+            bufferSize += 3
+            bufferSize += len(self.meta_data)
+        if self.request_data != None:
+            bufferSize += len(self.request_data)
+        return bufferSize
+
+    def header_length(self) -> int:
+        if self.meta_data != None:
+            return 13
+        return 10
+
+    def to_buffers(self, header_buffer: memoryview = None):
+        if self.stream_id == 0:
+            raise ValueError("Stream ID must be set!")
+
+        header_length = self.header_length()
+        if header_buffer is None:
+            header_buffer = bytearray(header_length)
+
+        type_and_flags = FrameType.REQUEST_CHANNEL << 10
+        if self.meta_data != None:
+            type_and_flags |= (1 << 8)
+        if self.follows:
+            type_and_flags |= (1 << 7)
+        if self.complete:
+            type_and_flags |= (1 << 6)
+        struct.pack_into(">IH", header_buffer, 0,
+                         self.stream_id, type_and_flags)
+        struct.pack_into(">I", header_buffer, 6, self.initial_request)
+
+        buffers = [memoryview(header_buffer)[:header_length]]
+        if self.meta_data != None:
+            write_meta_data_length(header_buffer, 10, len(self.meta_data))
+            if len(self.meta_data) > 0:
+                buffers.append(self.meta_data)
+        if self.request_data != None and len(self.request_data) > 0:
+            buffers.append(self.request_data)
+        return buffers
+
+    def to_bytes(self):
+        return bytearray().join(self.to_buffers())
@@ -1,4 +1,4 @@
-from .common import FrameType, read_meta_data_length
+from .common import FrameType, read_meta_data_length, write_meta_data_length, read_data
 import struct
 from .frame_abc import Frame_ABC
 from abc import abstractmethod
@@ -11,23 +11,26 @@ class RequestFNF(Frame_ABC):
         super().__init__()
 
         self.meta_data_present = False
+        self.follows = False
         self.meta_data = None
         self.request_data = None
 
     @classmethod
-    def from_data(cls, stream_id: int, flags: int, full_data: bytes):
+    def from_data(cls, stream_id: int, flags: int, full_data: bytes, zero_copy: bool = False):
         frame = RequestFNF()
 
         data_read = 6
         frame.stream_id = stream_id
         frame.meta_data_present = flags >> 8 & 1 == 1
+        frame.follows = flags >> 7 & 1 == 1
         if frame.meta_data_present:
             metaDataLength = read_meta_data_length(full_data, data_read)
             data_read += 3
-            frame.meta_data = full_data[data_read:(data_read + metaDataLength)]
+            frame.meta_data = read_data(
+                full_data, data_read, data_read + metaDataLength, zero_copy)
             data_read += metaDataLength
 
-        frame.request_data = full_data[data_read:]
+        frame.request_data = read_data(full_data, data_read, zero_copy=zero_copy)
         return frame
 
     def __len__(self):
@@ -41,31 +44,35 @@ class RequestFNF(Frame_ABC):
 
         return bufferSize
 
-    def to_bytes(self):
+    def header_length(self) -> int:
+        if self.meta_data != None:
+            return 9
+        return 6
+
+    def to_buffers(self, header_buffer: memoryview = None):
         if self.stream_id == 0:
             raise ValueError("Stream ID must be set!")
-        
-        data = bytearray(len(self))
 
-        struct.pack_into(">I", data, 0, self.stream_id)
-        dataWritten = 4
+        header_length = self.header_length()
+        if header_buffer is None:
+            header_buffer = bytearray(header_length)
+
         type_and_flags = FrameType.REQUEST_FNF << 10
         if self.meta_data != None:
             type_and_flags |= (1 << 8)
-        type_and_flags = type_and_flags
-        struct.pack_into(">H", data, dataWritten, type_and_flags)
-        dataWritten += 2
+        if self.follows:
+            type_and_flags |= (1 << 7)
+        struct.pack_into(">IH", header_buffer, 0,
+                         self.stream_id, type_and_flags)
 
+        buffers = [memoryview(header_buffer)[:header_length]]
         if self.meta_data != None:
-            meta_data_length = len(self.meta_data)
-            data[dataWritten] = meta_data_length >> 16 & 0xFF
-            dataWritten += 1
-            data[dataWritten] = meta_data_length >> 8 & 0xFF
-            dataWritten += 1
-            data[dataWritten] = meta_data_length & 0xFF
-            dataWritten += 1
-            data[dataWritten:(dataWritten + meta_data_length)] = self.meta_data
-            dataWritten += meta_data_length
-
-        data[dataWritten:] = self.request_data
-        return data
+            write_meta_data_length(header_buffer, 6, len(self.meta_data))
+            if len(self.meta_data) > 0:
+                buffers.append(self.meta_data)
+        if self.request_data != None and len(self.request_data) > 0:
+            buffers.append(self.request_data)
+        return buffers
+
+    def to_bytes(self):
+        return bytearray().join(self.to_buffers())
@@ -6,6 +6,8 @@ from abc import abstractmethod
 
 class RequestNFrame(Frame_ABC):
 
+    max_n = 2_147_483_647
+
     def __init__(self):
         super().__init__()
 
@@ -17,7 +19,7 @@ class RequestNFrame(Frame_ABC):
 
         data_read = 6
         frame.stream_id = stream_id
-        frame.n = struct.unpack_from(">I", full_data, data_read)
+        frame.n, = struct.unpack_from(">I", full_data, data_read)
         return frame
 
     def __len__(self):
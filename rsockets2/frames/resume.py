@@ -75,8 +75,8 @@ class ResumeFrame(Frame_ABC):
 
         data_read += 6
 
-        frame.resume_identification_token = full_data[data_read:(
-            data_read + token_length)]
+        frame.resume_identification_token = bytes(full_data[data_read:(
+            data_read + token_length)])
 
         data_read += token_length
 
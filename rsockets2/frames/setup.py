@@ -1,4 +1,4 @@
-from .common import FrameType, read_meta_data_length
+from .common import FrameType, read_meta_data_length, write_meta_data_length
 import struct
 from .frame_abc import Frame_ABC
 from abc import abstractmethod
@@ -51,33 +51,41 @@ class SetupFrame(Frame_ABC):
             frame.honors_lease = True
 
         if flags >> 7 & 1 == 1:
-            token_length = struct.unpack_from(">H", full_data, data_read)
+            token_length, = struct.unpack_from(">H", full_data, data_read)
             data_read += 2
-            frame.resume_identification_token = full_data[data_read:(
-                data_read + token_length)]
+            frame.resume_identification_token = bytes(full_data[data_read:(
+                data_read + token_length)])
             data_read += token_length
 
         mime_length = int(full_data[data_read])
         data_read += 1
-        frame.meta_data_mime_type = full_data[data_read:(
-            data_read + mime_length)].decode('US-ASCII')
+        frame.meta_data_mime_type = bytes(full_data[data_read:(
+            data_read + mime_length)]).decode('US-ASCII')
         data_read += mime_length
         mime_length = int(full_data[data_read])
         data_read += 1
-        frame.data_mime_type = full_data[data_read:(
-            data_read + mime_length)].decode('US-ASCII')
+        frame.data_mime_type = bytes(full_data[data_read:(
+            data_read + mime_length)]).decode('US-ASCII')
 
         if flags >> 8 & 1 == 1:
             metaDataLength = read_meta_data_length(full_data, data_read)
             data_read += 3
-            frame.meta_data = full_data[data_read:(data_read + metaDataLength)]
+            frame.meta_data = bytes(
+                full_data[data_read:(data_read + metaDataLength)])
             data_read += metaDataLength
 
-        frame.setup_payload = full_data[data_read:]
+        frame.setup_payload = bytes(full_data[data_read:])
 
         return frame
 
     def __len__(self):
+        bufferSize = self.header_length()
+        if self.meta_data != None:
+            bufferSize += len(self.meta_data)
+        bufferSize += len(self.setup_payload)
+        return bufferSize
+
+    def header_length(self) -> int:
         bufferSize = 18
         if self.resume_identification_token != None:
             bufferSize += 2
@@ -88,13 +96,15 @@ class SetupFrame(Frame_ABC):
         bufferSize += 1  # Mime Length Data
         if self.data_mime_type != None:
             bufferSize += len(self.data_mime_type)
-        bufferSize += len(self.setup_payload)
+        if self.meta_data != None:
+            bufferSize += 3
         return bufferSize
 
-    def to_bytes(self):
-        bufferSize = len(self)
-
-        data = bytearray(bufferSize)
+    def to_buffers(self, header_buffer: memoryview = None):
+        header_length = self.header_length()
+        if header_buffer is None:
+            header_buffer = bytearray(header_length)
+        data = header_buffer
 
         struct.pack_into(">I", data, 0, 0)
         dataWritten = 4
@@ -105,7 +115,6 @@ class SetupFrame(Frame_ABC):
             type_and_flags |= (1 << 7)
         if self.honors_lease == True:
             type_and_flags |= (1 << 6)
-        type_and_flags = type_and_flags
         struct.pack_into(">H", data, dataWritten, type_and_flags)
         dataWritten += 2
         struct.pack_into(">HH", data, dataWritten,
@@ -137,7 +146,14 @@ class SetupFrame(Frame_ABC):
              ] = self.data_mime_type
         dataWritten += mime_data_length
 
-        data[dataWritten:(dataWritten + len(self.setup_payload))
-             ] = self.setup_payload
+        buffers = [memoryview(header_buffer)[:header_length]]
+        if self.meta_data != None:
+            write_meta_data_length(data, dataWritten, len(self.meta_data))
+            if len(self.meta_data) > 0:
+                buffers.append(self.meta_data)
+        if len(self.setup_payload) > 0:
+            buffers.append(self.setup_payload)
+        return buffers
 
-        return data
+    def to_bytes(self):
+        return bytearray().join(self.to_buffers())
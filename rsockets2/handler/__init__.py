@@ -1,2 +1,3 @@
 from .request_response import request_response_pipe
 from .request_stream import request_stream_pipe
+from .flow_control import FlowControlledSender, BufferOverflowError
@@ -0,0 +1,131 @@
+from collections import deque
+import threading
+
+import rsockets2.frames as frames
+from ..common import OverflowStrategy
+from ..connection import AbstractConnection
+
+max_request_n = frames.RequestNFrame.max_n
+
+
+class BufferOverflowError(Exception):
+    pass
+
+
+class FlowControlledSender(object):
+    """
+        Sends the Payloads of one stream only as far as the peer requested them.
+        Items without demand are buffered up to buffer_limit (0 means unbounded), beyond that the overflow strategy applies.
+        A completing Payload is sent after all buffered items, errors are sent right away.
+        A request of 2^31 - 1 means unbounded demand.
+        Frames are queued on the connection outside the lock, in order, by one thread at a time,
+        so a blocking queue_frame never blocks request() on the recv thread.
+    """
+
+    def __init__(self, connection: AbstractConnection, initial_request: int,
+                 buffer_limit: int = 0, overflow_strategy: OverflowStrategy = OverflowStrategy.ERROR):
+        super().__init__()
+        self._connection = connection
+        self._demand = 0
+        self._buffer = deque()
+        self._buffer_limit = buffer_limit
+        self._overflow_strategy = overflow_strategy
+        self._pending_complete: frames.Payload = None
+        self._terminated = False
+        self._outgoing = deque()
+        self._emitting = False
+        self._lock = threading.Lock()
+        self.request(initial_request)
+
+    def request(self, n: int):
+        with self._lock:
+            if self._terminated == True:
+                return
+            if n >= max_request_n or self._demand + n >= max_request_n:
+                self._demand = max_request_n
+            else:
+                self._demand += n
+            self._drain()
+        self._emit()
+
+    def next(self, frame: frames.Payload):
+        with self._lock:
+            if self._terminated == True:
+                return
+            self._buffer.append(frame)
+            if self._buffer_limit > 0 and len(self._buffer) > self._buffer_limit:
+                if self._overflow_strategy == OverflowStrategy.DROP_OLDEST:
+                    self._buffer.popleft()
+                elif self._overflow_strategy == OverflowStrategy.LATEST:
+                    self._buffer.clear()
+                    self._buffer.append(frame)
+                else:
+                    self._buffer.clear()
+                    raise BufferOverflowError(
+                        "Stream buffer of {} items exceeded without demand of the requester".format(self._buffer_limit))
+            self._drain()
+        self._emit()
+
+    def complete(self, frame: frames.Payload):
+        with self._lock:
+            if self._terminated == True:
+                return
+            self._pending_complete = frame
+            self._drain()
+        self._emit()
+
+    def error(self, frame: frames.ErrorFrame):
+        with self._lock:
+            if self._terminated == True:
+                return
+            self._terminated = True
+            self._buffer.clear()
+            self._outgoing.append(frame)
+        self._emit()
+
+    def cancel(self):
+        with self._lock:
+            self._terminated = True
+            self._buffer.clear()
+
+    @property
+    def terminated(self) -> bool:
+        return self._terminated
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    def _drain(self):
+        """
+            Moves the frames the peer requested to the outgoing queue. Requires the lock.
+        """
+        while self._demand > 0 and len(self._buffer) > 0:
+            if self._demand != max_request_n:
+                self._demand -= 1
+            self._outgoing.append(self._buffer.popleft())
+        if len(self._buffer) == 0 and self._pending_complete != None:
+            self._terminated = True
+            self._outgoing.append(self._pending_complete)
+            self._pending_complete = None
+
+    def _emit(self):
+        with self._lock:
+            if self._emitting == True:
+                # The emitting thread picks up our frames
+                return
+            self._emitting = True
+        try:
+            while True:
+                with self._lock:
+                    if len(self._outgoing) == 0:
+                        self._emitting = False
+                        return
+                    outgoing = list(self._outgoing)
+                    self._outgoing.clear()
+                for frame in outgoing:
+                    self._connection.queue_frame(frame)
+        except BaseException:
+            with self._lock:
+                self._emitting = False
+            raise
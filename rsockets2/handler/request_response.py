@@ -51,9 +51,8 @@ def request_response_pipe(stream_id: int, connection: AbstractConnection):
 
     return rx.pipe(
         op.take_until(
-            connection.recv_observable_filter_type(frames.CancelFrame).pipe(
-                op.filter(lambda f: f.stream_id == stream_id),
-            ),
+            connection.stream_observable_filter_type(
+                stream_id, frames.CancelFrame),
 
         ),
         op.take_until(
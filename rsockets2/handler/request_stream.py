@@ -1,64 +1,107 @@
 
 import rx
 import rx.operators as op
+from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
 
 import rsockets2.frames as frames
 
+from ..common import OverflowStrategy
 from ..connection import AbstractConnection
+from .flow_control import FlowControlledSender, BufferOverflowError
 
 import logging
 
 log = logging.getLogger('rsockets2.handle.request_stream')
 
 
-def request_stream_pipe(stream_id: int, connection: AbstractConnection):
-    def on_next(value):
-        if isinstance(value, tuple):
-            meta_data = value[0]
-            data = value[1]
-        else:
-            meta_data = bytes(0)
-            data = value
-        answer = frames.Payload()
-        answer.stream_id = stream_id
-        answer.follows = False
-        answer.complete = False
-        answer.next_present = True
-        answer.payload = data
-        answer.meta_data = meta_data
-        connection.queue_frame(answer)
+def request_stream_pipe(stream_id: int, connection: AbstractConnection, initial_request: int = frames.RequestNFrame.max_n,
+                        buffer_limit: int = 0, overflow_strategy: OverflowStrategy = OverflowStrategy.ERROR):
+    """
+        Sends the items of the source as Payloads of the stream, honoring the initial_request
+        and later RequestNFrames of the peer. Items without demand are buffered (see FlowControlledSender).
+        A CancelFrame or ErrorFrame of the peer (the latter ends both directions of a channel)
+        or the destruction of the connection stops the source without sending anything.
+    """
 
-    def on_error(error):
-        log.debug(error, exc_info=True)
-        error_frame = frames.ErrorFrame()
-        error_frame.stream_id = stream_id
-        error_frame.error_code = frames.ErrorCodes.APPLICATION_ERROR
-        if isinstance(error, Exception):
-            error_frame.error_data = str(error).encode("ASCII")
-        else:
-            error_frame.error_data = error
-        connection.queue_frame(error_frame)
+    def _request_stream_pipe(source: rx.Observable) -> rx.Observable:
+        def subscribe(observer, scheduler=None):
+            sender = FlowControlledSender(
+                connection, initial_request, buffer_limit, overflow_strategy)
+            source_disposable = SingleAssignmentDisposable()
+            disposable = CompositeDisposable(source_disposable)
 
-    def on_completed():
-        answer = frames.Payload()
-        answer.stream_id = stream_id
-        answer.follows = False
-        answer.complete = True
-        answer.next_present = False
-        answer.payload = bytes(0)
-        answer.meta_data = bytes(0)
-        connection.queue_frame(answer)
+            def on_request_n(frame: frames.RequestNFrame):
+                sender.request(frame.n)
+                if sender.terminated == True:
+                    observer.on_completed()
 
-    return rx.pipe(
-        op.take_until(
-            connection.recv_observable_filter_type(frames.CancelFrame).pipe(
-                op.filter(lambda f: f.stream_id == stream_id),
-            )
-        ),
-        op.take_until(
-            connection.destroy_observable()
-        ),
-        op.filter(lambda value: value != None),
-        op.do_action(on_next=on_next, on_error=on_error,
-                     on_completed=on_completed)
-    )
+            def send_error(error):
+                log.debug(error, exc_info=True)
+                error_frame = frames.ErrorFrame()
+                error_frame.stream_id = stream_id
+                error_frame.error_code = frames.ErrorCodes.APPLICATION_ERROR
+                if isinstance(error, Exception):
+                    error_frame.error_data = str(error).encode("ASCII")
+                else:
+                    error_frame.error_data = error
+                sender.error(error_frame)
+
+            def on_next(value):
+                if value == None:
+                    return
+                if isinstance(value, tuple):
+                    meta_data = value[0]
+                    data = value[1]
+                else:
+                    meta_data = bytes(0)
+                    data = value
+                answer = frames.Payload()
+                answer.stream_id = stream_id
+                answer.follows = False
+                answer.complete = False
+                answer.next_present = True
+                answer.payload = data
+                answer.meta_data = meta_data
+                try:
+                    sender.next(answer)
+                except BufferOverflowError as error:
+                    disposable.dispose()
+                    send_error(error)
+                    observer.on_error(error)
+
+            def on_error(error):
+                disposable.dispose()
+                send_error(error)
+                observer.on_error(error)
+
+            def on_completed():
+                source_disposable.dispose()
+                answer = frames.Payload()
+                answer.stream_id = stream_id
+                answer.follows = False
+                answer.complete = True
+                answer.next_present = False
+                answer.payload = bytes(0)
+                answer.meta_data = bytes(0)
+                sender.complete(answer)
+                if sender.terminated == True:
+                    observer.on_completed()
+
+            def on_stop(_):
+                disposable.dispose()
+                sender.cancel()
+                observer.on_completed()
+
+            disposable.add(connection.stream_observable_filter_type(stream_id, frames.RequestNFrame).subscribe(
+                on_next=on_request_n))
+            disposable.add(connection.stream_observable(stream_id).pipe(
+                op.filter(lambda frame: isinstance(
+                    frame, (frames.CancelFrame, frames.ErrorFrame))),
+                op.merge(connection.destroy_observable()),
+                op.take(1)
+            ).subscribe(on_next=on_stop, on_completed=lambda: on_stop(None)))
+            source_disposable.disposable = source.subscribe_(
+                on_next, on_error, on_completed, scheduler)
+            return disposable
+        return rx.create(subscribe)
+    return _request_stream_pipe
@@ -0,0 +1,226 @@
+from .common import RSocketConfig
+from .transport import AbstractTransport
+from .rsocket_client import RSocketClient
+from .frames import ApplicationError
+import rx
+import rx.operators as op
+import rx.scheduler
+import logging
+import random
+import threading
+import time
+import typing
+
+
+class BalancedMember(object):
+    """
+        One endpoint of a LoadBalancedClient. latency is an EWMA of the time to the first response in ms,
+        the smoothed keepalive round trip time is used until the first request finished.
+    """
+
+    def __init__(self, transport: AbstractTransport):
+        super().__init__()
+        self.transport = transport
+        self.client: RSocketClient = None
+        self.outstanding = 0
+        self.latency: float = None
+        self.failures = 0
+        self.drained_until = 0.0
+        self._lock = threading.Lock()
+
+    def available(self, now: float) -> bool:
+        return self.client != None and self.drained_until <= now
+
+    def cost(self) -> float:
+        latency = self.latency
+        if latency == None and self.client != None:
+            latency = self.client.rtt_stats.smoothed
+        if latency == None:
+            latency = 0.0
+        return latency * (self.outstanding + 1)
+
+    def started(self):
+        with self._lock:
+            self.outstanding += 1
+
+    def finished(self):
+        with self._lock:
+            self.outstanding -= 1
+
+    def record_latency(self, latency: float, decay: float):
+        with self._lock:
+            if self.latency == None:
+                self.latency = latency
+            else:
+                self.latency = decay * latency + (1 - decay) * self.latency
+
+    def __repr__(self):
+        return "BalancedMember(transport={}, connected={}, outstanding={}, latency={}, failures={})".format(
+            self.transport, self.client != None, self.outstanding, self.latency, self.failures)
+
+
+class LoadBalancedClient(object):
+    """
+        Requester that spreads requests over RSocketClients connected to several endpoints.
+        Each request goes to the cheaper of two randomly picked members (power of two choices),
+        cost being the latency EWMA weighted by the outstanding requests.
+        After max_failures requests in a row failed with a connection error a member is drained for drain_time seconds,
+        ApplicationErrors of the peer count as answers. Lost connections are reconnected after drain_time.
+        Running requests are never moved.
+    """
+
+    def __init__(self,
+                 config: RSocketConfig,
+                 transports: typing.List[AbstractTransport],
+                 default_scheduler: rx.scheduler.scheduler.Scheduler = rx.scheduler.ThreadPoolScheduler(
+                     20),
+                 max_failures: int = 3,
+                 drain_time: float = 5.0,
+                 latency_decay: float = 0.3
+                 ):
+        super().__init__()
+        if len(transports) == 0:
+            raise ValueError("LoadBalancedClient requires at least one transport")
+        self._log = logging.getLogger("rsockets2.LoadBalancedClient")
+        self._config = config
+        self._scheduler = default_scheduler
+        self._max_failures = max_failures
+        self._drain_time = drain_time
+        self._latency_decay = latency_decay
+        self._members = [BalancedMember(transport)
+                         for transport in transports]
+        self._running = False
+
+    @property
+    def members(self) -> typing.List[BalancedMember]:
+        return list(self._members)
+
+    def open(self):
+        """
+            Connects all members. Fails only if no member could be connected, the others are retried in the background.
+        """
+        self._running = True
+        for member in self._members:
+            self._connect(member)
+        if not any(member.client != None for member in self._members):
+            self.close()
+            raise ConnectionError("Could not connect to any endpoint")
+
+    def close(self):
+        self._running = False
+        for member in self._members:
+            client = member.client
+            member.client = None
+            if client != None:
+                client.close()
+
+    def request_response(self, meta_data, data) -> rx.Observable:
+        return self._balanced(lambda client: client.request_response(meta_data, data))
+
+    def request_stream(self, meta_data, data, window: int = None) -> rx.Observable:
+        return self._balanced(lambda client: client.request_stream(meta_data, data, window))
+
+    def request_channel(self, meta_data, data, outbound: rx.Observable = None, window: int = None) -> rx.Observable:
+        return self._balanced(lambda client: client.request_channel(meta_data, data, outbound, window))
+
+    def fire_and_forget(self, meta_data, data) -> rx.Observable:
+        return self._balanced(lambda client: client.fire_and_forget(meta_data, data))
+
+    def metadata_push(self, meta_data) -> rx.Observable:
+        """
+            Sent to every connected member.
+        """
+        return rx.defer(lambda x: rx.merge(*[client.metadata_push(meta_data) for client in self._connected_clients()]))
+
+    def _connected_clients(self) -> typing.List[RSocketClient]:
+        return [member.client for member in self._members if member.client != None]
+
+    def _select(self) -> BalancedMember:
+        now = time.monotonic()
+        candidates = [
+            member for member in self._members if member.available(now)]
+        if len(candidates) == 0:
+            raise ConnectionError("No healthy endpoint available")
+        if len(candidates) == 1:
+            return candidates[0]
+        first, second = random.sample(candidates, 2)
+        if first.cost() <= second.cost():
+            return first
+        return second
+
+    def _select_client(self) -> typing.Tuple[BalancedMember, RSocketClient]:
+        # A connection may be lost between selecting a member and reading its client
+        for _ in range(len(self._members)):
+            member = self._select()
+            client = member.client
+            if client != None:
+                return member, client
+        raise ConnectionError("No healthy endpoint available")
+
+    def _balanced(self, request: typing.Callable[[RSocketClient], rx.Observable]) -> rx.Observable:
+        def handle():
+            member, client = self._select_client()
+            started = time.monotonic()
+            answered = False
+
+            def on_answer(item=None):
+                nonlocal answered
+                if answered == False:
+                    answered = True
+                    member.record_latency(
+                        (time.monotonic() - started) * 1000.0, self._latency_decay)
+                    member.failures = 0
+
+            def on_error(error: Exception):
+                if isinstance(error, ApplicationError):
+                    # The endpoint is healthy, the handler rejected the request
+                    on_answer()
+                elif isinstance(error, OSError):
+                    self._request_failed(member, error)
+
+            member.started()
+            return request(client).pipe(
+                op.do_action(on_next=on_answer,
+                             on_error=on_error,
+                             on_completed=on_answer),
+                op.finally_action(member.finished)
+            )
+        return rx.defer(lambda x: handle())
+
+    def _request_failed(self, member: BalancedMember, error: Exception):
+        member.failures += 1
+        if member.failures >= self._max_failures:
+            self._log.warning("Draining {} for {}s after {} failed requests. Last error: {}".format(
+                member.transport, self._drain_time, member.failures, error))
+            member.failures = 0
+            member.drained_until = time.monotonic() + self._drain_time
+
+    def _connect(self, member: BalancedMember):
+        if self._running == False:
+            return
+        client = RSocketClient(
+            self._config, member.transport, self._scheduler)
+        try:
+            client.open()
+        except Exception as error:
+            self._log.warning("Connecting to {} failed. Retrying in {}s: {}".format(
+                member.transport, self._drain_time, error))
+            self._schedule_reconnect(member)
+            return
+        member.failures = 0
+        member.latency = None
+        member.client = client
+        client._connection.destroy_observable().subscribe(
+            on_completed=lambda: self._connection_lost(member, client))
+
+    def _connection_lost(self, member: BalancedMember, client: RSocketClient):
+        if member.client is not client or self._running == False:
+            return
+        self._log.warning("Connection to {} lost. Reconnecting in {}s".format(
+            member.transport, self._drain_time))
+        member.client = None
+        self._schedule_reconnect(member)
+
+    def _schedule_reconnect(self, member: BalancedMember):
+        self._scheduler.schedule_relative(
+            self._drain_time, lambda scheduler, state: self._connect(member))
@@ -31,6 +31,7 @@ class RMessageClient(object):
             self.encoder = json_encoder
 
         self._stream_handler = {}
+        self._channel_handler = {}
         self._request_handler = {}
         self._fire_and_forget_handler = {}
 
@@ -48,6 +49,9 @@ class RMessageClient(object):
     def register_request_handler(self, route: str, stream_creater: typing.Callable[[typing.Union[bytes, typing.Dict]], rx.Observable], try_decode_request: bool = True):
         self._request_handler[route] = [stream_creater, try_decode_request]
 
+    def register_channel_handler(self, route: str, channel_creater: typing.Callable[[typing.Union[bytes, typing.Dict], rx.Observable], rx.Observable], try_decode_request: bool = True):
+        self._channel_handler[route] = [channel_creater, try_decode_request]
+
     def register_fire_and_forget_handler(self, route: str, handler: typing.Callable[[typing.Union[bytes, typing.Dict]], rx.Observable], try_decode_request: bool = True):
         self._fire_and_forget_handler[route] = [handler, try_decode_request]
 
@@ -59,13 +63,23 @@ class RMessageClient(object):
             def decoder(x): return x
         return self.rsocket.request_response(meta_data=self._encode_route_name(route), data=self.encoder(data)).pipe(op.map(lambda response: decoder(response)))
 
-    def request_stream(self, route: str, data: typing.Union[bytes, typing.Dict] = None, try_decode: bool = True) -> rx.Observable:
+    def request_stream(self, route: str, data: typing.Union[bytes, typing.Dict] = None, try_decode: bool = True, window: int = None) -> rx.Observable:
+        data = self._check_data_none(data)
+        if try_decode == True:
+            decoder = self.decoder
+        else:
+            def decoder(x): return x
+        return self.rsocket.request_stream(meta_data=self._encode_route_name(route), data=self.encoder(data), window=window).pipe(op.map(lambda item: decoder(item)))
+
+    def request_channel(self, route: str, data: typing.Union[bytes, typing.Dict] = None, outbound: rx.Observable = None, try_decode: bool = True, window: int = None) -> rx.Observable:
         data = self._check_data_none(data)
         if try_decode == True:
             decoder = self.decoder
         else:
             def decoder(x): return x
-        return self.rsocket.request_stream(meta_data=self._encode_route_name(route), data=self.encoder(data)).pipe(op.map(lambda item: decoder(item)))
+        if outbound != None:
+            outbound = outbound.pipe(op.map(lambda item: self.encoder(item)))
+        return self.rsocket.request_channel(meta_data=self._encode_route_name(route), data=self.encoder(data), outbound=outbound, window=window).pipe(op.map(lambda item: decoder(item)))
 
     def fire_and_forget(self, route: str, data: typing.Union[bytes, typing.Dict] = None) -> rx.Observable:
         data = self._check_data_none(data)
@@ -74,6 +88,7 @@ class RMessageClient(object):
     def _setup_handler(self):
         self.rsocket.on_fire_and_forget = self._on_fire_and_forget
         self.rsocket.on_request_stream = self._on_request_stream
+        self.rsocket.on_request_channel = self._on_request_channel
         self.rsocket.on_request_response = self._on_request_response
 
     def _on_fire_and_forget(self, frame: frames.RequestFNF):
@@ -105,6 +120,17 @@ class RMessageClient(object):
         else:
             return rx.throw(Exception("Unknown Destination '{}'".format(route_name)))
 
+    def _on_request_channel(self, frame: frames.RequestChannel, inbound: rx.Observable):
+        route_name = self._get_route_name(frame.meta_data)
+        if route_name in self._channel_handler:
+            handler = self._channel_handler[route_name]
+            if handler[1] == True:
+                return handler[0](self.decoder(frame.request_data), inbound.pipe(op.map(self.decoder))).pipe(op.map(lambda x: self.encoder(x)))
+            else:
+                return handler[0](frame.request_data, inbound).pipe(op.map(lambda x: self.encoder(x)))
+        else:
+            return rx.throw(Exception("Unknown Destination '{}'".format(route_name)))
+
     def _on_request_response(self, frame: frames.RequestResponse):
         route_name = self._get_route_name(frame.meta_data)
         if route_name in self._request_handler:
@@ -119,7 +145,7 @@ class RMessageClient(object):
     def _get_route_name(self, meta_data: bytes):
 
         routeLength = meta_data[0]
-        return meta_data[1:(routeLength + 1)].decode('UTF-8')
+        return bytes(meta_data[1:(routeLength + 1)]).decode('UTF-8')
 
     def _encode_route_name(self, route_name: str) -> bytes:
         meta_data = bytearray(route_name.encode('ASCII'))
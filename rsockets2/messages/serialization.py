@@ -7,7 +7,9 @@ def json_decoder(json_string) -> typing.Dict:
         return {}
     if len(json_string) == 0:
         return {}
-    return json.loads(json_string, encoding='UTF-8')
+    if isinstance(json_string, memoryview):
+        json_string = json_string.tobytes()
+    return json.loads(json_string)
 
 
 def json_encoder(object_dict: typing.Dict):
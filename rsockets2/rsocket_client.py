@@ -1,6 +1,6 @@
 from .common import RSocketConfig
-from .transport import AbstractTransport
-from .connection import ClientConnection, ResumableClientConnection
+from .transport import AbstractTransport, Reactor, ReactorPool
+from .connection import ClientConnection, ResumableClientConnection, ReactorClientConnection, RttStats, SendBatchStats, RequesterLease, ResponderLease, ResponderLoad, load_based_lease_strategy
 from .handler import request_response_pipe, request_stream_pipe
 import rsockets2.executor as executors
 import rsockets2.frames as frames
@@ -8,6 +8,7 @@ import rx
 import rx.operators as op
 import rx.scheduler
 import logging
+import threading
 import typing
 
 
@@ -17,12 +18,20 @@ class RSocketClient(object):
                  config: RSocketConfig,
                  transport: AbstractTransport,
                  default_scheduler: rx.scheduler.scheduler.Scheduler = rx.scheduler.ThreadPoolScheduler(
-                     20)
+                     20),
+                 reactor: typing.Union[Reactor, ReactorPool] = None
                  ):
         super().__init__()
 
         self._log = logging.getLogger("rsockets2.RSocketClient")
-        if config.resume_support == True:
+        self._config = config
+        if reactor != None:
+            if config.resume_support == True:
+                raise ValueError(
+                    "Resumable connections can not be driven by a reactor")
+            self._connection = ReactorClientConnection(
+                transport, config, reactor)
+        elif config.resume_support == True:
             self._connection = ResumableClientConnection(
                 transport, config, default_scheduler)
         else:
@@ -32,17 +41,41 @@ class RSocketClient(object):
             frames.RequestResponse], rx.Observable] = None
         self._on_request_stream: typing.Callable[[
             frames.RequestStream], rx.Observable] = None
+        self._on_request_channel: typing.Callable[[
+            frames.RequestChannel, rx.Observable], rx.Observable] = None
         self.on_fire_and_forget: typing.Callable[[
             frames.RequestFNF], None] = None
+        self.on_metadata_push: typing.Callable[[
+            frames.MetadataPushFrame], None] = None
 
         self._scheduler = default_scheduler
 
+        self._active_requests = 0
+        self._active_requests_lock = threading.Lock()
+        self._requester_lease: RequesterLease = None
+        self._responder_lease: ResponderLease = None
+        self._lease_issuing = None
+        if config.honors_lease == True:
+            self._requester_lease = RequesterLease(
+                config.lease_wait_timeout, default_scheduler, config.lease_first_wait_timeout)
+            strategy = config.lease_strategy
+            if strategy == None:
+                strategy = load_based_lease_strategy(
+                    config.lease_time_to_live, config.lease_max_requests, config.lease_max_send_queue_depth)
+            self._responder_lease = ResponderLease(strategy)
+
         self._setup_request_handler()
 
     def open(self):
         self._connection.open()
+        if self._responder_lease != None:
+            self._issue_lease()
+            self._lease_issuing = self._scheduler.schedule_periodic(
+                self._config.lease_time_to_live / 1000.0, lambda state: self._issue_lease())
 
     def close(self):
+        if self._lease_issuing != None:
+            self._lease_issuing.dispose()
         self._connection.close()
 
     def request_response(self, meta_data, data) -> rx.Observable:
@@ -61,15 +94,25 @@ class RSocketClient(object):
             return executors.request_response_executor(self._connection, request).pipe(
                 op.subscribe_on(self._scheduler),
                 op.observe_on(self._scheduler),
-                self._errors_and_teardown(request.stream_id)
+                self._errors_and_teardown(
+                    request.stream_id, cancel_on_dispose=True)
             )
-        return rx.defer(lambda x: handle())
+        return self._leased(rx.defer(lambda x: handle()))
+
+    def request_stream(self, meta_data, data, window: int = None) -> rx.Observable:
+        """
+            The server may send up to window (default: config.stream_window) items that have not been
+            processed by the subscriber yet. More items are requested as the subscriber consumes them.
+        """
+        if window == None:
+            window = self._config.stream_window
 
-    def request_stream(self, meta_data, data) -> rx.Observable:
         def handle():
             request = frames.RequestStream()
             request.stream_id = self._connection.get_new_stream_id()
-            request.initial_request = 100000
+            request.initial_request = window
+            demand = executors.StreamDemand(
+                self._connection, request.stream_id, window, self._config.stream_replenish_fraction)
             if isinstance(meta_data, str):
                 request.meta_data = meta_data.encode('UTF-8')
             else:
@@ -80,11 +123,50 @@ class RSocketClient(object):
                 request.request_data = data
 
             return executors.request_stream_executor(self._connection, request).pipe(
+                op.finally_action(demand.stop),
                 op.subscribe_on(self._scheduler),
                 op.observe_on(self._scheduler),
-                self._errors_and_teardown(request.stream_id)
+                self._errors_and_teardown(
+                    request.stream_id, cancel_on_dispose=True),
+                executors.replenish_on_consumption(demand)
             )
-        return rx.defer(lambda x: handle())
+        return self._leased(rx.defer(lambda x: handle()))
+
+    def request_channel(self, meta_data, data, outbound: rx.Observable = None, window: int = None) -> rx.Observable:
+        """
+            meta_data and data are the first payload sent to the server, the items of outbound (bytes or (bytes, bytes) as
+            (meta_data, data)) follow as far as the server requests them. Emits the data the server sends, flow controlled like request_stream.
+        """
+        if window == None:
+            window = self._config.stream_window
+
+        def handle():
+            request = frames.RequestChannel()
+            request.stream_id = self._connection.get_new_stream_id()
+            request.initial_request = window
+            request.complete = outbound == None
+            demand = executors.StreamDemand(
+                self._connection, request.stream_id, window, self._config.stream_replenish_fraction)
+            if isinstance(meta_data, str):
+                request.meta_data = meta_data.encode('UTF-8')
+            else:
+                request.meta_data = meta_data
+            if isinstance(data, str):
+                request.request_data = data.encode('UTF-8')
+            else:
+                request.request_data = data
+
+            return executors.request_channel_executor(
+                self._connection, request, outbound,
+                self._config.stream_buffer_limit, self._config.stream_overflow_strategy).pipe(
+                op.finally_action(demand.stop),
+                op.subscribe_on(self._scheduler),
+                op.observe_on(self._scheduler),
+                self._errors_and_teardown(
+                    request.stream_id, cancel_on_dispose=True),
+                executors.replenish_on_consumption(demand)
+            )
+        return self._leased(rx.defer(lambda x: handle()))
 
     def fire_and_forget(self, meta_data, data) -> rx.Observable:
         def action():
@@ -94,79 +176,211 @@ class RSocketClient(object):
             frame.stream_id = self._connection.get_new_stream_id()
             self._connection.queue_frame(frame)
             return rx.from_callable(lambda: action(), scheduler=self._scheduler).pipe(self._errors_and_teardown(frame.stream_id), op.ignore_elements())
+        return self._leased(rx.defer(lambda x: action()))
+
+    def metadata_push(self, meta_data) -> rx.Observable:
+        """
+            Connection level meta data. Does not use a stream id, the server neither answers nor acknowledges it.
+        """
+        def action():
+            frame = frames.MetadataPushFrame()
+            if isinstance(meta_data, str):
+                frame.meta_data = meta_data.encode('UTF-8')
+            else:
+                frame.meta_data = meta_data
+            self._connection.queue_frame(frame)
+            return rx.empty()
         return rx.defer(lambda x: action())
 
     def _setup_request_handler(self):
+        # Requests reach the listeners through the scheduler, see _inbound_stream
+        self._connection.hold_back_inbound_streams = True
         def on_next(frame: frames.Frame_ABC):
             if isinstance(frame, frames.RequestFNF):
                 self._fire_and_forget_listener(frame)
             elif isinstance(frame, frames.RequestResponse):
-                self._request_response_listener(frame)
+                self._inbound_stream(frame, self._request_response_listener)
             elif isinstance(frame, frames.RequestStream):
-                self._request_stream_listener(frame)
+                self._inbound_stream(frame, self._request_stream_listener)
+            elif isinstance(frame, frames.RequestChannel):
+                self._inbound_stream(frame, self._request_channel_listener)
+            elif isinstance(frame, frames.MetadataPushFrame):
+                self._metadata_push_listener(frame)
+            elif isinstance(frame, frames.LeaseFrame):
+                self._lease_listener(frame)
             else:
                 pass
 
         self._connection.recv_observable().pipe(op.observe_on(self._scheduler)
                                                 ).subscribe(on_next=lambda x: on_next(x))
 
+    def _inbound_stream(self, request, listener):
+        # Cancel and RequestN frames that arrived before the listener subscribed are held back until now
+        try:
+            listener(request)
+        finally:
+            self._connection.release_inbound_stream(request.stream_id)
+
     def _request_response_listener(self, request):
+        if self._reject_without_lease(request) == True:
+            return
         if self.on_request_response == None:
             self._log.debug(
                 "Received Request Response but no handler registered!")
             self._connection.queue_frame(frames.ErrorFrame.from_info(
                 "No Request Response Handler!", stream_id=request.stream_id))
+        self._request_started()
         rx.from_iterable([request], self._scheduler).pipe(
             op.flat_map(lambda x: self._on_request_response(
                 x).pipe(op.observe_on(self._scheduler))),
             request_response_pipe(
-                request.stream_id, self._connection)
+                request.stream_id, self._connection),
+            op.finally_action(self._request_finished)
         ).subscribe(on_error=lambda x: self._log.debug("Error while executing request response handler", exc_info=True), scheduler=self._scheduler)
 
     def _request_stream_listener(self, request):
+        if self._reject_without_lease(request) == True:
+            return
         if self._on_request_stream == None:
             self._log.debug(
                 "Received Request Stream but no handler registered!")
             self._connection.queue_frame(frames.ErrorFrame.from_info(
                 "No Request Stream Handler!", stream_id=request.stream_id))
+        self._request_started()
         rx.from_iterable([request], self._scheduler).pipe(
             op.flat_map(lambda x: self._on_request_stream(x)),
             op.observe_on(self._scheduler),
             request_stream_pipe(
-                request.stream_id, self._connection)
+                request.stream_id, self._connection, request.initial_request,
+                self._config.stream_buffer_limit, self._config.stream_overflow_strategy),
+            op.finally_action(self._request_finished)
         ).subscribe(on_error=lambda x: self._log.debug("Error while executing request stream handler", exc_info=True), scheduler=self._scheduler)
 
+    def _request_channel_listener(self, request):
+        if self._reject_without_lease(request) == True:
+            return
+        if self._on_request_channel == None:
+            self._log.debug(
+                "Received Request Channel but no handler registered!")
+            self._connection.queue_frame(frames.ErrorFrame.from_info(
+                "No Request Channel Handler!", stream_id=request.stream_id))
+            return
+        inbound = executors.request_channel_inbound(
+            self._connection, request, self._config.stream_window,
+            self._config.stream_replenish_fraction, self._scheduler)
+        self._request_started()
+        rx.from_iterable([request], self._scheduler).pipe(
+            op.flat_map(lambda x: self._on_request_channel(x, inbound)),
+            op.observe_on(self._scheduler),
+            request_stream_pipe(
+                request.stream_id, self._connection, request.initial_request,
+                self._config.stream_buffer_limit, self._config.stream_overflow_strategy),
+            op.finally_action(self._request_finished)
+        ).subscribe(on_error=lambda x: self._log.debug("Error while executing request channel handler", exc_info=True), scheduler=self._scheduler)
+
     def _fire_and_forget_listener(self, request):
+        if self._responder_lease != None and self._responder_lease.try_use() == False:
+            self._log.debug("Dropping Fire and Forget without lease")
+            return
         if self.on_fire_and_forget == None:
             self._log.debug(
                 "Received Fire and Forget but no handler registered!")
+        self._request_started()
         rx.from_iterable([request], self._scheduler).pipe(
-            op.do_action(on_next=self.on_fire_and_forget)
+            op.do_action(on_next=self.on_fire_and_forget),
+            op.finally_action(self._request_finished)
         ).subscribe(on_error=lambda x: self._log.debug("Error while executing fire and forget handler", exc_info=True), scheduler=self._scheduler)
 
-    def _errors_and_teardown(self, stream_id):
+    def _lease_listener(self, frame):
+        if self._requester_lease != None:
+            self._requester_lease.update(frame)
+
+    def _leased(self, request: rx.Observable) -> rx.Observable:
+        if self._requester_lease == None:
+            return request
+        return self._requester_lease.acquire().pipe(
+            op.flat_map(lambda _: request)
+        )
+
+    def _reject_without_lease(self, request) -> bool:
+        if self._responder_lease == None or self._responder_lease.try_use() == True:
+            return False
+        self._log.debug(
+            "Rejecting request on stream {} without lease".format(request.stream_id))
+        self._connection.queue_frame(frames.ErrorFrame.from_info(
+            "Lease exhausted", request.stream_id, frames.ErrorCodes.REJECTED))
+        return True
+
+    def _issue_lease(self):
+        with self._active_requests_lock:
+            active_requests = self._active_requests
+        frame = self._responder_lease.issue(ResponderLoad(
+            self._connection.send_queue_depth, active_requests))
+        if frame != None:
+            self._connection.queue_frame(frame)
+
+    def _request_started(self):
+        with self._active_requests_lock:
+            self._active_requests += 1
+
+    def _request_finished(self):
+        with self._active_requests_lock:
+            self._active_requests -= 1
+
+    def _metadata_push_listener(self, frame):
+        if self.on_metadata_push == None:
+            self._log.debug(
+                "Received Metadata Push but no handler registered!")
+            return
+        try:
+            self.on_metadata_push(frame)
+        except Exception:
+            self._log.debug(
+                "Error while executing metadata push handler", exc_info=True)
+
+    def _errors_and_teardown(self, stream_id, cancel_on_dispose=False):
 
         def _wrap_throw_error_frame(frame: frames.ErrorFrame):
-            raise Exception(
-                'Application Error. Message: "{}"'.format(frame.error_data))
+            raise frame.to_exception()
 
-        application_error = self._connection.recv_observable_filter_type(frames.ErrorFrame).pipe(
-            op.filter(lambda error: error.stream_id == stream_id),
+        application_error = self._connection.stream_observable_filter_type(stream_id, frames.ErrorFrame).pipe(
             op.map(_wrap_throw_error_frame),
         )
 
         def final_action():
             self._connection.free_stream_id(stream_id)
 
+        if cancel_on_dispose == True:
+            # Before the stream id is freed
+            cancel = executors.cancel_on_dispose(self._connection, stream_id)
+        else:
+            cancel = rx.pipe()
+
         return rx.pipe(
             op.materialize(),
             # Throws error on Application error for this stream
             op.merge(application_error),
             op.dematerialize(),
+            cancel,
             op.finally_action(
                 lambda: final_action()),
         )
 
+    @property
+    def rtt_stats(self) -> RttStats:
+        """
+            Round trip times of the connection measured with keepalives.
+        """
+        return self._connection.rtt_stats
+
+    @property
+    def send_batch_stats(self) -> SendBatchStats:
+        return self._connection.send_batch_stats
+
+    @property
+    def send_queue_depth(self) -> int:
+        return self._connection.send_queue_depth
+
     @property
     def on_request_response(self):
         return self._on_request_response
@@ -190,3 +404,16 @@ class RSocketClient(object):
             You can either return an Observable<bytes> which will be send as payload without metadata or Observable<(bytes, bytes)> which will be send as payload(metadata, data)
         """
         self._on_request_stream = callback
+
+    @property
+    def on_request_channel(self):
+        return self._on_request_channel
+
+    @on_request_channel.setter
+    def on_request_channel(self, callback: typing.Callable[[
+            frames.RequestChannel, rx.Observable], rx.Observable]):
+        """
+            The callback receives the RequestChannel frame and an Observable<bytes> of the data the requester sends after it.
+            Return values are handled like those of on_request_stream.
+        """
+        self._on_request_channel = callback
@@ -1,5 +1,4 @@
 from __future__ import annotations
-from time import sleep
 import rx
 import rx.core
 import rx.disposable
@@ -8,6 +7,7 @@ import rx.scheduler.scheduler
 import rx.operators as op
 from .common import RSocketConfig
 from .transport import AbstractTransport
+from .connection import ReconnectStrategy, ReconnectMetrics, ExponentialBackoffStrategy
 from . import RSocketClient
 import logging
 from .messages import RMessageClient
@@ -24,6 +24,9 @@ class RSocketClientFactory(object):
         self._scheduler = None
         self._auto_reconnect = False
         self._message_client = False
+        self._reconnect_strategy: ReconnectStrategy = None
+        self._standby_transport_factory: typing.Callable[[
+        ], AbstractTransport] = None
         self.log = logging.getLogger('rsockets2.RSocketClientFactory')
 
     def with_config(self, config: RSocketConfig) -> RSocketClientFactory:
@@ -47,6 +50,34 @@ class RSocketClientFactory(object):
         self._auto_reconnect = True
         return self
 
+    def with_reconnect_strategy(self, strategy: ReconnectStrategy) -> RSocketClientFactory:
+        """
+            Delays between the attempts to (re)connect of with_auto_reconnect. Defaults to the reconnect_strategy
+            of the config or an ExponentialBackoffStrategy.
+        """
+        self._reconnect_strategy = strategy
+        return self
+
+    def with_warm_standby(self, transport_factory: typing.Callable[[], AbstractTransport]) -> RSocketClientFactory:
+        """
+            Keeps a second, already set up connection next to the active one of with_auto_reconnect.
+            When the active connection is lost the standby is emitted at once and a new standby is
+            connected in the background. Every connection after the first uses a transport of transport_factory.
+        """
+        self._standby_transport_factory = transport_factory
+        return self
+
+    @property
+    def reconnect_metrics(self) -> ReconnectMetrics:
+        return self._get_reconnect_strategy().metrics
+
+    def _get_reconnect_strategy(self) -> ReconnectStrategy:
+        if self._reconnect_strategy == None:
+            self._reconnect_strategy = self._config.reconnect_strategy
+        if self._reconnect_strategy == None:
+            self._reconnect_strategy = ExponentialBackoffStrategy()
+        return self._reconnect_strategy
+
     def build(self) -> rx.Observable[RSocketClient]:
         if self._transport is None:
             raise ValueError("You must provide a viable transport!")
@@ -65,19 +96,20 @@ class RSocketClientFactory(object):
         self._message_client = True
         return self.build()
 
-    def _create_single_shot_client(self) -> typing.Union[RMessageClient, RSocketClient]:
+    def _create_single_shot_client(self, transport: AbstractTransport = None) -> typing.Union[RMessageClient, RSocketClient]:
+        if transport == None:
+            transport = self._transport
+
         def open():
             try:
                 client.open()
             except Exception as err:
-                self.log.warn(
-                    'Opening Connection failed... Delaying 5 seconds')
-                sleep(5.0)
+                self.log.warning('Opening Connection failed: {}'.format(err))
                 raise err
         if self._message_client == True:
             self.log.debug(
                 "Creating RMessageClient. Config: {}".format(self._config))
-            client = RMessageClient(self._transport,
+            client = RMessageClient(transport,
                                     self._config,
                                     self._scheduler)
             self.log.debug("RMessageClient created. Opening connection")
@@ -89,40 +121,148 @@ class RSocketClientFactory(object):
             self.log.debug(
                 "Creating RSocketClient. Config: {}".format(self._config))
             client = RSocketClient(
-                self._config, self._transport, self._scheduler)
+                self._config, transport, self._scheduler)
 
             open()
             return client
 
     def _create_auto_reconnecting_client(self) -> Observable[RSocketClient]:
+        strategy = self._get_reconnect_strategy()
+
         def observable(observer: rx.core.Observer, scheduler) -> rx.disposable.Disposable:
             self.log.debug(
                 "Creating RSocketFactory with support for automatic reconnecting. Config: {}".format(self._config))
+            pending = rx.disposable.SerialDisposable()
+            session = strategy.session()
+            disposed = False
+            first_transport = True
+            pending_standby = rx.disposable.SerialDisposable()
+            standby_session = None
+            standby = None
+            standby_lock = threading.Lock()
 
-            def flat_map_to_destroy_observer(client):
+            def destroy_observable(client):
                 if isinstance(client, RSocketClient):
                     return client._connection.destroy_observable()
                 elif isinstance(client, RMessageClient):
                     return client.rsocket._connection.destroy_observable()
 
-            def client_publisher(client):
+            def connect(scheduler=None, state=None):
+                if disposed == True:
+                    return
+                session.attempt_started()
+                try:
+                    client = self._create_single_shot_client(next_transport())
+                except Exception as error:
+                    session.attempt_finished(error)
+                    schedule_attempt(error)
+                    return
+                session.attempt_finished()
+                activate(client)
+                if self._standby_transport_factory != None:
+                    schedule_standby()
+
+            def next_transport() -> AbstractTransport:
+                nonlocal first_transport
+                if first_transport == True or self._standby_transport_factory == None:
+                    first_transport = False
+                    return self._transport
+                return self._standby_transport_factory()
+
+            def activate(client):
                 observer.on_next(client)
+                destroy_observable(client).subscribe(
+                    on_completed=lambda: connection_lost())
+
+            def connection_lost():
+                nonlocal session, standby
+                if disposed == True:
+                    return
+                with standby_lock:
+                    client = standby
+                    standby = None
+                if client != None:
+                    self.log.info("Connection lost. Failing over to standby")
+                    strategy.metrics.record_failover()
+                    activate(client)
+                    schedule_standby()
+                    return
+                self.log.debug("Connection lost. Reconnecting...")
+                session = strategy.session()
+                schedule_attempt(None)
+
+            def schedule_attempt(error: Exception):
+                delay = session.next_delay()
+                if delay == None:
+                    observer.on_error(error if error != None else ConnectionError(
+                        "Giving up reconnecting after {} attempts".format(session.attempt)))
+                    return
+                self.log.debug(
+                    "Trying to connect to rsocket server in {:.3f} seconds...".format(delay))
+                pending.disposable = self._scheduler.schedule_relative(
+                    delay, connect)
+
+            def connect_standby(scheduler=None, state=None):
+                nonlocal standby, standby_session
+                if disposed == True:
+                    return
+                standby_session.attempt_started()
+                try:
+                    client = self._create_single_shot_client(
+                        self._standby_transport_factory())
+                except Exception as error:
+                    standby_session.attempt_finished(error)
+                    self.log.debug(
+                        "Connecting standby failed: {}".format(error))
+                    schedule_standby()
+                    return
+                standby_session.attempt_finished()
+                standby_session = None
+                with standby_lock:
+                    accepted = disposed == False
+                    if accepted == True:
+                        standby = client
+                if accepted == False:
+                    client.close()
+                    return
+                self.log.debug("Standby connection ready")
+                destroy_observable(client).subscribe(
+                    on_completed=lambda: standby_lost(client))
+
+            def standby_lost(client):
+                nonlocal standby
+                with standby_lock:
+                    if standby is not client:
+                        return
+                    standby = None
+                if disposed == False:
+                    self.log.debug("Standby connection lost")
+                    schedule_standby()
+
+            def schedule_standby():
+                nonlocal standby_session
+                if standby_session == None:
+                    standby_session = strategy.session()
+                delay = standby_session.next_delay()
+                if delay == None:
+                    # The active connection keeps working, so only start over
+                    standby_session = None
+                    delay = strategy.max_elapsed
+                pending_standby.disposable = self._scheduler.schedule_relative(
+                    delay, connect_standby)
+
+            def dispose():
+                nonlocal disposed, standby
+                with standby_lock:
+                    disposed = True
+                    client = standby
+                    standby = None
+                pending.dispose()
+                pending_standby.dispose()
+                if client != None:
+                    client.close()
 
-            disposable = rx.from_callable(
-                lambda: self._create_single_shot_client(),
-                self._scheduler
-            ).pipe(
-                op.observe_on(scheduler=self._scheduler),
-                op.do_action(on_next=lambda client: client_publisher(client)),
-                op.flat_map(
-                    lambda client: flat_map_to_destroy_observer(client)),
-                op.do_action(on_completed=lambda: self.log.debug(
-                    "Trying to reconnect to rsocket server in 5 seconds...")),
-                op.delay(op.timedelta(seconds=5)),
-                op.repeat(),
-                op.retry()
-            ).subscribe()
-
-            return disposable
+            pending.disposable = self._scheduler.schedule(connect)
+            return rx.disposable.Disposable(dispose)
 
         return rx.create(observable).pipe(op.observe_on(self._scheduler))
@@ -0,0 +1,195 @@
+from .common import RSocketConfig
+from .connection import RttStats, SendBatchStats
+from .transport import AbstractTransport, Reactor, ReactorPool
+from .rsocket_client import RSocketClient
+import rx
+import rx.operators as op
+import rx.scheduler
+import logging
+import threading
+import typing
+
+
+class ShardedClient(object):
+    """
+        One logical requester over shards connections to the same endpoint, each with its own send queue and socket.
+        Requests with a key always use the shard hash(key) % shards, requests without one
+        the shard with the least outstanding requests.
+        Lost shards are reconnected together after reconnect_delay seconds. Meanwhile keyless requests use the
+        remaining shards and keyed requests for a lost shard fail with a ConnectionError.
+    """
+
+    def __init__(self,
+                 config: RSocketConfig,
+                 transport_factory: typing.Callable[[], AbstractTransport],
+                 shards: int = 4,
+                 default_scheduler: rx.scheduler.scheduler.Scheduler = rx.scheduler.ThreadPoolScheduler(
+                     20),
+                 reactor: typing.Union[Reactor, ReactorPool] = None,
+                 reconnect_delay: float = 5.0
+                 ):
+        super().__init__()
+        if shards < 1:
+            raise ValueError("ShardedClient requires at least one shard")
+        self._log = logging.getLogger("rsockets2.ShardedClient")
+        self._config = config
+        self._transport_factory = transport_factory
+        self._scheduler = default_scheduler
+        self._reactor = reactor
+        self._reconnect_delay = reconnect_delay
+        self._clients: typing.List[RSocketClient] = [None] * shards
+        self._outstanding = [0] * shards
+        self._lock = threading.Lock()
+        self._reconnecting = False
+        self._running = False
+
+    @property
+    def shards(self) -> int:
+        return len(self._clients)
+
+    @property
+    def connected_shards(self) -> int:
+        return sum(1 for client in self._clients if client != None)
+
+    @property
+    def outstanding(self) -> typing.List[int]:
+        return list(self._outstanding)
+
+    @property
+    def send_batch_stats(self) -> SendBatchStats:
+        stats = SendBatchStats()
+        for client in self._connected_clients():
+            stats.add(client.send_batch_stats)
+        return stats
+
+    @property
+    def send_queue_depth(self) -> int:
+        return sum(client.send_queue_depth for client in self._connected_clients())
+
+    @property
+    def rtt_stats(self) -> typing.List[RttStats]:
+        """
+            Round trip times per shard, None for disconnected shards.
+        """
+        return [client.rtt_stats if client != None else None for client in self._clients]
+
+    def open(self):
+        """
+            Connects all shards or none.
+        """
+        self._running = True
+        try:
+            for index in range(len(self._clients)):
+                self._connect(index)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        self._running = False
+        for index, client in enumerate(self._clients):
+            self._clients[index] = None
+            if client != None:
+                client.close()
+
+    def request_response(self, meta_data, data, key=None) -> rx.Observable:
+        return self._sharded(key, lambda client: client.request_response(meta_data, data))
+
+    def request_stream(self, meta_data, data, window: int = None, key=None) -> rx.Observable:
+        return self._sharded(key, lambda client: client.request_stream(meta_data, data, window))
+
+    def request_channel(self, meta_data, data, outbound: rx.Observable = None, window: int = None, key=None) -> rx.Observable:
+        return self._sharded(key, lambda client: client.request_channel(meta_data, data, outbound, window))
+
+    def fire_and_forget(self, meta_data, data, key=None) -> rx.Observable:
+        return self._sharded(key, lambda client: client.fire_and_forget(meta_data, data))
+
+    def metadata_push(self, meta_data) -> rx.Observable:
+        """
+            Sent on every connected shard.
+        """
+        return rx.defer(lambda x: rx.merge(*[client.metadata_push(meta_data) for client in self._connected_clients()]))
+
+    def _connected_clients(self) -> typing.List[RSocketClient]:
+        return [client for client in self._clients if client != None]
+
+    def _select(self, key) -> int:
+        if key != None:
+            index = hash(key) % len(self._clients)
+            if self._clients[index] == None:
+                raise ConnectionError(
+                    "Shard {} is not connected".format(index))
+            return index
+        selected = None
+        for index, client in enumerate(self._clients):
+            if client != None and (selected == None or self._outstanding[index] < self._outstanding[selected]):
+                selected = index
+        if selected == None:
+            raise ConnectionError("No shard connected")
+        return selected
+
+    def _sharded(self, key, request: typing.Callable[[RSocketClient], rx.Observable]) -> rx.Observable:
+        def finished(index: int):
+            with self._lock:
+                self._outstanding[index] -= 1
+
+        def handle():
+            with self._lock:
+                index = self._select(key)
+                # _connection_lost may clear the slot once the lock is released
+                client = self._clients[index]
+                self._outstanding[index] += 1
+            return request(client).pipe(
+                op.finally_action(lambda: finished(index)))
+        return rx.defer(lambda x: handle())
+
+    def _connect(self, index: int):
+        client = RSocketClient(self._config, self._transport_factory(),
+                               self._scheduler, reactor=self._reactor)
+        client.open()
+        self._clients[index] = client
+        client._connection.destroy_observable().subscribe(
+            on_completed=lambda: self._connection_lost(index, client))
+
+    def _connection_lost(self, index: int, client: RSocketClient):
+        with self._lock:
+            if self._clients[index] is not client or self._running == False:
+                return
+            self._clients[index] = None
+            self._log.warning("Shard {} lost its connection".format(index))
+            if self._reconnecting == True:
+                return
+            self._reconnecting = True
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self):
+        self._log.info("Reconnecting lost shards in {}s".format(
+            self._reconnect_delay))
+        self._scheduler.schedule_relative(
+            self._reconnect_delay, lambda scheduler, state: self._reconnect())
+
+    def _reconnect(self):
+        if self._running == False:
+            return
+        failed = 0
+        for index, client in enumerate(self._clients):
+            if client != None:
+                continue
+            try:
+                self._connect(index)
+            except Exception as error:
+                self._log.debug(
+                    "Reconnecting shard {} failed: {}".format(index, error))
+                failed += 1
+        if failed > 0:
+            self._schedule_reconnect()
+            return
+        with self._lock:
+            self._reconnecting = False
+        # A shard may have been lost while the others were reconnected
+        if self._running == True and self.connected_shards < len(self._clients):
+            with self._lock:
+                if self._reconnecting == True:
+                    return
+                self._reconnecting = True
+            self._schedule_reconnect()
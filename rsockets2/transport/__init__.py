@@ -1,3 +1,6 @@
 from .abstract_transport import AbstractTransport
+from .socket_transport import SocketTransport
 from .tcp_transport import TcpTransport
+from .unix_transport import UnixTransport
 from .websocket_transport import WebsocketTransport
+from .reactor import Reactor, ReactorPool
@@ -15,6 +15,13 @@ class AbstractTransport(ABC):
         self._send_lock = threading.Lock()
         self._parser = FrameParser()
 
+    def enable_zero_copy(self):
+        """
+            Decoded frames reference the received bytes through read only memoryviews instead of copies.
+            Transports that reuse receive buffers must hand out a separate buffer per frame from now on.
+        """
+        self._parser = FrameParser(zero_copy=True)
+
     @abstractmethod
     def connect(self):
         pass
@@ -31,6 +38,23 @@ class AbstractTransport(ABC):
     def _send_bytes(self, frameBytes: bytes):
         pass
 
+    def _send_bytes_batch(self, frames_bytes: typing.List[bytes]):
+        """
+            Transports that can write several frames at once should override this.
+        """
+        for frameBytes in frames_bytes:
+            self._send_bytes(frameBytes)
+
+    def _send_frames(self, frames: typing.List[Frame_ABC]):
+        """
+            Encodes and writes the frames. Transports that can write frames from their buffer
+            sequence (Frame_ABC.to_buffers) without copying them should override this.
+        """
+        if len(frames) == 1:
+            self._send_bytes(frames[0].to_bytes())
+        else:
+            self._send_bytes_batch([frame.to_bytes() for frame in frames])
+
     def send_frame(self, frame: Frame_ABC):
         """
             The method is not thread safe! It will block until the method is sent or an error is thrown.
@@ -40,10 +64,26 @@ class AbstractTransport(ABC):
         success = self._send_lock.acquire(blocking=False)
         if success == True:
             try:
-                data = frame.to_bytes()
                 self._log.debug("Sending Frame: Length '{}' [bytes]. Type: '{}'. StreamID: '{}'".format(
-                    len(data), frame.__class__.__name__, frame.stream_id))
-                self._send_bytes(data)
+                    len(frame), frame.__class__.__name__, frame.stream_id))
+                self._send_frames([frame])
+            finally:
+                self._send_lock.release()
+        else:
+            raise RuntimeError(
+                "The send_lock is already acquired. It is the application designers responsibility to make sure the send_frame method is thread safe!")
+
+    def send_frames(self, frames: typing.List[Frame_ABC]):
+        """
+            Same as send_frame but hands all frames to the transport in one call.
+            The same thread safety rules apply!
+        """
+        success = self._send_lock.acquire(blocking=False)
+        if success == True:
+            try:
+                self._log.debug("Sending {} Frames: Length '{}' [bytes].".format(
+                    len(frames), sum(len(frame) for frame in frames)))
+                self._send_frames(frames)
             finally:
                 self._send_lock.release()
         else:
@@ -51,7 +91,9 @@ class AbstractTransport(ABC):
                 "The send_lock is already acquired. It is the application designers responsibility to make sure the send_frame method is thread safe!")
 
     def recv_frame(self) -> Frame_ABC:
-        frame_bytes = self._recv_bytes()
+        return self.decode_frame(self._recv_bytes())
+
+    def decode_frame(self, frame_bytes) -> Frame_ABC:
         frame = self._parser.parseFrame(frame_bytes)
         self._log.debug("Received Frame: Length '{}' [bytes]. Type: '{}' StreamID: '{}'.".format(
             len(frame_bytes), frame.__class__.__name__, frame.stream_id))
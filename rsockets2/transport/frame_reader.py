@@ -0,0 +1,131 @@
+import socket
+import typing
+
+
+class FrameReader(object):
+    """
+        Reads 3 byte length prefixed frames from a stream socket.
+        Data is pulled in large chunks with recv_into into a reusable buffer, so a single
+        syscall usually yields several frames. Frames are handed out as memoryviews over
+        that buffer and are only valid until the next call to read_frame.
+        Frames larger than the buffer are received into a dedicated bytearray.
+
+        With owned_frames every frame gets a buffer of its own that is never reused, which is
+        required for zero copy decoding. Frames of at least direct_read_threshold bytes are then
+        received directly into that buffer.
+    """
+
+    def __init__(self, buffer_size: int = 64 * 1024, owned_frames: bool = False):
+        super().__init__()
+        self.owned_frames = owned_frames
+        self.direct_read_threshold = buffer_size // 4
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._read_idx = 0
+        self._write_idx = 0
+        self._large_frame: memoryview = None
+        self._large_frame_read = 0
+
+    def reset(self):
+        self._read_idx = 0
+        self._write_idx = 0
+        self._large_frame = None
+
+    def read_frame(self, sock: socket.socket) -> memoryview:
+        while True:
+            available = self._write_idx - self._read_idx
+            needed = 3
+            if available >= 3:
+                idx = self._read_idx
+                buffer = self._buffer
+                frame_length = buffer[idx] << 16 | buffer[idx + 1] << 8 | buffer[idx + 2]
+                needed += frame_length
+                if available >= needed:
+                    self._read_idx += needed
+                    if self.owned_frames == True:
+                        return memoryview(bytearray(self._view[(idx + 3):self._read_idx]))
+                    return self._view[(idx + 3):self._read_idx]
+                if needed > len(self._buffer) or (self.owned_frames == True and frame_length >= self.direct_read_threshold):
+                    return self._read_large_frame(sock, frame_length)
+            self._fill(sock, needed)
+
+    def _fill(self, sock: socket.socket, needed: int):
+        if self._read_idx == self._write_idx:
+            self.reset()
+        elif self._read_idx + needed > len(self._buffer):
+            # Move the incomplete frame to the front to make room for the rest of it
+            remaining = self._write_idx - self._read_idx
+            self._view[:remaining] = self._view[self._read_idx:self._write_idx]
+            self._read_idx = 0
+            self._write_idx = remaining
+        received = sock.recv_into(self._view[self._write_idx:])
+        if received == 0:
+            raise ConnectionError("Connection closed by peer")
+        self._write_idx += received
+
+    def _read_large_frame(self, sock: socket.socket, frame_length: int) -> memoryview:
+        frame = bytearray(frame_length)
+        frame_view = memoryview(frame)
+        data_read = self._write_idx - self._read_idx - 3
+        frame_view[:data_read] = self._view[(
+            self._read_idx + 3):self._write_idx]
+        self.reset()
+        while data_read < frame_length:
+            received = sock.recv_into(frame_view[data_read:])
+            if received == 0:
+                raise ConnectionError("Connection closed by peer")
+            data_read += received
+        return frame_view
+
+    def read_available(self, sock: socket.socket) -> typing.List[memoryview]:
+        """
+            For non blocking sockets. Receives once and returns the frames completed by that, possibly none.
+            Unless owned_frames they are only valid until the next call.
+        """
+        if self._large_frame is not None:
+            received = sock.recv_into(
+                self._large_frame[self._large_frame_read:])
+            if received == 0:
+                raise ConnectionError("Connection closed by peer")
+            self._large_frame_read += received
+            if self._large_frame_read < len(self._large_frame):
+                return []
+            frame = self._large_frame
+            self._large_frame = None
+            return [frame]
+
+        if self._read_idx == self._write_idx:
+            self._read_idx = 0
+            self._write_idx = 0
+        elif self._read_idx > 0:
+            remaining = self._write_idx - self._read_idx
+            self._view[:remaining] = self._view[self._read_idx:self._write_idx]
+            self._read_idx = 0
+            self._write_idx = remaining
+        received = sock.recv_into(self._view[self._write_idx:])
+        if received == 0:
+            raise ConnectionError("Connection closed by peer")
+        self._write_idx += received
+
+        frames = []
+        buffer = self._buffer
+        while self._write_idx - self._read_idx >= 3:
+            idx = self._read_idx
+            frame_length = buffer[idx] << 16 | buffer[idx + 1] << 8 | buffer[idx + 2]
+            available = self._write_idx - idx - 3
+            if available >= frame_length:
+                self._read_idx += 3 + frame_length
+                if self.owned_frames == True:
+                    frames.append(memoryview(bytearray(
+                        self._view[(idx + 3):self._read_idx])))
+                else:
+                    frames.append(self._view[(idx + 3):self._read_idx])
+            else:
+                if 3 + frame_length > len(buffer):
+                    self._large_frame = memoryview(bytearray(frame_length))
+                    self._large_frame[:available] = self._view[(
+                        idx + 3):self._write_idx]
+                    self._large_frame_read = available
+                    self._read_idx = self._write_idx
+                break
+        return frames
@@ -0,0 +1,90 @@
+import socket
+import typing
+from ..frames import Frame_ABC
+
+
+class FrameWriter(object):
+    """
+        Writes 3 byte length prefixed frames to a stream socket.
+        Length prefixes and frame bodies are passed to sendmsg as separate buffers, so frames
+        are neither concatenated nor sliced into copies on partial writes.
+        Several frames can be written with a single vectored write.
+
+        write_encoded_frames encodes frames with Frame_ABC.to_buffers. Length prefixes and frame headers
+        are written into a reusable header buffer, meta data and data are passed to the socket as they are.
+    """
+
+    max_buffers = getattr(socket, 'IOV_MAX', 1024)
+
+    def __init__(self, header_buffer_size: int = 16 * 1024):
+        super().__init__()
+        self._vectored = hasattr(socket.socket, 'sendmsg')
+        self._header_buffer = memoryview(bytearray(header_buffer_size))
+
+    def write_frame(self, sock: socket.socket, frame_bytes):
+        self.write_frames(sock, [frame_bytes])
+
+    def write_frames(self, sock: socket.socket, frames_bytes: typing.Sequence):
+        buffers = []
+        for frame_bytes in frames_bytes:
+            frame_length = len(frame_bytes)
+            if frame_length > 0xFFFFFF:
+                raise ValueError(
+                    "Frame of length {} exceeds the maximum frame length".format(frame_length))
+            buffers.append(frame_length.to_bytes(3, 'big'))
+            buffers.append(frame_bytes)
+        self._write_buffers(sock, buffers)
+
+    def write_encoded_frames(self, sock: socket.socket, frames: typing.Sequence[Frame_ABC]):
+        header_buffer = self._header_buffer
+        offset = 0
+        buffers = []
+        for frame in frames:
+            header_length = frame.header_length()
+            if offset + 3 + header_length > len(header_buffer):
+                if len(buffers) > 0:
+                    # Header buffer exhausted. Write what we have and start over
+                    self._write_buffers(sock, buffers)
+                    buffers = []
+                    offset = 0
+                if 3 + header_length > len(header_buffer):
+                    self.write_frame(sock, frame.to_bytes())
+                    continue
+            frame_buffers = frame.to_buffers(
+                header_buffer[(offset + 3):(offset + 3 + header_length)])
+            frame_length = sum(len(buffer) for buffer in frame_buffers)
+            if frame_length > 0xFFFFFF:
+                raise ValueError(
+                    "Frame of length {} exceeds the maximum frame length".format(frame_length))
+            header_buffer[offset] = frame_length >> 16 & 0xFF
+            header_buffer[offset + 1] = frame_length >> 8 & 0xFF
+            header_buffer[offset + 2] = frame_length & 0xFF
+            if header_length > 0:
+                buffers.append(
+                    header_buffer[offset:(offset + 3 + header_length)])
+                buffers.extend(frame_buffers[1:])
+            else:
+                buffers.append(header_buffer[offset:(offset + 3)])
+                buffers.extend(frame_buffers)
+            offset += 3 + header_length
+        if len(buffers) > 0:
+            self._write_buffers(sock, buffers)
+
+    def _write_buffers(self, sock: socket.socket, buffers: typing.List):
+        if self._vectored == False:
+            sock.sendall(b''.join(buffers))
+            return
+
+        views = [memoryview(buffer).cast('B') for buffer in buffers]
+        idx = 0
+        while idx < len(views):
+            sent = sock.sendmsg(views[idx:(idx + self.max_buffers)])
+            while sent > 0:
+                if sent >= len(views[idx]):
+                    sent -= len(views[idx])
+                    idx += 1
+                else:
+                    views[idx] = views[idx][sent:]
+                    sent = 0
+            while idx < len(views) and len(views[idx]) == 0:
+                idx += 1
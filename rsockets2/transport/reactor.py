@@ -0,0 +1,190 @@
+import heapq
+import itertools
+import logging
+import selectors
+import socket
+import threading
+import time
+import typing
+
+
+class ReactorTimer(object):
+
+    def __init__(self, deadline: float, sequence: int, callback: typing.Callable[[], None]):
+        super().__init__()
+        self.deadline = deadline
+        self.sequence = sequence
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def __lt__(self, other):
+        return (self.deadline, self.sequence) < (other.deadline, other.sequence)
+
+
+class Reactor(object):
+    """
+        Drives the sockets of many connections from a single thread with a selector.
+        Registered handlers must provide on_readable() and on_writable(), which are called on the reactor thread.
+        register, unregister, call_soon and call_later may be called from any thread,
+        set_writable only from the reactor thread. The thread starts with the first registration.
+    """
+
+    count = 0
+
+    def __init__(self):
+        super().__init__()
+        Reactor.count += 1
+        self._log = logging.getLogger("rsockets2.transport.Reactor")
+        self._name = "RSocket-Reactor-{}".format(Reactor.count)
+        self._selector = selectors.DefaultSelector()
+        self._waker_recv, self._waker_send = socket.socketpair()
+        self._waker_recv.setblocking(False)
+        self._waker_send.setblocking(False)
+        self._selector.register(
+            self._waker_recv, selectors.EVENT_READ, None)
+        self._lock = threading.Lock()
+        self._callbacks: typing.List[typing.Callable[[], None]] = []
+        self._woken = False
+        self._timers: typing.List[ReactorTimer] = []
+        self._sequence = itertools.count()
+        self._thread: threading.Thread = None
+        self._running = False
+
+    def assign(self) -> 'Reactor':
+        return self
+
+    def register(self, sock: socket.socket, handler):
+        sock.setblocking(False)
+        self._start()
+        self.call_soon(lambda: self._selector.register(
+            sock, selectors.EVENT_READ, handler))
+
+    def unregister(self, sock: socket.socket):
+        def unregister():
+            try:
+                self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+        self.call_soon(unregister)
+
+    def set_writable(self, sock: socket.socket, handler, writable: bool):
+        """
+            Whether on_writable of the handler is called when the socket can take more data.
+        """
+        events = selectors.EVENT_READ
+        if writable == True:
+            events |= selectors.EVENT_WRITE
+        try:
+            self._selector.modify(sock, events, handler)
+        except (KeyError, ValueError):
+            pass
+
+    def call_soon(self, callback: typing.Callable[[], None]):
+        with self._lock:
+            self._callbacks.append(callback)
+            wake = self._woken == False
+            self._woken = True
+        if wake == True and threading.current_thread() is not self._thread:
+            try:
+                self._waker_send.send(b'\0')
+            except BlockingIOError:
+                pass
+
+    def call_later(self, delay: float, callback: typing.Callable[[], None]) -> ReactorTimer:
+        timer = ReactorTimer(time.monotonic() + delay,
+                             next(self._sequence), callback)
+        self.call_soon(lambda: heapq.heappush(self._timers, timer))
+        return timer
+
+    def stop(self):
+        self._running = False
+        self.call_soon(lambda: None)
+
+    def _start(self):
+        with self._lock:
+            if self._thread != None:
+                return
+            self._running = True
+            self._thread = threading.Thread(
+                name=self._name, daemon=True, target=self._run)
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            try:
+                for key, events in self._selector.select(self._select_timeout()):
+                    handler = key.data
+                    if handler is None:
+                        self._drain_waker()
+                        continue
+                    if events & selectors.EVENT_READ:
+                        handler.on_readable()
+                    if events & selectors.EVENT_WRITE:
+                        handler.on_writable()
+                self._run_callbacks()
+                self._run_timers()
+            except Exception:
+                self._log.error(
+                    "Error in reactor loop", exc_info=True)
+        self._selector.close()
+        self._waker_recv.close()
+        self._waker_send.close()
+
+    def _select_timeout(self) -> typing.Optional[float]:
+        with self._lock:
+            if len(self._callbacks) > 0:
+                return 0
+        if len(self._timers) == 0:
+            return None
+        return max(0, self._timers[0].deadline - time.monotonic())
+
+    def _drain_waker(self):
+        try:
+            while len(self._waker_recv.recv(4096)) > 0:
+                pass
+        except BlockingIOError:
+            pass
+
+    def _run_callbacks(self):
+        with self._lock:
+            callbacks = self._callbacks
+            self._callbacks = []
+            self._woken = False
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                self._log.error(
+                    "Error in reactor callback", exc_info=True)
+
+    def _run_timers(self):
+        now = time.monotonic()
+        while len(self._timers) > 0 and self._timers[0].deadline <= now:
+            timer = heapq.heappop(self._timers)
+            if timer.cancelled == True:
+                continue
+            try:
+                timer.callback()
+            except Exception:
+                self._log.error("Error in reactor timer", exc_info=True)
+
+
+class ReactorPool(object):
+    """
+        Shards connections round robin over size reactors, each with its own thread.
+    """
+
+    def __init__(self, size: int = 1):
+        super().__init__()
+        self.reactors = [Reactor() for _ in range(size)]
+        self._next = itertools.count()
+
+    def assign(self) -> Reactor:
+        return self.reactors[next(self._next) % len(self.reactors)]
+
+    def stop(self):
+        for reactor in self.reactors:
+            reactor.stop()
@@ -0,0 +1,86 @@
+from .abstract_transport import AbstractTransport
+from .frame_reader import FrameReader
+from .frame_writer import FrameWriter
+from abc import abstractmethod
+import socket
+import typing
+from ..frames import Frame_ABC
+
+
+class SocketTransport(AbstractTransport):
+    """
+        Transport over a connected stream socket. Frames are read through a buffered FrameReader
+        and written with the vectored FrameWriter. Subclasses create and connect the socket.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._socket: socket.socket = None
+        self._frame_reader = FrameReader()
+        self._frame_writer = FrameWriter()
+
+    def enable_zero_copy(self):
+        super().enable_zero_copy()
+        self._frame_reader.owned_frames = True
+
+    @abstractmethod
+    def _open_socket(self) -> socket.socket:
+        """
+            Returns a new socket connected to the peer.
+        """
+        pass
+
+    @abstractmethod
+    def _describe_address(self) -> str:
+        pass
+
+    def connect(self):
+        self._log.debug("Connecting to {}".format(self._describe_address()))
+        try:
+            self._socket = self._open_socket()
+            self._frame_reader.reset()
+        except OSError as error:
+            # wrap os error into connection error
+            raise ConnectionError(error)
+
+    def disconnect(self):
+        self._log.debug("Disconnecting socket at: {}".format(
+            self._describe_address()))
+        if self._socket == None:
+            raise ValueError(
+                "Tried to disconnect a socket that was never created!")
+        self._socket.close()
+
+    def _send_bytes(self, frameBytes):
+        if self._socket == None:
+            raise ValueError(
+                "Tried to send on a socket that was never created!")
+        self._frame_writer.write_frame(self._socket, frameBytes)
+
+    def _send_bytes_batch(self, frames_bytes):
+        if self._socket == None:
+            raise ValueError(
+                "Tried to send on a socket that was never created!")
+        self._frame_writer.write_frames(self._socket, frames_bytes)
+
+    def _send_frames(self, frames):
+        if self._socket == None:
+            raise ValueError(
+                "Tried to send on a socket that was never created!")
+        self._frame_writer.write_encoded_frames(self._socket, frames)
+
+    def _recv_bytes(self):
+        if self._socket == None:
+            raise ValueError(
+                "Tried to receive on a socket that was never created!")
+        return self._frame_reader.read_frame(self._socket)
+
+    @property
+    def socket(self) -> socket.socket:
+        return self._socket
+
+    def recv_available_frames(self) -> typing.List[Frame_ABC]:
+        """
+            For non blocking sockets (see Reactor). Receives once and decodes the frames completed by that.
+        """
+        return [self.decode_frame(frame_bytes) for frame_bytes in self._frame_reader.read_available(self._socket)]
@@ -0,0 +1,34 @@
+from .socket_transport import SocketTransport
+import logging
+import socket
+
+
+class UnixTransport(SocketTransport):
+    """
+        Transport over an AF_UNIX stream socket for peers on the same host. Paths starting with a
+        null byte address the Linux abstract namespace.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError(
+                "Unix domain sockets are not supported on this platform")
+
+        self._log = logging.getLogger("rsockets2.transport.UnixTransport")
+
+        self._path = path
+
+    def _open_socket(self) -> socket.socket:
+        unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            unix_socket.settimeout(10.0)
+            unix_socket.connect(self._path)
+            unix_socket.settimeout(None)
+        except OSError:
+            unix_socket.close()
+            raise
+        return unix_socket
+
+    def _describe_address(self) -> str:
+        return "unix:{}".format(self._path)
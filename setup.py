@@ -16,10 +16,16 @@ setup(
     # download_url = 'https://github.com/user/reponame/archive/v_01.tar.gz',    # I explain this later on
     # Keywords that define your package best
     keywords=['RSockets', 'Client', 'ReactiveX'],
+    # memoryview.toreadonly (zero copy frames) requires 3.8
+    python_requires='>=3.8',
     install_requires=[            # I get to this in a second
         'rx',
         'websocket_client',
     ],
+    extras_require={
+        # rsockets2.aio.AsyncWebsocketTransport
+        'aio-websocket': ['websockets'],
+    },
     classifiers=[
         # Chose either "3 - Alpha", "4 - Beta" or "5 - Production/Stable" as the current state of your package
         'Development Status :: 3 - Alpha',
@@ -28,8 +34,6 @@ setup(
         'Topic :: Software Development :: Build Tools',
         'License :: OSI Approved :: Apache Software License',   # Again, pick a license
         # Specify which pyhton versions that you want to support
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9'
     ],
@@ -0,0 +1,41 @@
+import time
+from rsockets2.connection import StreamIdAllocator
+
+"""
+    Measures the cost of allocating and freeing a stream id depending on the number of live streams.
+    The time per operation should stay flat while the number of live streams grows.
+"""
+
+OPERATIONS = 100000
+
+
+def measure(live_streams: int) -> float:
+    allocator = StreamIdAllocator()
+    for _ in range(live_streams):
+        allocator.allocate()
+
+    start = time.perf_counter()
+    for _ in range(OPERATIONS):
+        allocator.free(allocator.allocate())
+    return (time.perf_counter() - start) / OPERATIONS
+
+
+def measure_wrap_around(live_streams: int) -> float:
+    allocator = StreamIdAllocator()
+    # Keep the lowest ids alive and move the cursor right before the wrap around
+    for _ in range(live_streams):
+        allocator.allocate()
+    allocator._last_stream_id = StreamIdAllocator.max_stream_id
+
+    start = time.perf_counter()
+    for _ in range(OPERATIONS):
+        allocator.free(allocator.allocate())
+    return (time.perf_counter() - start) / OPERATIONS
+
+
+if __name__ == "__main__":
+    for live_streams in [0, 1000, 10000, 100000, 1000000]:
+        print("Live Streams: {:>8} --- {:.3f}us per allocate/free".format(
+            live_streams, measure(live_streams) * 1e6))
+    print("Live Streams: {:>8} --- {:.3f}us per allocate/free after wrap around".format(
+        10000, measure_wrap_around(10000) * 1e6))
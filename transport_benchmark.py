@@ -0,0 +1,125 @@
+import os
+import socket
+import tempfile
+import threading
+import time
+from rsockets2.frames import Payload
+from rsockets2.transport import TcpTransport, UnixTransport
+
+"""
+    Compares UnixTransport with TcpTransport over loopback. A plain socket server echoes every byte back,
+    so only the transports' frame reading and writing and the kernel socket path are measured.
+    Round trips measure the latency per frame, bursts the throughput of batched sends.
+"""
+
+ROUND_TRIPS = 5000
+BURST_FRAMES = 64
+BURSTS = 200
+# Large frames are sent less often so every size moves roughly the same amount of data
+MAX_BYTES_PER_RUN = 256 * 1024 * 1024
+
+
+def read_exactly(connection: socket.socket, length: int) -> bytearray:
+    data = bytearray()
+    while len(data) < length:
+        chunk = connection.recv(length - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed")
+        data += chunk
+    return data
+
+
+def echo(connection: socket.socket):
+    # Echo whole frames only. Echoing while the client still writes a large frame
+    # deadlocks once both directions fill the small unix socket buffers.
+    try:
+        while True:
+            header = read_exactly(connection, 3)
+            frame = read_exactly(connection, int.from_bytes(header, 'big'))
+            connection.sendall(header + frame)
+    except OSError:
+        pass
+    finally:
+        connection.close()
+
+
+def start_echo_server(server: socket.socket):
+    server.listen(1)
+
+    def accept():
+        connection, _ = server.accept()
+        echo(connection)
+    threading.Thread(target=accept, daemon=True).start()
+
+
+def create_payload(stream_id: int, size: int) -> Payload:
+    frame = Payload()
+    frame.stream_id = stream_id
+    frame.next_present = True
+    frame.payload = b'x' * size
+    return frame
+
+
+def measure_round_trips(transport, size: int) -> float:
+    frame = create_payload(1, size)
+    round_trips = max(10, min(ROUND_TRIPS, MAX_BYTES_PER_RUN // size))
+    start = time.perf_counter()
+    for _ in range(round_trips):
+        transport.send_frame(frame)
+        transport.recv_frame()
+    return (time.perf_counter() - start) / round_trips
+
+
+def measure_bursts(transport, size: int) -> float:
+    frames = [create_payload(stream_id * 2 + 1, size)
+              for stream_id in range(BURST_FRAMES)]
+    bursts = max(2, min(BURSTS, MAX_BYTES_PER_RUN // (size * BURST_FRAMES)))
+
+    received = threading.Event()
+
+    def receive():
+        for _ in range(BURST_FRAMES * bursts):
+            transport.recv_frame()
+        received.set()
+    threading.Thread(target=receive, daemon=True).start()
+    start = time.perf_counter()
+    for _ in range(bursts):
+        transport.send_frames(frames)
+    received.wait()
+    return BURST_FRAMES * bursts * size / (time.perf_counter() - start)
+
+
+def tcp_transport() -> TcpTransport:
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    start_echo_server(server)
+    return TcpTransport('127.0.0.1', server.getsockname()[1])
+
+
+def unix_transport(directory: str) -> UnixTransport:
+    path = os.path.join(directory, "rsocket-benchmark.sock")
+    if os.path.exists(path):
+        os.remove(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    start_echo_server(server)
+    return UnixTransport(path)
+
+
+def run(name: str, create_transport, size: int):
+    transport = create_transport()
+    transport.connect()
+    try:
+        latency = measure_round_trips(transport, size)
+        throughput = measure_bursts(transport, size)
+    finally:
+        transport.disconnect()
+    print("{:<5} {:>8} bytes --- {:8.2f}us per round trip --- {:9.1f} MB/s in bursts".format(
+        name, size, latency * 1e6, throughput / 1e6))
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        for size in [64, 1024, 64 * 1024, 1024 * 1024]:
+            run("tcp", tcp_transport, size)
+            run("unix", lambda: unix_transport(directory), size)